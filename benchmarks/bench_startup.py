@@ -0,0 +1,61 @@
+"""Measure cold-start cost of tool registration, eager vs. lazy (manifest).
+
+Each sample runs in a fresh interpreter and times importing the server's tool
+hub, registering every group and listing tools, which is the work done before
+the stdio handshake can complete.
+
+Usage: python benchmarks/bench_startup.py [runs]
+Requires a manifest; build it first with ``python -m tools.manifest``.
+"""
+
+import sys
+import json
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SAMPLE = """
+import asyncio, json, time
+t0 = time.perf_counter()
+from mcp.server.fastmcp import FastMCP
+from tools import register_all_tools
+t1 = time.perf_counter()
+mcp = FastMCP("bench")
+register_all_tools(mcp, lazy={lazy})
+t2 = time.perf_counter()
+tools = asyncio.run(mcp.list_tools())
+t3 = time.perf_counter()
+print(json.dumps({{"import": t1 - t0, "register": t2 - t1, "list": t3 - t2, "tools": len(tools)}}))
+"""
+
+
+def sample(lazy: bool) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", SAMPLE.format(lazy=lazy)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    if not (ROOT / "tools" / "tool_manifest.json").exists():
+        sys.exit("No tool manifest found; run `python -m tools.manifest` first.")
+
+    print(f"{'mode':<6} {'tools':>5} {'import ms':>10} {'register ms':>12} {'list ms':>8} {'total ms':>9}")
+    for lazy in (False, True):
+        samples = [sample(lazy) for _ in range(runs)]
+        med = {k: statistics.median(s[k] for s in samples) * 1000 for k in ("import", "register", "list")}
+        print(
+            f"{'lazy' if lazy else 'eager':<6} {samples[0]['tools']:>5} {med['import']:>10.1f} "
+            f"{med['register']:>12.1f} {med['list']:>8.1f} {sum(med.values()):>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 
 from mcp.server.fastmcp import FastMCP
 from tools import register_all_tools, register_selected_tools
+from tools.utils import server_lifespan
 
 # Load environment variables from a local .env if present (dev convenience)
 load_dotenv()
@@ -16,7 +17,7 @@ logging.basicConfig(
 )
 
 # Initialize FastMCP server (stdio by default)
-mcp = FastMCP("servicetitan-mcp")
+mcp = FastMCP("servicetitan-mcp", lifespan=server_lifespan)
 
 # Register tools: allow selective enablement via env vars
 include_groups = os.environ.get("SERVICETITAN_MCP_INCLUDE_GROUPS")
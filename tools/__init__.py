@@ -1,91 +1,109 @@
+import os
+import logging
+from importlib import import_module
+from pathlib import Path
 from typing import Any, Callable, Dict, List
 
-from .accounting import register_accounting_tools
-from .crm import register_crm_tools
-from .customerinteractions import register_customer_interactions_tools
-from .dispatch import register_dispatch_tools
-from .equipmentsystems import register_equipmentsystems_tools
-from .inventory import register_inventory_tools
-from .jobbooking import register_jobbooking_tools
-from .forms import register_forms_tools
-from .jobplanningandmanagement import register_jobplanningandmanagement_tools
-from .marketing import register_marketing_tools
-from .marketingads import register_marketingads_tools
-from .marketingreputation import register_marketingreputation_tools
-from .reporting import register_reporting_tools
-from .salesandestimates import register_salesandestimates_tools
-from .schedulingpro import register_schedulingpro_tools
-from .memberships import register_memberships_tools
-from .payroll import register_payroll_tools
-from .pricebook import register_pricebook_tools
-from .settings import register_settings_tools
-from .serviceagreements import register_serviceagreements_tools
-from .taskmanagement import register_taskmanagement_tools
-from .timesheets import register_timesheets_tools
-from .telecom import register_telecom_tools
-
-__all__ = ["register_all_tools", "register_selected_tools", "TOOL_REGISTRARS"]
-
-
-def register_all_tools(mcp: Any) -> None:
-    """Register all tool groups (accounting, crm, etc.)."""
-    register_accounting_tools(mcp)
-    register_crm_tools(mcp)
-    register_customer_interactions_tools(mcp)
-    register_dispatch_tools(mcp)
-    register_equipmentsystems_tools(mcp)
-    register_inventory_tools(mcp)
-    register_forms_tools(mcp)
-    register_jobbooking_tools(mcp)
-    register_jobplanningandmanagement_tools(mcp)
-    register_marketing_tools(mcp)
-    register_marketingads_tools(mcp)
-    register_marketingreputation_tools(mcp)
-    register_memberships_tools(mcp)
-    register_payroll_tools(mcp)
-    register_pricebook_tools(mcp)
-    register_settings_tools(mcp)
-    register_reporting_tools(mcp)
-    register_salesandestimates_tools(mcp)
-    register_schedulingpro_tools(mcp)
-    register_serviceagreements_tools(mcp)
-    register_taskmanagement_tools(mcp)
-    register_timesheets_tools(mcp)
-    register_telecom_tools(mcp)
+__all__ = ["register_all_tools", "register_selected_tools", "TOOL_REGISTRARS", "TOOL_GROUPS", "tool_group_sources"]
+
+LOGGER = logging.getLogger(__name__)
+
+# Mapping of group name -> (subpackage, registrar). Subpackages are imported on demand
+# so lazily registered groups cost nothing until one of their tools is called.
+TOOL_GROUPS: Dict[str, tuple[str, str]] = {
+    "accounting": (".accounting", "register_accounting_tools"),
+    "crm": (".crm", "register_crm_tools"),
+    "customerinteractions": (".customerinteractions", "register_customer_interactions_tools"),
+    "dispatch": (".dispatch", "register_dispatch_tools"),
+    "equipmentsystems": (".equipmentsystems", "register_equipmentsystems_tools"),
+    "inventory": (".inventory", "register_inventory_tools"),
+    "forms": (".forms", "register_forms_tools"),
+    "jobbooking": (".jobbooking", "register_jobbooking_tools"),
+    "jobplanningandmanagement": (".jobplanningandmanagement", "register_jobplanningandmanagement_tools"),
+    "marketing": (".marketing", "register_marketing_tools"),
+    "marketingads": (".marketingads", "register_marketingads_tools"),
+    "marketingreputation": (".marketingreputation", "register_marketingreputation_tools"),
+    "memberships": (".memberships", "register_memberships_tools"),
+    "payroll": (".payroll", "register_payroll_tools"),
+    "pricebook": (".pricebook", "register_pricebook_tools"),
+    "settings": (".settings", "register_settings_tools"),
+    "reporting": (".reporting", "register_reporting_tools"),
+    "salesandestimates": (".salesandestimates", "register_salesandestimates_tools"),
+    "schedulingpro": (".schedulingpro", "register_schedulingpro_tools"),
+    "serviceagreements": (".serviceagreements", "register_serviceagreements_tools"),
+    "taskmanagement": (".taskmanagement", "register_taskmanagement_tools"),
+    "timesheets": (".timesheets", "register_timesheets_tools"),
+    "telecom": (".telecom", "register_telecom_tools"),
+    "mirror": (".mirror", "register_mirror_tools"),
+    "diagnostics": (".diagnostics", "register_diagnostics_tools"),
+}
+
+
+def _registrar(module: str, attr: str) -> Callable[[Any], None]:
+    def register(mcp: Any) -> None:
+        getattr(import_module(module, __name__), attr)(mcp)
+
+    register.__name__ = attr
+    return register
 
 
 # Mapping of group name -> registrar for selective enabling
 TOOL_REGISTRARS: Dict[str, Callable[[Any], None]] = {
-    "accounting": register_accounting_tools,
-    "crm": register_crm_tools,
-    "customerinteractions": register_customer_interactions_tools,
-    "dispatch": register_dispatch_tools,
-    "equipmentsystems": register_equipmentsystems_tools,
-    "inventory": register_inventory_tools,
-    "forms": register_forms_tools,
-    "jobbooking": register_jobbooking_tools,
-    "jobplanningandmanagement": register_jobplanningandmanagement_tools,
-    "marketing": register_marketing_tools,
-    "marketingads": register_marketingads_tools,
-    "marketingreputation": register_marketingreputation_tools,
-    "memberships": register_memberships_tools,
-    "payroll": register_payroll_tools,
-    "pricebook": register_pricebook_tools,
-    "settings": register_settings_tools,
-    "reporting": register_reporting_tools,
-    "salesandestimates": register_salesandestimates_tools,
-    "schedulingpro": register_schedulingpro_tools,
-    "serviceagreements": register_serviceagreements_tools,
-    "taskmanagement": register_taskmanagement_tools,
-    "timesheets": register_timesheets_tools,
-    "telecom": register_telecom_tools,
+    group: _registrar(module, attr) for group, (module, attr) in TOOL_GROUPS.items()
 }
 
 
+def _lazy_enabled(lazy: bool | None) -> bool:
+    if lazy is not None:
+        return lazy
+    return os.environ.get("SERVICETITAN_MCP_LAZY_TOOLS", "true").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def tool_group_sources(groups: List[str] | None = None) -> Dict[str, tuple[Path, Callable[[Any], None]]]:
+    """Map groups to (package directory, registrar) for the tool manifest."""
+    root = Path(__file__).parent
+    return {
+        group: (root / TOOL_GROUPS[group][0].lstrip("."), TOOL_REGISTRARS[group])
+        for group in (groups if groups is not None else list(TOOL_GROUPS))
+    }
+
+
+def _resume_report_snapshots() -> None:
+    import_module(".reporting.materialize", __name__).MATERIALIZER.start()
+
+
+def _register_groups(mcp: Any, groups: List[str], lazy: bool | None) -> None:
+    from .resources import register_resources
+    from .utils import on_startup
+
+    register_resources(mcp)
+    if "reporting" in groups:
+        # Materialized reports refresh in the background even before a reporting tool is called.
+        on_startup(_resume_report_snapshots)
+    if not _lazy_enabled(lazy):
+        for group in groups:
+            TOOL_REGISTRARS[group](mcp)
+        return
+
+    from .manifest import register_groups
+
+    register_groups(mcp, tool_group_sources(groups))
+
+
+def register_all_tools(mcp: Any, lazy: bool | None = None) -> None:
+    """Register all tool groups (accounting, crm, etc.).
+
+    Unless ``lazy`` is False, groups whose sources match the tool manifest (see
+    ``tools.manifest``) are advertised from it and imported on first use.
+    """
+    _register_groups(mcp, list(TOOL_REGISTRARS), lazy)
+
+
 def register_selected_tools(
     mcp: Any,
     include_groups: List[str] | None = None,
     exclude_groups: List[str] | None = None,
+    lazy: bool | None = None,
 ) -> List[str]:
     """Register only selected tool groups.
 
@@ -93,6 +111,7 @@ def register_selected_tools(
         mcp: FastMCP instance
         include_groups: explicit list of groups to include (lower/any case)
         exclude_groups: groups to exclude (applied after include)
+        lazy: use the tool manifest when available (default: SERVICETITAN_MCP_LAZY_TOOLS, on)
 
     Returns:
         List of group names that were registered
@@ -109,8 +128,6 @@ def register_selected_tools(
     # apply excludes
     chosen = [g for g in chosen if g not in exclude_set]
 
-    for group in chosen:
-        TOOL_REGISTRARS[group](mcp)
+    _register_groups(mcp, chosen, lazy)
 
     return chosen
-
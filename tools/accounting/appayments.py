@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post
+from ..utils import get_base_url, make_st_request, make_st_post, fetch_all_pages, format_response
 
 __all__ = ["register_appayments_tools"]
 
@@ -19,12 +18,19 @@ def register_appayments_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of AP payments.
 
         Args mirror the ServiceTitan API query parameters. `ids` should be a comma-separated
         list of IDs (max 50) if provided.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -50,14 +56,14 @@ def register_appayments_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch AP payments list."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def ap_payments_mark_as_exported(
@@ -96,9 +102,6 @@ def register_appayments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to mark AP payments as exported."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, drain_export, format_response
 
 __all__ = ["register_export_tools"]
 
@@ -12,9 +11,19 @@ def register_export_tools(mcp: Any) -> None:
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Export inventory bills from ServiceTitan Accounting API."""
+        """Export inventory bills from ServiceTitan Accounting API.
+
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/export/inventory-bills"
@@ -25,23 +34,33 @@ def register_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for inventory bills."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def export_invoice_items(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Export invoice items from ServiceTitan Accounting API."""
+        """Export invoice items from ServiceTitan Accounting API.
+
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/export/invoice-items"
@@ -52,23 +71,33 @@ def register_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for invoice items."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def export_invoices(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Export invoices from ServiceTitan Accounting API."""
+        """Export invoices from ServiceTitan Accounting API.
+
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/export/invoices"
@@ -79,23 +108,33 @@ def register_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for invoices."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def export_payments(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Export payments from ServiceTitan Accounting API."""
+        """Export payments from ServiceTitan Accounting API.
+
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/export/payments"
@@ -106,13 +145,13 @@ def register_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for payments."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
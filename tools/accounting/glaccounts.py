@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_glaccounts_tools"]
 
@@ -28,9 +34,18 @@ def register_glaccounts_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Retrieve GL accounts with filters and pagination."""
+        """Retrieve GL accounts with filters and pagination.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/gl-accounts"
@@ -73,14 +88,14 @@ def register_glaccounts_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch GL accounts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def gl_accounts_create_account(
@@ -113,10 +128,7 @@ def register_glaccounts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create GL account."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def gl_account_types_get_list(
@@ -132,9 +144,18 @@ def register_glaccounts_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Retrieve GL account types with filters and pagination."""
+        """Retrieve GL account types with filters and pagination.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/gl-accounts/types"
@@ -163,14 +184,14 @@ def register_glaccounts_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch GL account types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def gl_accounts_update_account(
@@ -207,10 +228,7 @@ def register_glaccounts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update GL account."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def gl_accounts_get_account(
@@ -227,10 +245,7 @@ def register_glaccounts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch GL account."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
 
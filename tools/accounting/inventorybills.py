@@ -1,7 +1,7 @@
 import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post
+from ..utils import get_base_url, make_st_request, make_st_post, fetch_all_pages, format_response
 
 __all__ = ["register_inventory_bills_tools"]
 
@@ -33,9 +33,18 @@ def register_inventory_bills_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a filtered list of inventory bills."""
+        """Get a filtered list of inventory bills.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/inventory-bills"
@@ -88,14 +97,14 @@ def register_inventory_bills_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch inventory bills."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_bills_get_custom_field_types(
@@ -108,9 +117,18 @@ def register_inventory_bills_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get inventory bill custom field types."""
+        """Get inventory bill custom field types.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/inventory-bills/custom-fields"
@@ -133,14 +151,14 @@ def register_inventory_bills_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch inventory bill custom field types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_bills_update_custom_fields(
@@ -164,10 +182,7 @@ def register_inventory_bills_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update inventory bill custom fields."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_bills_mark_as_exported(
@@ -189,10 +204,7 @@ def register_inventory_bills_tools(mcp: Any) -> None:
         if not data:
             return "Unable to mark inventory bills as exported."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_bills_get_list_paginated(
@@ -220,9 +232,18 @@ def register_inventory_bills_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a filtered, paginated list of inventory bills."""
+        """Get a filtered, paginated list of inventory bills.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/inventory-bills/paginated"
@@ -275,13 +296,13 @@ def register_inventory_bills_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch paginated inventory bills."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
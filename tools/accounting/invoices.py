@@ -1,7 +1,18 @@
 import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch, make_st_delete
+from ..mirror.store import MirrorError, query_mirror
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    make_st_delete,
+    fetch_all_pages,
+    fetch_many_by_ids,
+    parse_id_list,
+    format_response,
+)
 
 __all__ = ["register_invoices_tools"]
 
@@ -42,9 +53,24 @@ def register_invoices_tools(mcp: Any) -> None:
         review_statuses: Optional[Sequence[str]] = None,
         assigned_to_ids: Optional[Sequence[int]] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        source: str = "api",
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Retrieve a paginated list of invoices with rich filters."""
+        """Retrieve a paginated list of invoices with rich filters.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        source="mirror" answers from the local mirror (see mirror_sync) instead of the API.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
+
+        source = (source or "api").strip().lower()
+        if source not in {"api", "mirror"}:
+            return "'source' must be 'api' or 'mirror'."
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/invoices"
@@ -115,14 +141,48 @@ def register_invoices_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if source == "mirror":
+            try:
+                data = await query_mirror(tenant, "invoices", environment, params)
+            except MirrorError as exc:
+                return str(exc)
+        elif all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
+        if not data:
+            return "Unable to fetch invoices."
+
+        return format_response(data, compact=compact, fields=fields)
+
+    @mcp.tool()
+    async def invoices_get_many(
+        tenant: int,
+        ids: str,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
+        environment: str = "production",
+    ) -> str:
+        """Get many invoices by ID in a few batched requests.
+
+        Built on Invoices_GetList (ids filter). 'ids' is a comma-separated list; hundreds are fine.
+        Results are keyed by id; ids the API did not return are listed under 'missing'.
+        Set compact=True for minified JSON output.
+        Pass fields="id,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
+
+        id_list = parse_id_list(ids)
+        if id_list is None:
+            return "'ids' must be a comma-separated list of integer IDs."
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/accounting/v2/tenant/{tenant}/invoices"
+
+        data = await fetch_many_by_ids(url, id_list)
         if not data:
             return "Unable to fetch invoices."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def invoices_mark_as_exported(
@@ -158,10 +218,7 @@ def register_invoices_tools(mcp: Any) -> None:
         if not data:
             return "Unable to mark invoices as exported."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def invoices_update_invoice(
@@ -228,10 +285,7 @@ def register_invoices_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update invoice."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def invoices_create_adjustment_invoice(
@@ -292,10 +346,7 @@ def register_invoices_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create adjustment invoice."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def invoices_update_custom_fields(
@@ -314,10 +365,7 @@ def register_invoices_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update invoice custom fields."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def invoices_get_custom_field_types(
@@ -330,9 +378,18 @@ def register_invoices_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get invoice custom field types (paginated)."""
+        """Get invoice custom field types (paginated).
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/invoices/custom-fields"
@@ -355,14 +412,14 @@ def register_invoices_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch invoice custom field types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def invoices_update_invoice_items(
@@ -388,10 +445,7 @@ def register_invoices_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update invoice items."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def invoices_delete_invoice_item(
@@ -409,9 +463,6 @@ def register_invoices_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete invoice item."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
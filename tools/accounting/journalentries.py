@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_patch
+from ..utils import get_base_url, make_st_request, make_st_patch, fetch_all_pages, format_response
 
 __all__ = ["register_journal_entries_tools"]
 
@@ -40,9 +39,18 @@ def register_journal_entries_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         page: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a filtered, paginated list of journal entries."""
+        """Get a filtered, paginated list of journal entries.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/journal-entries"
@@ -110,14 +118,14 @@ def register_journal_entries_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch journal entries."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def journal_entries_update(
@@ -142,10 +150,7 @@ def register_journal_entries_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update journal entry."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def journal_entries_get_details(
@@ -154,9 +159,18 @@ def register_journal_entries_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         page: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get journal entry details aggregated by dimensions (paginated)."""
+        """Get journal entry details aggregated by dimensions (paginated).
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/journal-entries/{id}/details"
@@ -169,14 +183,14 @@ def register_journal_entries_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch journal entry details."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def journal_entries_get_summary(
@@ -185,9 +199,18 @@ def register_journal_entries_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         page: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get journal entry summary aggregated by account and business unit (paginated)."""
+        """Get journal entry summary aggregated by account and business unit (paginated).
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/journal-entries/{id}/summary"
@@ -200,14 +223,14 @@ def register_journal_entries_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch journal entry summary."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def journal_entries_sync_update(
@@ -236,9 +259,6 @@ def register_journal_entries_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update journal entry sync status."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,14 @@
 import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_payments_tools"]
 
@@ -33,9 +40,18 @@ def register_payments_tools(mcp: Any) -> None:
         created_before: Optional[str] = None,
         created_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of payments with filters."""
+        """Get a paginated list of payments with filters.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/payments"
@@ -88,14 +104,14 @@ def register_payments_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch payments."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payments_update_custom_fields(
@@ -113,10 +129,7 @@ def register_payments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update payment custom fields."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def payments_get_custom_field_types(
@@ -129,9 +142,18 @@ def register_payments_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get payment custom field types (paginated)."""
+        """Get payment custom field types (paginated).
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/payments/custom-fields"
@@ -154,14 +176,14 @@ def register_payments_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch payment custom field types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payments_update_status(
@@ -183,10 +205,7 @@ def register_payments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update payment status."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def payments_update(
@@ -231,9 +250,6 @@ def register_payments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update payment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
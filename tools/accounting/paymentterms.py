@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_payment_terms_tools"]
 
@@ -19,9 +18,18 @@ def register_payment_terms_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of payment terms."""
+        """Get a paginated list of payment terms.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/accounting/v2/tenant/{tenant}/payment-terms"
@@ -46,14 +54,14 @@ def register_payment_terms_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch payment terms."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payment_terms_get_payment_term_model(
@@ -70,9 +78,6 @@ def register_payment_terms_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch payment term."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -0,0 +1,164 @@
+"""Persistent cache of immutable blobs: call recordings, voicemails, job attachments.
+
+Maps (environment, tenant, kind, id) to a file in the content-addressed spool (see
+``download_to_spool``), so revisiting a call or attachment never re-downloads it.
+Metadata lives in ``<state dir>/blobs/index.json``; the spool is kept under
+``SERVICETITAN_MCP_BLOB_CACHE_MAX_BYTES`` by evicting least recently used entries.
+Ranged reads seek to the requested offset, so they only read the bytes they return.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from typing import Any, Optional
+
+from . import metrics
+from .utils import (
+    SPOOL_URI_PREFIX,
+    _env_int,
+    _resolve_env_key_from_url,
+    download_to_spool,
+    get_spool_path,
+    get_state_dir,
+    on_shutdown,
+)
+
+__all__ = ["BlobCache", "BLOB_CACHE", "read_spool"]
+
+LOGGER = logging.getLogger(__name__)
+_INDEX_SAVE_INTERVAL = 5.0
+
+
+def read_spool(sha256: str, offset: int = 0, length: Optional[int] = None) -> Optional[bytes]:
+    """Read (part of) a spooled file; None if it is not in the spool. Blocking; run it in a thread."""
+
+    path = get_spool_path(sha256)
+    if path is None:
+        return None
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        start = min(max(offset, 0), size)
+        end = size if length is None else min(start + max(length, 0), size)
+        if start >= end:
+            return b""
+        fh.seek(start)
+        return fh.read(end - start)
+
+
+class BlobCache:
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+        self._inflight: dict[str, asyncio.Task[Optional[dict[str, Any]]]] = {}
+        self._dirty = False
+        self._saved_at = 0.0
+
+    @staticmethod
+    def _index_path() -> Any:
+        return get_state_dir("blobs") / "index.json"
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self._index_path().read_text()).get("entries", {})
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError):
+                LOGGER.warning("Ignoring unreadable blob index", exc_info=True)
+                self._entries = {}
+        return self._entries
+
+    def flush(self) -> None:
+        if not self._dirty or self._entries is None:
+            return
+        path = self._index_path()
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"entries": self._entries}, separators=(",", ":")))
+        os.replace(tmp, path)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def _touch(self) -> None:
+        self._dirty = True
+        if time.monotonic() - self._saved_at >= _INDEX_SAVE_INTERVAL:
+            self.flush()
+
+    def _evict(self, keep: str) -> None:
+        entries = self._load()
+        sizes = {entry["sha256"]: entry["bytes"] for entry in entries.values()}
+        total = sum(sizes.values())
+        for key in sorted(entries, key=lambda k: entries[k]["lastAccess"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            sha256 = entries.pop(key)["sha256"]
+            metrics.increment("blobs.evictions")
+            if any(entry["sha256"] == sha256 for entry in entries.values()):
+                continue
+            total -= sizes[sha256]
+            path = get_spool_path(sha256)
+            if path is not None:
+                path.unlink(missing_ok=True)
+        self._dirty = True
+
+    def lookup(self, key: str) -> Optional[dict[str, Any]]:
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        path = get_spool_path(entry["sha256"])
+        if path is None:
+            del self._entries[key]  # type: ignore[union-attr]
+            self._dirty = True
+            return None
+        entry["lastAccess"] = time.time()
+        self._touch()
+        return {
+            "path": str(path),
+            "uri": SPOOL_URI_PREFIX + entry["sha256"],
+            "sha256": entry["sha256"],
+            "bytes": entry["bytes"],
+            "contentType": entry.get("contentType"),
+        }
+
+    async def _download(self, key: str, url: str) -> Optional[dict[str, Any]]:
+        data = await download_to_spool(url)
+        if data:
+            self._load()[key] = {
+                "sha256": data["sha256"],
+                "bytes": data["bytes"],
+                "contentType": data.get("contentType"),
+                "lastAccess": time.time(),
+            }
+            self._evict(keep=key)
+            self.flush()
+        return data
+
+    async def fetch(self, url: str, tenant: int, kind: str, id: int) -> Optional[dict[str, Any]]:
+        """Return the cached blob for (environment, tenant, kind, id), downloading it once."""
+
+        key = f"{_resolve_env_key_from_url(url)}:{tenant}:{kind}:{id}"
+        cached = self.lookup(key)
+        if cached is not None:
+            metrics.increment("blobs.hits")
+            return {**cached, "cached": True}
+
+        metrics.increment("blobs.misses")
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._download(key, url))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        data = await asyncio.shield(task)
+        return {**data, "cached": False} if data else None
+
+    def stats(self) -> dict[str, Any]:
+        entries = self._load()
+        sizes = {entry["sha256"]: entry["bytes"] for entry in entries.values()}
+        return {"entries": len(entries), "files": len(sizes), "bytes": sum(sizes.values()), "maxBytes": self.max_bytes}
+
+
+BLOB_CACHE = BlobCache(max_bytes=_env_int("SERVICETITAN_MCP_BLOB_CACHE_MAX_BYTES", 2 * 1024**3))
+on_shutdown(BLOB_CACHE.flush)
@@ -0,0 +1,188 @@
+"""LRU + TTL cache for reference-data GETs made through ``make_st_request``.
+
+Only endpoint families listed in ``CACHE_TTL_POLICIES`` are cached. A family is
+``<api>/<resource>`` taken from ``/<api>/v2/tenant/{tenant}/<resource>/...``, and
+entries are scoped by host and tenant. Any write through the ``make_st_*`` helpers
+drops the cached entries of its family for that tenant. The cache keeps raw response
+bodies, so every hit returns a fresh object, and is bounded by entry count and bytes.
+"""
+
+import time
+from collections import Counter, OrderedDict
+from typing import Any, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from . import metrics
+
+__all__ = ["CACHE_TTL_POLICIES", "ResponseCache", "params_key", "url_scope"]
+
+# Family -> seconds a cached response stays fresh.
+CACHE_TTL_POLICIES: dict[str, float] = {
+    "accounting/gl-accounts": 300,
+    "accounting/payment-types": 3600,
+    "accounting/tax-zones": 3600,
+    "dispatch/arrival-windows": 600,
+    "dispatch/business-hours": 600,
+    "dispatch/teams": 600,
+    "dispatch/zones": 600,
+    "inventory/purchase-order-markups": 3600,
+    "inventory/purchase-order-types": 3600,
+    "inventory/return-types": 3600,
+    "inventory/trucks": 600,
+    "inventory/warehouses": 600,
+    "jbce/call-reasons": 3600,
+    "jpm/job-cancel-reasons": 3600,
+    "jpm/job-hold-reasons": 3600,
+    "jpm/job-types": 600,
+    "jpm/project-statuses": 3600,
+    "jpm/project-substatuses": 3600,
+    "jpm/project-types": 3600,
+    "marketing/categories": 3600,
+    "memberships/membership-types": 600,
+    "payroll/activity-codes": 3600,
+    "payroll/timesheet-codes": 3600,
+    "settings/business-units": 600,
+    "settings/tag-types": 600,
+    "settings/user-roles": 3600,
+    "timesheets/activity-categories": 3600,
+    "timesheets/activity-types": 3600,
+}
+
+Scope = tuple[str, str, str]
+
+
+class _Entry(NamedTuple):
+    scope: Scope
+    body: bytes
+    expires: float
+
+
+def url_scope(url: str) -> Optional[Scope]:
+    parts = urlsplit(url)
+    segments = [s for s in parts.path.split("/") if s]
+    try:
+        index = segments.index("tenant")
+    except ValueError:
+        return None
+    if index + 2 >= len(segments):
+        return None
+    return parts.netloc, segments[index + 1], f"{segments[0]}/{segments[index + 2]}"
+
+
+def _param_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return tuple(_param_value(v) for v in value)
+    return str(value)
+
+
+def params_key(params: Optional[dict[str, Any]]) -> tuple[Any, ...]:
+    if not params:
+        return ()
+    return tuple(sorted((k, _param_value(v)) for k, v in params.items() if v is not None))
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        policies: Optional[dict[str, float]] = None,
+        enabled: bool = True,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policies = CACHE_TTL_POLICIES if policies is None else policies
+        self.enabled = enabled
+        self._entries: OrderedDict[tuple[str, tuple[Any, ...]], _Entry] = OrderedDict()
+        self._bytes = 0
+        # Per-scope counters bumped by invalidate(); a response fetched before a write to its
+        # tenant and family must not be stored after it.
+        self._generations: dict[Scope, int] = {}
+        self._family_hits: Counter[str] = Counter()
+        self._family_misses: Counter[str] = Counter()
+
+    def _ttl(self, scope: Optional[Scope]) -> float:
+        if not self.enabled or scope is None:
+            return 0
+        return self.policies.get(scope[2], 0)
+
+    def _drop(self, key: tuple[str, tuple[Any, ...]]) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
+
+    def generation(self, url: str) -> int:
+        scope = url_scope(url)
+        return self._generations.get(scope, 0) if scope is not None else 0
+
+    def get(self, url: str, params: Optional[dict[str, Any]] = None) -> Optional[bytes]:
+        scope = url_scope(url)
+        if not self._ttl(scope):
+            return None
+        key = (url, params_key(params))
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires <= time.monotonic():
+            self._drop(key)
+            metrics.increment("cache.expired")
+            entry = None
+        if entry is None:
+            self._family_misses[scope[2]] += 1
+            metrics.increment("cache.misses")
+            return None
+        self._entries.move_to_end(key)
+        self._family_hits[scope[2]] += 1
+        metrics.increment("cache.hits")
+        return entry.body
+
+    def put(
+        self, url: str, params: Optional[dict[str, Any]], body: bytes, generation: Optional[int] = None
+    ) -> None:
+        scope = url_scope(url)
+        ttl = self._ttl(scope)
+        if not ttl or len(body) > self.max_bytes:
+            return
+        if generation is not None and generation != self._generations.get(scope, 0):
+            return
+        key = (url, params_key(params))
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = _Entry(scope, body, time.monotonic() + ttl)
+        self._bytes += len(body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            metrics.increment("cache.evictions")
+
+    def invalidate(self, url: str) -> int:
+        """Drop every cached entry in the same tenant and family as ``url``."""
+
+        scope = url_scope(url)
+        if scope is None:
+            return 0
+        self._generations[scope] = self._generations.get(scope, 0) + 1
+        stale = [key for key, entry in self._entries.items() if entry.scope == scope]
+        for key in stale:
+            self._drop(key)
+        if stale:
+            metrics.increment("cache.invalidations", len(stale))
+        return len(stale)
+
+    def clear(self) -> int:
+        count = len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+        return count
+
+    def stats(self) -> dict[str, Any]:
+        families = sorted(set(self._family_hits) | set(self._family_misses))
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "maxEntries": self.max_entries,
+            "maxBytes": self.max_bytes,
+            "families": {
+                family: {"hits": self._family_hits[family], "misses": self._family_misses[family]}
+                for family in families
+            },
+        }
@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_crm_booking_provider_tags_tools"]
 
@@ -22,11 +28,18 @@ def register_crm_booking_provider_tags_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of booking provider tags.
 
         Mirrors BookingProviderTags_GetList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -54,14 +67,14 @@ def register_crm_booking_provider_tags_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch booking provider tags."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_booking_provider_tags_create(
@@ -90,10 +103,7 @@ def register_crm_booking_provider_tags_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create booking provider tag."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_booking_provider_tags_update(
@@ -124,10 +134,7 @@ def register_crm_booking_provider_tags_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update booking provider tag."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_booking_provider_tags_get(
@@ -147,9 +154,6 @@ def register_crm_booking_provider_tags_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch booking provider tag."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
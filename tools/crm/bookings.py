@@ -1,4 +1,3 @@
-import json
 from typing import Any, Optional, Sequence
 
 from ..utils import (
@@ -7,6 +6,8 @@ from ..utils import (
     make_st_post,
     make_st_patch,
     make_st_delete,
+    fetch_all_pages,
+    format_response,
 )
 
 __all__ = ["register_crm_bookings_tools"]
@@ -29,11 +30,18 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         modified_on_or_after: Optional[str] = None,
         external_id: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of bookings for a booking provider.
 
         Mirrors Bookings_GetList2.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -61,14 +69,14 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch bookings for booking provider."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_booking_provider_bookings_get(
@@ -89,10 +97,7 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch booking for provider."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_booking_provider_bookings_create(
@@ -155,10 +160,7 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create booking for provider."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_booking_provider_bookings_update(
@@ -223,10 +225,7 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update booking for provider."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_booking_provider_bookings_get_contacts(
@@ -236,11 +235,18 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of contacts for a booking for a booking provider.
 
         Mirrors Bookings_GetContactList2.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -254,14 +260,14 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch booking contacts for provider."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_booking_provider_bookings_create_contact(
@@ -289,10 +295,7 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create booking contact for provider."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_booking_provider_bookings_update_contact(
@@ -330,10 +333,7 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update booking contact for provider."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_booking_provider_bookings_delete_contact(
@@ -357,10 +357,7 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete booking contact for provider."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_bookings_get_list(
@@ -375,11 +372,18 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         modified_on_or_after: Optional[str] = None,
         external_id: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of bookings (tenant-wide).
 
         Mirrors Bookings_GetList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -407,14 +411,14 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch bookings."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_bookings_get(
@@ -434,10 +438,7 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch booking."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_bookings_get_contacts(
@@ -446,11 +447,18 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of contacts for a booking (tenant-wide).
 
         Mirrors Bookings_GetContactList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -464,13 +472,13 @@ def register_crm_bookings_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch booking contacts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Sequence
 
-from ..utils import get_base_url, make_st_post, make_st_delete
+from ..utils import get_base_url, make_st_post, make_st_delete, format_response
 
 __all__ = ["register_crm_bulk_tags_tools"]
 
@@ -36,10 +35,7 @@ def register_crm_bulk_tags_tools(mcp: Any) -> None:
         if not data:
             return "Unable to add bulk tags."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_bulk_tags_remove(
@@ -68,9 +64,6 @@ def register_crm_bulk_tags_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to remove bulk tags."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,15 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch, make_st_put, make_st_delete
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    make_st_put,
+    make_st_delete,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_crm_contact_methods_tools"]
 
@@ -24,11 +32,18 @@ def register_crm_contact_methods_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of contact methods for a contact.
 
         Mirrors ContactMethods_GetContactMethods.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -58,14 +73,14 @@ def register_crm_contact_methods_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch contact methods."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_contact_methods_create(
@@ -95,10 +110,7 @@ def register_crm_contact_methods_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create contact method."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contact_methods_update(
@@ -130,10 +142,7 @@ def register_crm_contact_methods_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update contact method."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contact_methods_upsert(
@@ -164,10 +173,7 @@ def register_crm_contact_methods_tools(mcp: Any) -> None:
         if not data:
             return "Unable to upsert contact method."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contact_methods_get(
@@ -188,10 +194,7 @@ def register_crm_contact_methods_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch contact method."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contact_methods_delete(
@@ -212,9 +215,6 @@ def register_crm_contact_methods_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete contact method."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any
 
-from ..utils import get_base_url, make_st_request, make_st_patch
+from ..utils import get_base_url, make_st_request, make_st_patch, format_response
 
 __all__ = ["register_crm_contact_preferences_tools"]
 
@@ -30,10 +29,7 @@ def register_crm_contact_preferences_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch contact method preferences."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contact_preferences_update(
@@ -62,10 +58,7 @@ def register_crm_contact_preferences_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update contact method preference." 
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contact_preferences_get(
@@ -89,9 +82,6 @@ def register_crm_contact_preferences_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch contact method preference."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,4 +1,3 @@
-import json
 from typing import Any, Optional
 
 from ..utils import (
@@ -8,6 +7,8 @@ from ..utils import (
     make_st_patch,
     make_st_put,
     make_st_delete,
+    fetch_all_pages,
+    format_response,
 )
 
 __all__ = ["register_crm_contacts_tools"]
@@ -31,11 +32,18 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of contacts.
 
         Mirrors Contacts_GetList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -67,14 +75,14 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch contacts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_contacts_create(
@@ -104,10 +112,7 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contacts_search_contact_methods(
@@ -124,11 +129,18 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Search contact methods across contacts.
 
         Mirrors Contacts_SearchContactMethods.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -160,14 +172,14 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to search contact methods."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_contacts_get_preference_metadata_list(
@@ -186,10 +198,7 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch contact preference metadata."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contacts_get_by_relationship_id(
@@ -207,11 +216,18 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get contacts by relationship ID.
 
         Mirrors Contacts_GetByRelationshipId.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -243,14 +259,14 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch contacts by relationship id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_contacts_get_relationship_list(
@@ -265,11 +281,18 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a list of contact relationships.
 
         Mirrors Contacts_GetContactRelationshipList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -295,14 +318,14 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch contact relationships."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_contacts_delete_relationship(
@@ -324,10 +347,7 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete contact relationship."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contacts_create_relationship(
@@ -349,10 +369,7 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create contact relationship."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contacts_update(
@@ -389,10 +406,7 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contacts_replace(
@@ -426,10 +440,7 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to replace contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contacts_get(
@@ -449,10 +460,7 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_contacts_delete(
@@ -472,9 +480,6 @@ def register_crm_contacts_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
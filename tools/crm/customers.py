@@ -1,12 +1,16 @@
-import json
 from typing import Any, Optional, Sequence
 
+from ..mirror.store import MirrorError, query_mirror, get_mirror_record
 from ..utils import (
     get_base_url,
     make_st_request,
     make_st_post,
     make_st_patch,
     make_st_delete,
+    fetch_all_pages,
+    fetch_many_by_ids,
+    parse_id_list,
+    format_response,
 )
 
 __all__ = ["register_crm_customers_tools"]
@@ -42,13 +46,26 @@ def register_crm_customers_tools(mcp: Any) -> None:
         external_data_application_guid: Optional[str] = None,
         external_data_key: Optional[str] = None,
         external_data_values: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        source: str = "api",
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of customers with filters.
 
         Mirrors Customers_GetList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        source="mirror" answers from the local mirror (see mirror_sync) instead of the API.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
+        source = (source or "api").strip().lower()
+        if source not in {"api", "mirror"}:
+            return "'source' must be 'api' or 'mirror'."
+
         base_url = get_base_url(environment)
         url = f"{base_url}/crm/v2/tenant/{tenant}/customers"
 
@@ -102,14 +119,19 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if external_data_values:
             params["externalDataValues"] = external_data_values
 
-        data = await make_st_request(url, params=params or None)
+        if source == "mirror":
+            try:
+                data = await query_mirror(tenant, "customers", environment, params)
+            except MirrorError as exc:
+                return str(exc)
+        elif all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch customers."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_customers_create(
@@ -161,10 +183,7 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create customer."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_customers_get_modified_contacts_list(
@@ -177,11 +196,18 @@ def register_crm_customers_tools(mcp: Any) -> None:
         customer_ids: Optional[str] = None,
         created_before: Optional[str] = None,
         created_on_or_after: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get modified customer contacts within a date range or by customer IDs.
 
         Mirrors Customers_GetModifiedContactsList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -205,14 +231,14 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if created_on_or_after:
             params["createdOnOrAfter"] = created_on_or_after
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch modified customer contacts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_customers_get_custom_field_types(
@@ -225,11 +251,18 @@ def register_crm_customers_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get customer custom field types (paginated).
 
         Mirrors Customers_GetCustomFieldTypes.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -253,14 +286,14 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch customer custom field types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_customers_update(
@@ -312,33 +345,69 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update customer."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_customers_get(
         tenant: int,
         id: int,
+        source: str = "api",
         environment: str = "production",
     ) -> str:
         """Get a customer by ID.
 
         Mirrors Customers_Get.
+        source="mirror" answers from the local mirror (see mirror_sync) instead of the API.
         """
 
+        source = (source or "api").strip().lower()
+        if source not in {"api", "mirror"}:
+            return "'source' must be 'api' or 'mirror'."
+
         base_url = get_base_url(environment)
         url = f"{base_url}/crm/v2/tenant/{tenant}/customers/{id}"
 
-        data = await make_st_request(url)
+        if source == "mirror":
+            try:
+                data = await get_mirror_record(tenant, "customers", environment, id)
+            except MirrorError as exc:
+                return str(exc)
+        else:
+            data = await make_st_request(url)
         if not data:
             return "Unable to fetch customer."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
+
+    @mcp.tool()
+    async def crm_customers_get_many(
+        tenant: int,
+        ids: str,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
+        environment: str = "production",
+    ) -> str:
+        """Get many customers by ID in a few batched requests.
+
+        Built on Customers_GetList (ids filter). 'ids' is a comma-separated list; hundreds are fine.
+        Results are keyed by id; ids the API did not return are listed under 'missing'.
+        Inactive records are included.
+        Set compact=True for minified JSON output.
+        Pass fields="id,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
+
+        id_list = parse_id_list(ids)
+        if id_list is None:
+            return "'ids' must be a comma-separated list of integer IDs."
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/crm/v2/tenant/{tenant}/customers"
+
+        data = await fetch_many_by_ids(url, id_list, params={"active": "Any"})
+        if not data:
+            return "Unable to fetch customers."
+
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_customers_get_contact_list(
@@ -347,11 +416,18 @@ def register_crm_customers_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get contacts for a customer (paginated).
 
         Mirrors Customers_GetContactList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -365,14 +441,14 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch customer contacts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_customers_create_contact(
@@ -399,10 +475,7 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create customer contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_customers_update_contact(
@@ -440,10 +513,7 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update customer contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_customers_delete_contact(
@@ -464,10 +534,7 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete customer contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_customers_get_notes(
@@ -480,11 +547,18 @@ def register_crm_customers_tools(mcp: Any) -> None:
         created_on_or_after: Optional[str] = None,
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get notes for a customer (paginated).
 
         Mirrors Customers_GetNotes.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -506,14 +580,14 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if modified_on_or_after:
             params["modifiedOnOrAfter"] = modified_on_or_after
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch customer notes."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_customers_create_note(
@@ -545,10 +619,7 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create customer note."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_customers_delete_note(
@@ -569,10 +640,7 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete customer note."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_customers_delete_tag(
@@ -593,10 +661,7 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete customer tag."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_customers_create_tag(
@@ -617,9 +682,6 @@ def register_crm_customers_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create customer tag."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
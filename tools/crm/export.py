@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, drain_export, format_response
 
 __all__ = ["register_crm_export_tools"]
 
@@ -14,11 +13,19 @@ def register_crm_export_tools(mcp: Any) -> None:
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export bookings from ServiceTitan CRM API.
 
         Mirrors ExportBookings_Get.
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -30,25 +37,33 @@ def register_crm_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for CRM bookings."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_export_customers(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export customers from ServiceTitan CRM API.
 
         Mirrors ExportCustomers_GetCustomers.
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -60,25 +75,33 @@ def register_crm_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for CRM customers."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_export_customer_contacts(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export customer contacts from ServiceTitan CRM API.
 
         Mirrors ExportContacts_CustomersContacts.
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -90,25 +113,33 @@ def register_crm_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for CRM customer contacts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_export_leads(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export leads from ServiceTitan CRM API.
 
         Mirrors ExportLeads_Leads.
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -120,25 +151,33 @@ def register_crm_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for CRM leads."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_export_locations(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export locations from ServiceTitan CRM API.
 
         Mirrors ExportLocations_Locations.
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -150,25 +189,33 @@ def register_crm_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for CRM locations."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_export_location_contacts(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export location contacts from ServiceTitan CRM API.
 
         Mirrors ExportContacts_LocationsContacts.
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -180,14 +227,14 @@ def register_crm_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for CRM location contacts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
 
@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_crm_leads_tools"]
 
@@ -32,11 +38,18 @@ def register_crm_leads_tools(mcp: Any) -> None:
         customer_modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
         gen_perm_url: Optional[bool] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of leads with filters.
 
         Mirrors Leads_GetList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -84,14 +97,14 @@ def register_crm_leads_tools(mcp: Any) -> None:
         if gen_perm_url is not None:
             params["genPermUrl"] = gen_perm_url
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch leads."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_leads_create(
@@ -141,10 +154,7 @@ def register_crm_leads_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create lead."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_leads_update(
@@ -181,10 +191,7 @@ def register_crm_leads_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update lead."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_leads_get(
@@ -204,10 +211,7 @@ def register_crm_leads_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch lead."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_leads_dismiss(
@@ -230,10 +234,7 @@ def register_crm_leads_tools(mcp: Any) -> None:
         if not data:
             return "Unable to dismiss lead."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_leads_create_follow_up(
@@ -262,10 +263,7 @@ def register_crm_leads_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create follow-up."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_leads_get_notes(
@@ -278,11 +276,18 @@ def register_crm_leads_tools(mcp: Any) -> None:
         created_on_or_after: Optional[str] = None,
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get notes for a lead (paginated).
 
         Mirrors Leads_GetNotes.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -304,14 +309,14 @@ def register_crm_leads_tools(mcp: Any) -> None:
         if modified_on_or_after:
             params["modifiedOnOrAfter"] = modified_on_or_after
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch lead notes."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_leads_create_note(
@@ -340,9 +345,6 @@ def register_crm_leads_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create lead note."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
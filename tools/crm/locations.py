@@ -1,7 +1,17 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch, make_st_delete
+from ..mirror.store import MirrorError, query_mirror, get_mirror_record
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    make_st_delete,
+    fetch_all_pages,
+    fetch_many_by_ids,
+    parse_id_list,
+    format_response,
+)
 
 __all__ = ["register_crm_locations_tools"]
 
@@ -35,13 +45,26 @@ def register_crm_locations_tools(mcp: Any) -> None:
         external_data_application_guid: Optional[str] = None,
         external_data_key: Optional[str] = None,
         external_data_values: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        source: str = "api",
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of locations with filters.
 
         Mirrors Locations_GetList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        source="mirror" answers from the local mirror (see mirror_sync) instead of the API.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
+        source = (source or "api").strip().lower()
+        if source not in {"api", "mirror"}:
+            return "'source' must be 'api' or 'mirror'."
+
         base_url = get_base_url(environment)
         url = f"{base_url}/crm/v2/tenant/{tenant}/locations"
 
@@ -93,14 +116,19 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if external_data_values:
             params["externalDataValues"] = external_data_values
 
-        data = await make_st_request(url, params=params or None)
+        if source == "mirror":
+            try:
+                data = await query_mirror(tenant, "locations", environment, params)
+            except MirrorError as exc:
+                return str(exc)
+        elif all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch locations."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_locations_create(
@@ -139,10 +167,7 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create location."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_locations_get_locations_contacts_list(
@@ -155,11 +180,18 @@ def register_crm_locations_tools(mcp: Any) -> None:
         location_ids: Optional[str] = None,
         created_before: Optional[str] = None,
         created_on_or_after: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get contacts across locations filtered by date ranges or IDs.
 
         Mirrors Locations_GetLocationsContactsList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -183,14 +215,14 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if created_on_or_after:
             params["createdOnOrAfter"] = created_on_or_after
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch locations contacts list."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_locations_get_custom_field_types(
@@ -203,11 +235,18 @@ def register_crm_locations_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get location custom field types (paginated).
 
         Mirrors Locations_GetCustomFieldTypes.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -231,14 +270,14 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch location custom field types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_locations_update(
@@ -287,33 +326,69 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update location."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_locations_get(
         tenant: int,
         id: int,
+        source: str = "api",
         environment: str = "production",
     ) -> str:
         """Get a location by ID.
 
         Mirrors Locations_Get.
+        source="mirror" answers from the local mirror (see mirror_sync) instead of the API.
         """
 
+        source = (source or "api").strip().lower()
+        if source not in {"api", "mirror"}:
+            return "'source' must be 'api' or 'mirror'."
+
         base_url = get_base_url(environment)
         url = f"{base_url}/crm/v2/tenant/{tenant}/locations/{id}"
 
-        data = await make_st_request(url)
+        if source == "mirror":
+            try:
+                data = await get_mirror_record(tenant, "locations", environment, id)
+            except MirrorError as exc:
+                return str(exc)
+        else:
+            data = await make_st_request(url)
         if not data:
             return "Unable to fetch location."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
+
+    @mcp.tool()
+    async def crm_locations_get_many(
+        tenant: int,
+        ids: str,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
+        environment: str = "production",
+    ) -> str:
+        """Get many locations by ID in a few batched requests.
+
+        Built on Locations_GetList (ids filter). 'ids' is a comma-separated list; hundreds are fine.
+        Results are keyed by id; ids the API did not return are listed under 'missing'.
+        Inactive records are included.
+        Set compact=True for minified JSON output.
+        Pass fields="id,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
+
+        id_list = parse_id_list(ids)
+        if id_list is None:
+            return "'ids' must be a comma-separated list of integer IDs."
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/crm/v2/tenant/{tenant}/locations"
+
+        data = await fetch_many_by_ids(url, id_list, params={"active": "Any"})
+        if not data:
+            return "Unable to fetch locations."
+
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_locations_get_contact_list(
@@ -322,11 +397,18 @@ def register_crm_locations_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get contacts for a location (paginated).
 
         Mirrors Locations_GetContactList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -340,14 +422,14 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch location contacts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_locations_create_contact(
@@ -374,10 +456,7 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create location contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_locations_update_contact(
@@ -415,10 +494,7 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update location contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_locations_delete_contact(
@@ -439,10 +515,7 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete location contact."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_locations_get_notes(
@@ -455,11 +528,18 @@ def register_crm_locations_tools(mcp: Any) -> None:
         created_on_or_after: Optional[str] = None,
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get notes for a location (paginated).
 
         Mirrors Locations_GetNotes.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -481,14 +561,14 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if modified_on_or_after:
             params["modifiedOnOrAfter"] = modified_on_or_after
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch location notes."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def crm_locations_create_note(
@@ -520,10 +600,7 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create location note."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_locations_delete_note(
@@ -544,10 +621,7 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete location note."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_locations_delete_tag(
@@ -568,10 +642,7 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete location tag."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def crm_locations_create_tag(
@@ -592,9 +663,6 @@ def register_crm_locations_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create location tag."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_put
+from ..utils import get_base_url, make_st_put, format_response
 
 __all__ = ["register_customer_interactions_technician_rating_tools"]
 
@@ -42,10 +41,7 @@ def register_customer_interactions_technician_rating_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to create or update technician rating."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
 
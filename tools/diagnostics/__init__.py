@@ -0,0 +1,10 @@
+from typing import Any
+
+from .metrics import register_diagnostics_metrics_tools
+
+__all__ = ["register_diagnostics_tools"]
+
+
+def register_diagnostics_tools(mcp: Any) -> None:
+    """Register server diagnostics tools with the provided MCP server instance."""
+    register_diagnostics_metrics_tools(mcp)
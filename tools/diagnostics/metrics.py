@@ -0,0 +1,33 @@
+from typing import Any
+
+from .. import metrics
+from ..blobcache import BLOB_CACHE
+from ..utils import RESPONSE_CACHE, SCHEDULER, format_response
+
+__all__ = ["register_diagnostics_metrics_tools"]
+
+
+def register_diagnostics_metrics_tools(mcp: Any) -> None:
+    @mcp.tool()
+    async def diagnostics_get_metrics(reset: bool = False) -> str:
+        """Show HTTP-layer counters (cache, coalesced GETs, retries, scheduler queueing), cache occupancy, rate-limit buckets and blob cache size.
+
+        Set reset=True to zero the counters after reading them.
+        """
+
+        data = {
+            "counters": metrics.snapshot(),
+            "cache": RESPONSE_CACHE.stats(),
+            "scheduler": SCHEDULER.stats(),
+            "blobs": BLOB_CACHE.stats(),
+        }
+        if reset:
+            metrics.reset()
+
+        return format_response(data)
+
+    @mcp.tool()
+    async def diagnostics_clear_cache() -> str:
+        """Drop every cached reference-data response."""
+
+        return format_response({"cleared": RESPONSE_CACHE.clear()})
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post
+from ..utils import get_base_url, make_st_request, make_st_post, fetch_all_pages, format_response
 
 __all__ = ["register_dispatch_appointment_assignments_tools"]
 
@@ -22,6 +21,10 @@ def register_dispatch_appointment_assignments_tools(mcp: Any) -> None:
         include_total: bool = False,
         sort: Optional[str] = None,
         active: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of appointment assignments with filters.
@@ -29,6 +32,9 @@ def register_dispatch_appointment_assignments_tools(mcp: Any) -> None:
         Mirrors AppointmentAssignments_GetList.
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, API defaults to only active.
         - sort: like "+FieldName" or "-FieldName". Allowed: Id, CreatedOn, ModifiedOn
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -64,14 +70,14 @@ def register_dispatch_appointment_assignments_tools(mcp: Any) -> None:
             else:
                 return "Invalid 'active' value. Use one of: True, Any, False."
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch appointment assignments."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def dispatch_assign_technicians(
@@ -97,10 +103,7 @@ def register_dispatch_appointment_assignments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to assign technicians to appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_unassign_technicians(
@@ -126,10 +129,7 @@ def register_dispatch_appointment_assignments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to unassign technicians from appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
 
@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_put
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_put,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_dispatch_arrival_windows_tools"]
 
@@ -16,12 +22,19 @@ def register_dispatch_arrival_windows_tools(mcp: Any) -> None:
         created_before: Optional[str] = None,
         created_on_or_after: Optional[str] = None,
         active: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """List arrival windows (paginated) with optional filters.
 
         Mirrors ArrivalWindows_GetList.
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, only active returned by default.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -45,14 +58,14 @@ def register_dispatch_arrival_windows_tools(mcp: Any) -> None:
             else:
                 return "Invalid 'active' value. Use one of: True, Any, False."
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch arrival windows."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def dispatch_create_arrival_window(
@@ -87,10 +100,7 @@ def register_dispatch_arrival_windows_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create arrival window."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_update_arrival_window(
@@ -126,10 +136,7 @@ def register_dispatch_arrival_windows_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update arrival window."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_get_arrival_window(
@@ -149,10 +156,7 @@ def register_dispatch_arrival_windows_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch arrival window."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_set_arrival_window_activated(
@@ -175,10 +179,7 @@ def register_dispatch_arrival_windows_tools(mcp: Any) -> None:
         if not data:
             return "Unable to set arrival window active status."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_get_arrival_window_configuration(
@@ -197,10 +198,7 @@ def register_dispatch_arrival_windows_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch arrival window configuration."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_update_arrival_window_configuration(
@@ -232,9 +230,6 @@ def register_dispatch_arrival_windows_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update arrival window configuration."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post
+from ..utils import get_base_url, make_st_request, make_st_post, format_response
 
 __all__ = ["register_dispatch_business_hour_tools"]
 
@@ -24,10 +23,7 @@ def register_dispatch_business_hour_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch business hours."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_create_business_hours(
@@ -63,9 +59,6 @@ def register_dispatch_business_hour_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create business hours."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
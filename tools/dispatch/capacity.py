@@ -1,7 +1,7 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_post
+from ..utils import get_base_url, make_st_post, format_response
+from .capacityplanner import CAPACITY_PLANNER, CAPACITY_PLANNER_ENABLED
 
 __all__ = ["register_dispatch_capacity_tools"]
 
@@ -15,12 +15,15 @@ def register_dispatch_capacity_tools(mcp: Any) -> None:
         business_unit_ids: Optional[Sequence[int]] = None,
         job_type_id: Optional[int] = None,
         skill_based_availability: bool = True,
+        refresh: bool = False,
         environment: str = "production",
     ) -> str:
         """Get capacity/availability for a time window.
 
         Mirrors Capacity_GetList.
         Required: starts_on_or_after, ends_on_or_before, skill_based_availability.
+        The window is answered from per-day buckets (per set of business units) cached for
+        SERVICETITAN_MCP_CAPACITY_TTL seconds; set refresh=True to refetch every bucket.
         """
 
         if not starts_on_or_after:
@@ -28,6 +31,24 @@ def register_dispatch_capacity_tools(mcp: Any) -> None:
         if not ends_on_or_before:
             return "'ends_on_or_before' is required."
 
+        if CAPACITY_PLANNER_ENABLED:
+            try:
+                data = await CAPACITY_PLANNER.get_capacity(
+                    tenant,
+                    starts_on_or_after,
+                    ends_on_or_before,
+                    business_unit_ids=business_unit_ids,
+                    job_type_id=job_type_id,
+                    skill_based_availability=skill_based_availability,
+                    environment=environment,
+                    refresh=refresh,
+                )
+            except ValueError as exc:
+                return str(exc)
+            if not data:
+                return "Unable to fetch capacity."
+            return format_response(data)
+
         base_url = get_base_url(environment)
         url = f"{base_url}/dispatch/v2/tenant/{tenant}/capacity"
 
@@ -45,9 +66,6 @@ def register_dispatch_capacity_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch capacity."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -0,0 +1,179 @@
+"""Capacity query planner: per-day buckets with a short TTL.
+
+``dispatch_get_capacity`` queries are split into whole-day buckets keyed by the
+sorted set of requested business units (or "all" when none are given), so each
+bucket holds the API's combined availability for that set. Day boundaries are
+midnights in the query's own UTC offset. Buckets that are cached and younger than ``CAPACITY_TTL``
+are reused, and the rest are fetched ``CAPACITY_CONCURRENCY`` at a time. Identical
+buckets already in flight are shared. The merged response keeps the
+Capacity_GetList shape: ``availabilities`` from every bucket, trimmed to the
+requested window, deduplicated (a slot crossing midnight comes back from both days)
+and ordered by start.
+"""
+
+import time
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, time as dt_time, timedelta, timezone
+from typing import Any, Optional, Sequence
+
+from .. import metrics
+from ..utils import _env_flag, _env_int, get_base_url, make_st_post
+
+__all__ = ["CAPACITY_PLANNER_ENABLED", "CAPACITY_TTL", "CapacityPlanner", "CAPACITY_PLANNER"]
+
+CAPACITY_PLANNER_ENABLED = _env_flag("SERVICETITAN_MCP_CAPACITY_PLANNER")
+CAPACITY_TTL = _env_int("SERVICETITAN_MCP_CAPACITY_TTL", 60)
+CAPACITY_CONCURRENCY = _env_int("SERVICETITAN_MCP_CAPACITY_CONCURRENCY", 4)
+CAPACITY_MAX_BUCKETS = 2048
+
+# (url, sorted businessUnitIds, jobTypeId, skillBasedAvailability, day start)
+BucketKey = tuple[str, Optional[tuple[int, ...]], Optional[int], bool, str]
+
+
+def _parse(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"Invalid date/time '{value}'; use ISO 8601, e.g. 2025-03-01T00:00:00Z.") from None
+
+
+def _days(start: datetime, end: datetime) -> list[datetime]:
+    day = datetime.combine(start.date(), dt_time(), tzinfo=start.tzinfo)
+    days = []
+    while day < end or not days:
+        days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def _slot_bound(slot: dict[str, Any], name: str, aware: bool) -> Optional[datetime]:
+    raw = (slot.get(f"{name}Utc") if aware else None) or slot.get(name)
+    if not raw:
+        return None
+    try:
+        value = _parse(str(raw))
+    except ValueError:
+        return None
+    if aware and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value if aware else value.replace(tzinfo=None)
+
+
+class CapacityPlanner:
+    def __init__(self, ttl: float, max_buckets: int = CAPACITY_MAX_BUCKETS) -> None:
+        self.ttl = ttl
+        self.max_buckets = max_buckets
+        self._buckets: OrderedDict[BucketKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._inflight: dict[BucketKey, asyncio.Task[Optional[dict[str, Any]]]] = {}
+
+    async def _fetch(self, key: BucketKey, body: dict[str, Any]) -> Optional[dict[str, Any]]:
+        data = await make_st_post(key[0], json_body=body)
+        if data:
+            self._buckets[key] = (time.monotonic() + self.ttl, data)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        return data
+
+    def _cached(self, key: BucketKey) -> Optional[dict[str, Any]]:
+        entry = self._buckets.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._buckets[key]
+            return None
+        self._buckets.move_to_end(key)
+        return entry[1]
+
+    async def _bucket(self, key: BucketKey, body: dict[str, Any], refresh: bool) -> Optional[dict[str, Any]]:
+        cached = None if refresh else self._cached(key)
+        if cached is not None:
+            metrics.increment("capacity.bucket_hits")
+            return cached
+        metrics.increment("capacity.bucket_misses")
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, body))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def get_capacity(
+        self,
+        tenant: int,
+        starts_on_or_after: str,
+        ends_on_or_before: str,
+        business_unit_ids: Optional[Sequence[int]] = None,
+        job_type_id: Optional[int] = None,
+        skill_based_availability: bool = True,
+        environment: str = "production",
+        refresh: bool = False,
+        concurrency: int = CAPACITY_CONCURRENCY,
+    ) -> dict[str, Any] | None:
+        """Answer a Capacity_GetList query from day buckets; None if any bucket fails.
+
+        Raises ValueError for unparseable or inverted window bounds.
+        """
+
+        start = _parse(starts_on_or_after)
+        end = _parse(ends_on_or_before)
+        if (start.tzinfo is None) != (end.tzinfo is None):
+            raise ValueError("Window bounds must both include a UTC offset or both omit it.")
+        if end <= start:
+            raise ValueError("'ends_on_or_before' must be after 'starts_on_or_after'.")
+
+        url = f"{get_base_url(environment)}/dispatch/v2/tenant/{tenant}/capacity"
+        units = tuple(sorted({int(b) for b in business_unit_ids})) if business_unit_ids else None
+        skill = bool(skill_based_availability)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def load(day: datetime) -> Optional[dict[str, Any]]:
+            body: dict[str, Any] = {
+                "startsOnOrAfter": day.isoformat(),
+                "endsOnOrBefore": (day + timedelta(days=1)).isoformat(),
+                "skillBasedAvailability": skill,
+            }
+            if units is not None:
+                body["businessUnitIds"] = list(units)
+            if job_type_id is not None:
+                body["jobTypeId"] = int(job_type_id)
+            key: BucketKey = (url, units, job_type_id, skill, day.isoformat())
+            async with semaphore:
+                return await self._bucket(key, body, refresh)
+
+        results = await asyncio.gather(*(load(day) for day in _days(start, end)))
+        if any(not result for result in results):
+            return None
+
+        aware = start.tzinfo is not None
+        slots = []
+        # A slot crossing midnight is returned by both day buckets; keep it once.
+        seen: set[tuple[Any, ...]] = set()
+        for result in results:
+            for slot in result.get("availabilities") or []:
+                slot_start = _slot_bound(slot, "start", aware)
+                slot_end = _slot_bound(slot, "end", aware)
+                if slot_start is not None and slot_start < start:
+                    continue
+                if slot_end is not None and slot_end > end:
+                    continue
+                identity = (
+                    slot.get("startUtc") or slot.get("start"),
+                    slot.get("endUtc") or slot.get("end"),
+                    tuple(slot.get("businessUnitIds") or ()),
+                )
+                if identity in seen:
+                    continue
+                seen.add(identity)
+                slots.append((slot_start or start, slot))
+        slots.sort(key=lambda item: item[0])
+
+        merged = {k: v for k, v in results[0].items() if k != "availabilities"}
+        merged["startsOnOrAfter"] = starts_on_or_after
+        merged["endsOnOrBefore"] = ends_on_or_before
+        merged["availabilities"] = [slot for _, slot in slots]
+        return merged
+
+
+CAPACITY_PLANNER = CapacityPlanner(CAPACITY_TTL)
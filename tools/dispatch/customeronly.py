@@ -1,7 +1,7 @@
-import json
 from typing import Any, Sequence
 
-from ..utils import get_base_url, make_st_post
+from ..utils import get_base_url, make_st_post, format_response
+from .gpsbuffer import GPS_INGEST
 
 __all__ = ["register_dispatch_customer_only_tools"]
 
@@ -12,12 +12,16 @@ def register_dispatch_customer_only_tools(mcp: Any) -> None:
         tenant: int,
         gps_provider: str,
         pings: Sequence[dict[str, Any]],
+        buffered: bool = False,
         environment: str = "production",
     ) -> str:
         """Create GPS pings for a given provider.
 
         Mirrors Gps_Create.
         Provide a list of GPS ping objects conforming to GpsPingCreateRequest.
+        Set buffered=True to queue the pings and return at once; they are sent in batches per
+        provider (see dispatch_get_gps_ingest_stats), and superseded pings per vehicle are dropped
+        when the queue backs up. Pings the API rejects are set aside and listed in the stats.
         """
 
         if not gps_provider:
@@ -25,6 +29,9 @@ def register_dispatch_customer_only_tools(mcp: Any) -> None:
         if not pings:
             return "'pings' must contain at least one GPS ping object."
 
+        if buffered:
+            return format_response(GPS_INGEST.enqueue(tenant, gps_provider, list(pings), environment=environment))
+
         base_url = get_base_url(environment)
         url = f"{base_url}/dispatch/v2/tenant/{tenant}/gps-provider/{gps_provider}/gps-pings"
 
@@ -34,9 +41,10 @@ def register_dispatch_customer_only_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create GPS pings."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
+    @mcp.tool()
+    async def dispatch_get_gps_ingest_stats() -> str:
+        """Show buffered GPS ping ingestion per provider: queue depth, pings sent, superseded, dropped and rejected, throughput and last flush latency."""
 
+        return format_response(GPS_INGEST.stats())
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, drain_export, format_response
 
 __all__ = ["register_dispatch_export_tools"]
 
@@ -13,6 +12,11 @@ def register_dispatch_export_tools(mcp: Any) -> None:
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
         active: Optional[str] = None,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for appointment assignments.
@@ -22,6 +26,9 @@ def register_dispatch_export_tools(mcp: Any) -> None:
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, API defaults to only active.
         - from_token: continuation token (or date string to start export from a point in time)
         - include_recent_changes: if True, receive recent changes sooner (results may repeat)
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -42,14 +49,14 @@ def register_dispatch_export_tools(mcp: Any) -> None:
             else:
                 return "Invalid 'active' value. Use one of: True, Any, False."
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for Dispatch appointment assignments." 
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
 
@@ -0,0 +1,305 @@
+"""Buffered GPS ping ingestion for Gps_Create.
+
+``dispatch_create_gps_pings(buffered=True)`` appends pings to a ring buffer per
+(environment, tenant, GPS provider) and returns at once. Each buffer's flush task
+posts a batch when ``GPS_FLUSH_SIZE`` pings are waiting or the oldest has waited
+``GPS_FLUSH_INTERVAL`` seconds. If the backlog grows past ``GPS_BACKLOG`` pings
+(the API is slow or failing), only the newest ping per vehicle is kept, because
+older positions are superseded. Past ``GPS_BUFFER_CAPACITY`` the oldest pings are
+dropped. Batches that fail transiently (429, 5xx, transport errors) go back to the
+front of the buffer and are retried with backoff. A rejected batch (other 4xx) is
+split in halves until the rejected pings are isolated; those are dead-lettered so
+they cannot block the pings behind them. Counters and flush latency are reported
+by ``GpsIngest.stats``.
+"""
+
+import time
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Optional, Sequence
+
+import httpx
+
+from .. import metrics
+from ..scheduler import BULK, request_priority
+from ..utils import (
+    RETRYABLE_STATUSES,
+    _env_int,
+    _invalidate,
+    _resolve_env_key_from_url,
+    _send,
+    build_headers,
+    get_base_url,
+    on_shutdown,
+)
+
+__all__ = ["GPS_FLUSH_SIZE", "GpsIngest", "GPS_INGEST"]
+
+LOGGER = logging.getLogger(__name__)
+
+GPS_FLUSH_SIZE = _env_int("SERVICETITAN_MCP_GPS_FLUSH_SIZE", 500)
+GPS_FLUSH_INTERVAL = _env_int("SERVICETITAN_MCP_GPS_FLUSH_INTERVAL_MS", 2000) / 1000
+GPS_BACKLOG = _env_int("SERVICETITAN_MCP_GPS_BACKLOG", 4 * GPS_FLUSH_SIZE)
+GPS_BUFFER_CAPACITY = _env_int("SERVICETITAN_MCP_GPS_BUFFER_CAPACITY", 50000)
+_RETRY_MAX_DELAY = 30.0
+_SHUTDOWN_FLUSH_TIMEOUT = 10.0
+# Rejected pings kept for inspection per provider.
+_DEAD_LETTER_SIZE = 100
+
+# Fields identifying the vehicle/device and the time of a ping, first match wins.
+_VEHICLE_FIELDS = ("vehicleId", "vehicleExternalId", "deviceId", "vehicleName", "technicianId")
+_TIME_FIELDS = ("timestamp", "eventTime", "dateTime", "time")
+
+
+def _field(ping: dict[str, Any], names: Sequence[str]) -> Any:
+    return next((ping[name] for name in names if ping.get(name) is not None), None)
+
+
+def _ping_time(ping: dict[str, Any]) -> Optional[datetime]:
+    value = _field(ping, _TIME_FIELDS)
+    if value is None:
+        return None
+    try:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return datetime.fromtimestamp(value, timezone.utc)
+        parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except (OverflowError, OSError, ValueError):
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _transient(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status in RETRYABLE_STATUSES or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class _ProviderBuffer:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        # (arrival time, ping)
+        self.pings: deque[tuple[float, dict[str, Any]]] = deque()
+        self.wake = asyncio.Event()
+        self.stopping = asyncio.Event()
+        self.task: Optional[asyncio.Task[None]] = None
+        self.failures = 0
+        self.received = 0
+        self.sent = 0
+        self.superseded = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.dead_letter: deque[dict[str, Any]] = deque(maxlen=_DEAD_LETTER_SIZE)
+        self.flushes = 0
+        self.last_flush_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.started = time.monotonic()
+
+    def add(self, pings: Sequence[dict[str, Any]]) -> None:
+        now = time.monotonic()
+        self.pings.extend((now, ping) for ping in pings)
+        self.received += len(pings)
+        metrics.increment("gps.pings_received", len(pings))
+        if len(self.pings) > GPS_BACKLOG:
+            self._drop_superseded()
+        overflow = len(self.pings) - GPS_BUFFER_CAPACITY
+        for _ in range(max(overflow, 0)):
+            self.pings.popleft()
+        if overflow > 0:
+            self.dropped += overflow
+            metrics.increment("gps.pings_dropped", overflow)
+        if len(self.pings) >= GPS_FLUSH_SIZE:
+            self.wake.set()
+
+    def _drop_superseded(self) -> None:
+        latest: dict[Any, tuple[Optional[datetime], int]] = {}
+        for index, (_, ping) in enumerate(self.pings):
+            vehicle = _field(ping, _VEHICLE_FIELDS)
+            if vehicle is None:
+                continue
+            stamp = _ping_time(ping)
+            best = latest.get(vehicle)
+            # Without comparable timestamps the later arrival wins.
+            if best is None or stamp is None or best[0] is None or stamp >= best[0]:
+                latest[vehicle] = (stamp, index)
+        keep = {index for _, index in latest.values()}
+        kept = deque(
+            item for index, item in enumerate(self.pings) if index in keep or _field(item[1], _VEHICLE_FIELDS) is None
+        )
+        removed = len(self.pings) - len(kept)
+        self.pings = kept
+        if removed:
+            self.superseded += removed
+            metrics.increment("gps.pings_superseded", removed)
+
+    def _due_in(self) -> float:
+        if not self.pings:
+            return GPS_FLUSH_INTERVAL
+        if len(self.pings) >= GPS_FLUSH_SIZE:
+            return 0.0
+        return self.pings[0][0] + GPS_FLUSH_INTERVAL - time.monotonic()
+
+    async def _post(self, pings: list[dict[str, Any]]) -> Optional[Exception]:
+        headers = await build_headers(self.url)
+        try:
+            with request_priority(BULK):
+                await _send("POST", self.url, headers=headers, json_body=pings)
+        except (httpx.HTTPStatusError, httpx.TransportError) as exc:
+            return exc
+        finally:
+            _invalidate(self.url)
+        return None
+
+    def _reject(self, item: tuple[float, dict[str, Any]], error: Exception) -> None:
+        detail = error.response.text[:500] if isinstance(error, httpx.HTTPStatusError) else str(error)
+        status = error.response.status_code if isinstance(error, httpx.HTTPStatusError) else None
+        LOGGER.warning("GPS ping rejected by %s (%s): %s", self.url, status, detail)
+        self.rejected += 1
+        self.dead_letter.append({"ping": item[1], "status": status, "error": detail, "rejectedAt": time.time()})
+        metrics.increment("gps.pings_rejected")
+
+    async def flush(self) -> bool:
+        """Send the next batch; False if it failed transiently and was put back."""
+
+        if not self.pings:
+            return True
+        count = min(len(self.pings), GPS_FLUSH_SIZE)
+        batch = [self.pings.popleft() for _ in range(count)]
+        # Batches are settled front to back, so the unsent pings are always a suffix.
+        settled = 0
+
+        async def deliver(part: list[tuple[float, dict[str, Any]]]) -> bool:
+            nonlocal settled
+            started = time.monotonic()
+            error = await self._post([ping for _, ping in part])
+            if error is None:
+                elapsed = time.monotonic() - started
+                settled += len(part)
+                self.sent += len(part)
+                self.flushes += 1
+                self.last_flush_ms = round(elapsed * 1000, 1)
+                metrics.increment("gps.flushes")
+                metrics.increment("gps.pings_sent", len(part))
+                metrics.increment("gps.flush_seconds", elapsed)
+                metrics.increment("gps.queue_seconds", sum(started - arrived for arrived, _ in part))
+                return True
+            if _transient(error):
+                summary = str(error).splitlines()[0] if str(error) else type(error).__name__
+                LOGGER.warning("Sending GPS pings to %s failed: %s", self.url, summary)
+                self.last_error = f"Unable to create GPS pings: {summary}"
+                return False
+            if len(part) == 1:
+                self._reject(part[0], error)
+                settled += 1
+                return True
+            middle = len(part) // 2
+            return await deliver(part[:middle]) and await deliver(part[middle:])
+
+        try:
+            ok = await deliver(batch)
+        finally:
+            # Also on cancellation: whatever was not settled goes back to the front.
+            self.pings.extendleft(reversed(batch[settled:]))
+        if not ok:
+            self.failures += 1
+            metrics.increment("gps.flush_failures")
+            return False
+        self.failures = 0
+        self.last_error = None
+        return True
+
+    async def _pause(self, event: asyncio.Event, delay: float) -> None:
+        try:
+            await asyncio.wait_for(event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def run(self) -> None:
+        while not self.stopping.is_set():
+            if self.failures:
+                await self._pause(self.stopping, min(_RETRY_MAX_DELAY, GPS_FLUSH_INTERVAL * 2**self.failures))
+                if self.stopping.is_set():
+                    return
+            else:
+                delay = self._due_in()
+                if delay > 0:
+                    self.wake.clear()
+                    await self._pause(self.wake, delay)
+                    continue
+            try:
+                await self.flush()
+            except Exception:
+                LOGGER.warning("Flushing GPS pings to %s failed", self.url, exc_info=True)
+                self.failures += 1
+
+    async def drain(self) -> None:
+        """Stop the flush task once its in-flight batch settles, then send what is left."""
+
+        self.stopping.set()
+        self.wake.set()
+        if self.task is not None:
+            await self.task
+        while self.pings and await self.flush():
+            pass
+
+    def stats(self) -> dict[str, Any]:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return {
+            "buffered": len(self.pings),
+            "received": self.received,
+            "sent": self.sent,
+            "superseded": self.superseded,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+            "flushes": self.flushes,
+            "pingsPerSecond": round(self.sent / elapsed, 2),
+            "averageBatch": round(self.sent / self.flushes, 1) if self.flushes else None,
+            "lastFlushMs": self.last_flush_ms,
+            "oldestPingAgeSeconds": round(time.monotonic() - self.pings[0][0], 3) if self.pings else None,
+            "consecutiveFailures": self.failures,
+            "lastError": self.last_error,
+            "recentRejections": list(self.dead_letter)[-10:],
+        }
+
+
+class GpsIngest:
+    def __init__(self) -> None:
+        self._buffers: dict[tuple[str, int, str], _ProviderBuffer] = {}
+
+    def enqueue(
+        self, tenant: int, gps_provider: str, pings: Sequence[dict[str, Any]], environment: str = "production"
+    ) -> dict[str, Any]:
+        base_url = get_base_url(environment)
+        key = (_resolve_env_key_from_url(base_url), int(tenant), gps_provider)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            url = f"{base_url}/dispatch/v2/tenant/{tenant}/gps-provider/{gps_provider}/gps-pings"
+            buffer = self._buffers[key] = _ProviderBuffer(url)
+        buffer.add(pings)
+        if buffer.task is None or buffer.task.done():
+            buffer.task = asyncio.get_running_loop().create_task(buffer.run())
+        return {"queued": len(pings), "buffered": len(buffer.pings)}
+
+    def stats(self) -> dict[str, Any]:
+        return {f"{env}:{tenant}:{provider}": b.stats() for (env, tenant, provider), b in self._buffers.items()}
+
+    async def close(self) -> None:
+        """Let in-flight batches finish and send what is still buffered (bounded by a timeout)."""
+
+        buffers = list(self._buffers.values())
+        drains = [asyncio.ensure_future(buffer.drain()) for buffer in buffers]
+        try:
+            await asyncio.wait_for(asyncio.gather(*drains), timeout=_SHUTDOWN_FLUSH_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        except Exception:
+            LOGGER.warning("Flushing GPS pings at shutdown failed", exc_info=True)
+        unsent = sum(len(buffer.pings) for buffer in buffers)
+        if unsent:
+            LOGGER.warning("Dropped %s unsent GPS ping(s) at shutdown", unsent)
+
+
+GPS_INGEST = GpsIngest()
+on_shutdown(GPS_INGEST.close)
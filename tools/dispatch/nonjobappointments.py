@@ -1,4 +1,3 @@
-import json
 from typing import Any, Optional
 
 from ..utils import (
@@ -7,6 +6,8 @@ from ..utils import (
     make_st_post,
     make_st_put,
     make_st_delete,
+    fetch_all_pages,
+    format_response,
 )
 
 __all__ = ["register_dispatch_non_job_appointments_tools"]
@@ -31,11 +32,18 @@ def register_dispatch_non_job_appointments_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a list of non-job appointments (paginated) with filters.
 
         Mirrors NonJobAppointments_GetList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -73,14 +81,14 @@ def register_dispatch_non_job_appointments_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch non-job appointments."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def dispatch_create_non_job_appointment(
@@ -163,10 +171,7 @@ def register_dispatch_non_job_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create non-job appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_update_non_job_appointment(
@@ -250,10 +255,7 @@ def register_dispatch_non_job_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update non-job appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_get_non_job_appointment(
@@ -273,10 +275,7 @@ def register_dispatch_non_job_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch non-job appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_delete_non_job_appointment(
@@ -296,9 +295,6 @@ def register_dispatch_non_job_appointments_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete non-job appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_delete
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_delete,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_dispatch_team_tools"]
 
@@ -19,11 +25,18 @@ def register_dispatch_team_tools(mcp: Any) -> None:
         modified_on_or_after: Optional[str] = None,
         modified_before: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of teams with filters.
 
         Mirrors Team_GetList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -49,14 +62,14 @@ def register_dispatch_team_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch teams."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def dispatch_create_team(
@@ -81,10 +94,7 @@ def register_dispatch_team_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create team."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_get_team(
@@ -104,10 +114,7 @@ def register_dispatch_team_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch team."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_delete_team(
@@ -127,9 +134,6 @@ def register_dispatch_team_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete team."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,14 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_put, make_st_delete
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_put,
+    make_st_delete,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_dispatch_technician_shifts_tools"]
 
@@ -25,6 +32,10 @@ def register_dispatch_technician_shifts_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of technician shifts with filters.
@@ -32,6 +43,9 @@ def register_dispatch_technician_shifts_tools(mcp: Any) -> None:
         Mirrors TechnicianShifts_GetList.
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, API defaults to only active.
         - shift_type: one of Normal, OnCall, TimeOff (case-insensitive)
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -81,14 +95,14 @@ def register_dispatch_technician_shifts_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch technician shifts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def dispatch_create_technician_shifts(
@@ -155,10 +169,7 @@ def register_dispatch_technician_shifts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create technician shifts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_bulk_delete_technician_shifts(
@@ -186,10 +197,7 @@ def register_dispatch_technician_shifts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to bulk delete technician shifts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_update_technician_shift(
@@ -232,10 +240,7 @@ def register_dispatch_technician_shifts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update technician shift."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_get_technician_shift(
@@ -255,10 +260,7 @@ def register_dispatch_technician_shifts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch technician shift."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_delete_technician_shift(
@@ -278,9 +280,6 @@ def register_dispatch_technician_shifts_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete technician shift."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,7 @@
-import json
-from typing import Any
+from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, format_response
+from .trackingpoller import TRACKING
 
 __all__ = ["register_dispatch_technician_tracking_tools"]
 
@@ -28,9 +28,64 @@ def register_dispatch_technician_tracking_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch technician tracking URL."
 
+        return format_response(data)
+
+    def _pairs(watches: Optional[Sequence[dict[str, Any]]]) -> list[tuple[int, int]]:
+        return [(int(w["technicianId"]), int(w["appointmentId"])) for w in watches or []]
+
+    @mcp.tool()
+    async def dispatch_watch_technician_tracking(
+        tenant: int,
+        watches: Sequence[dict[str, Any]],
+        environment: str = "production",
+    ) -> str:
+        """Add technician/appointment pairs to the tenant's shared tracking poller.
+
+        'watches' is a list of objects like {"technicianId": int, "appointmentId": int}.
+        Watched pairs are polled once per SERVICETITAN_MCP_TRACKING_POLL_INTERVAL seconds no matter
+        how many clients read them; read with dispatch_get_technician_tracking_changes.
+        """
+
+        try:
+            pairs = _pairs(watches)
+        except (KeyError, TypeError, ValueError):
+            return "Each watch must be an object like {\"technicianId\": int, \"appointmentId\": int}."
+        if not pairs:
+            return "'watches' must contain at least one technician/appointment pair."
+
+        try:
+            data = await TRACKING.watch(tenant, pairs, environment=environment)
+        except ValueError as exc:
+            return str(exc)
+
+        return format_response(data)
+
+    @mcp.tool()
+    async def dispatch_unwatch_technician_tracking(
+        tenant: int,
+        watches: Optional[Sequence[dict[str, Any]]] = None,
+        environment: str = "production",
+    ) -> str:
+        """Stop polling the given technician/appointment pairs (all pairs of the tenant if omitted)."""
+
         try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+            pairs = _pairs(watches) if watches else None
+        except (KeyError, TypeError, ValueError):
+            return "Each watch must be an object like {\"technicianId\": int, \"appointmentId\": int}."
+
+        return format_response({"removed": TRACKING.unwatch(tenant, pairs, environment=environment)})
 
+    @mcp.tool()
+    async def dispatch_get_technician_tracking_changes(
+        tenant: int,
+        cursor: Optional[str] = None,
+        environment: str = "production",
+    ) -> str:
+        """Return watched technician tracking entries that changed since 'cursor'.
+
+        Omit 'cursor' for the full current set, then pass the returned 'cursor' on the next call.
+        'removed' lists pairs unwatched since the cursor; 'reset' is true when the cursor was not
+        recognised (e.g. after a restart) and the full set is returned.
+        """
 
+        return format_response(await TRACKING.changes(tenant, cursor, environment=environment))
@@ -0,0 +1,274 @@
+"""Shared background polling of technician tracking with cursor-based deltas.
+
+TechnicianTracking_Get answers for one (technician, appointment) pair, so clients
+first add pairs to a per-tenant watch set. One poller task per (environment, tenant)
+refreshes every watched pair each ``TRACKING_POLL_INTERVAL`` seconds in the bulk lane,
+however many clients read the results. The latest result of each pair is kept in a
+``TrackingTable``: parallel arrays of ids, versions and 64-bit payload digests, plus a
+list of payloads. A pair gets the next version of the tenant's counter only when its
+digest changes. ``changes(cursor)`` returns the pairs with a version above the cursor.
+Cursors are ``"<epoch>:<version>"``; the epoch is random per table, so a cursor from
+another process or an older table is recognised and answered with a full reset.
+Unwatched pairs leave tombstones that are compacted once they outnumber live pairs.
+A poller stops after ``TRACKING_IDLE_TIMEOUT`` seconds without reads and restarts on
+the next read.
+"""
+
+import json
+import time
+import asyncio
+import logging
+import hashlib
+import secrets
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+
+from .. import metrics
+from ..scheduler import BULK, request_priority
+from ..utils import _env_int, _resolve_env_key_from_url, get_base_url, make_st_request, on_shutdown
+
+__all__ = ["TRACKING_POLL_INTERVAL", "TrackingTable", "TrackingPoller", "TRACKING"]
+
+LOGGER = logging.getLogger(__name__)
+
+TRACKING_POLL_INTERVAL = _env_int("SERVICETITAN_MCP_TRACKING_POLL_INTERVAL", 10)
+TRACKING_IDLE_TIMEOUT = _env_int("SERVICETITAN_MCP_TRACKING_IDLE_TIMEOUT", 600)
+TRACKING_CONCURRENCY = _env_int("SERVICETITAN_MCP_TRACKING_CONCURRENCY", 4)
+TRACKING_MAX_WATCHES = 500
+# Tombstones are compacted when there are at least this many and more than live slots.
+_COMPACT_MIN_TOMBSTONES = 64
+
+Pair = tuple[int, int]
+
+
+def _digest(data: Any) -> int:
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return int.from_bytes(hashlib.blake2b(canonical, digest_size=8).digest(), "big")
+
+
+class TrackingTable:
+    """Latest tracking result per watched pair; removed pairs keep a tombstone slot."""
+
+    def __init__(self) -> None:
+        self.epoch = secrets.token_hex(4)
+        self.version = 0
+        # Removals up to this version were compacted away; older cursors need a reset.
+        self.floor = 0
+        self.tombstones = 0
+        self._slots: dict[Pair, int] = {}
+        self.technicians = array("q")
+        self.appointments = array("q")
+        self.versions = array("Q")
+        self.digests = array("Q")
+        self.watched = bytearray()
+        self.payloads: list[Any] = []
+
+    @property
+    def cursor(self) -> str:
+        return f"{self.epoch}:{self.version}"
+
+    def parse_cursor(self, cursor: Optional[str]) -> Optional[int]:
+        """Version of a cursor issued by this table, 0 for no cursor, None if it cannot be served."""
+
+        if not cursor or cursor == "0":
+            return 0
+        epoch, _, version = cursor.partition(":")
+        if epoch != self.epoch or not version.isdigit():
+            return None
+        value = int(version)
+        return value if self.floor <= value <= self.version else None
+
+    def pairs(self) -> list[Pair]:
+        return [pair for pair, slot in self._slots.items() if self.watched[slot]]
+
+    def watch(self, pair: Pair) -> bool:
+        slot = self._slots.get(pair)
+        if slot is not None:
+            if self.watched[slot]:
+                return False
+            self.tombstones -= 1
+            self.watched[slot] = 1
+            self.digests[slot] = 0
+            self.payloads[slot] = None
+            return True
+        self._slots[pair] = len(self.payloads)
+        self.technicians.append(pair[0])
+        self.appointments.append(pair[1])
+        self.versions.append(0)
+        self.digests.append(0)
+        self.watched.append(1)
+        self.payloads.append(None)
+        return True
+
+    def unwatch(self, pair: Pair) -> bool:
+        slot = self._slots.get(pair)
+        if slot is None or not self.watched[slot]:
+            return False
+        self.version += 1
+        self.watched[slot] = 0
+        self.versions[slot] = self.version
+        self.payloads[slot] = None
+        self.tombstones += 1
+        if self.tombstones >= _COMPACT_MIN_TOMBSTONES and self.tombstones > len(self.payloads) - self.tombstones:
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """Drop tombstoned slots; cursors older than the newest dropped removal get a reset."""
+
+        live = [slot for slot in range(len(self.payloads)) if self.watched[slot]]
+        self.floor = max((v for v, w in zip(self.versions, self.watched) if not w), default=self.floor)
+        self.technicians = array("q", (self.technicians[slot] for slot in live))
+        self.appointments = array("q", (self.appointments[slot] for slot in live))
+        self.versions = array("Q", (self.versions[slot] for slot in live))
+        self.digests = array("Q", (self.digests[slot] for slot in live))
+        self.payloads = [self.payloads[slot] for slot in live]
+        self.watched = bytearray(b"\x01" * len(live))
+        self._slots = {(self.technicians[i], self.appointments[i]): i for i in range(len(live))}
+        self.tombstones = 0
+
+    def update(self, pair: Pair, data: Any) -> bool:
+        """Store a fresh result; bumps the pair's version only if it changed."""
+
+        slot = self._slots.get(pair)
+        if slot is None or not self.watched[slot]:
+            return False
+        digest = _digest(data)
+        if self.versions[slot] and self.digests[slot] == digest:
+            return False
+        self.version += 1
+        self.versions[slot] = self.version
+        self.digests[slot] = digest
+        self.payloads[slot] = data
+        return True
+
+    def changes(self, cursor: int) -> tuple[list[dict[str, Any]], list[dict[str, int]]]:
+        changed: list[dict[str, Any]] = []
+        removed: list[dict[str, int]] = []
+        for slot, version in enumerate(self.versions):
+            if version <= cursor:
+                continue
+            ids = {"technicianId": self.technicians[slot], "appointmentId": self.appointments[slot]}
+            if self.watched[slot]:
+                changed.append({**ids, "version": version, "data": self.payloads[slot]})
+            else:
+                removed.append(ids)
+        changed.sort(key=lambda item: item["version"])
+        return changed, removed
+
+
+class _TenantTracker:
+    def __init__(self, environment: str, tenant: int) -> None:
+        self.environment = environment
+        self.tenant = tenant
+        self.table = TrackingTable()
+        self.last_read = time.monotonic()
+        self.last_poll: Optional[float] = None
+        self.task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def url(self) -> str:
+        return f"{get_base_url(self.environment)}/dispatch/v2/tenant/{self.tenant}/technician-tracking"
+
+    async def poll_once(self) -> int:
+        semaphore = asyncio.Semaphore(max(TRACKING_CONCURRENCY, 1))
+        url = self.url
+
+        async def fetch(pair: Pair) -> bool:
+            async with semaphore:
+                data = await make_st_request(url, params={"technicianId": pair[0], "appointmentId": pair[1]})
+            return data is not None and self.table.update(pair, data)
+
+        started = time.monotonic()
+        with request_priority(BULK):
+            results = await asyncio.gather(*(fetch(pair) for pair in self.table.pairs()))
+        self.last_poll = time.time()
+        metrics.increment("tracking.polls")
+        metrics.increment("tracking.poll_seconds", time.monotonic() - started)
+        metrics.increment("tracking.changes", sum(results))
+        return sum(results)
+
+    async def run(self) -> None:
+        while self.table.pairs() and time.monotonic() - self.last_read < TRACKING_IDLE_TIMEOUT:
+            if self.last_poll is not None:
+                delay = self.last_poll + TRACKING_POLL_INTERVAL - time.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+            try:
+                await self.poll_once()
+            except Exception:
+                LOGGER.warning("Technician tracking poll for tenant %s failed", self.tenant, exc_info=True)
+                self.last_poll = time.time()
+
+    def ensure_polling(self) -> None:
+        if self.table.pairs() and (self.task is None or self.task.done()):
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+
+class TrackingPoller:
+    def __init__(self) -> None:
+        self._tenants: dict[tuple[str, int], _TenantTracker] = {}
+
+    def _tracker(self, tenant: int, environment: str) -> _TenantTracker:
+        key = (_resolve_env_key_from_url(get_base_url(environment)), int(tenant))
+        tracker = self._tenants.get(key)
+        if tracker is None:
+            tracker = self._tenants[key] = _TenantTracker(environment, int(tenant))
+        return tracker
+
+    async def watch(self, tenant: int, pairs: Iterable[Pair], environment: str = "production") -> dict[str, Any]:
+        """Add pairs to the tenant's watch set, fetch the new ones now and start the shared poller."""
+
+        tracker = self._tracker(tenant, environment)
+        added = [pair for pair in pairs if tracker.table.watch(pair)]
+        if len(tracker.table.pairs()) > TRACKING_MAX_WATCHES:
+            for pair in added:
+                tracker.table.unwatch(pair)
+            raise ValueError(f"At most {TRACKING_MAX_WATCHES} technician/appointment pairs can be watched per tenant.")
+        if added:
+            await tracker.poll_once()
+        tracker.last_read = time.monotonic()
+        tracker.ensure_polling()
+        return {"added": len(added), "watching": len(tracker.table.pairs())}
+
+    def unwatch(self, tenant: int, pairs: Optional[Iterable[Pair]], environment: str = "production") -> int:
+        tracker = self._tracker(tenant, environment)
+        targets = tracker.table.pairs() if pairs is None else list(pairs)
+        return sum(tracker.table.unwatch(pair) for pair in targets)
+
+    async def changes(self, tenant: int, cursor: Optional[str] = None, environment: str = "production") -> dict[str, Any]:
+        """Pairs whose tracking data changed after ``cursor`` (None for everything) and the next cursor."""
+
+        tracker = self._tracker(tenant, environment)
+        tracker.last_read = time.monotonic()
+        table = tracker.table
+        since = table.parse_cursor(cursor)
+        reset = since is None
+        if reset:
+            # The cursor comes from another process or predates a compaction: send a full snapshot.
+            since = 0
+        if tracker.last_poll is None and table.pairs():
+            await tracker.poll_once()
+        tracker.ensure_polling()
+        changed, removed = table.changes(since)
+        metrics.increment("tracking.reads")
+        return {
+            "cursor": table.cursor,
+            "reset": reset,
+            "polledAt": datetime.fromtimestamp(tracker.last_poll, timezone.utc).isoformat() if tracker.last_poll else None,
+            "watching": len(table.pairs()),
+            "changed": changed,
+            "removed": removed,
+        }
+
+    async def stop(self) -> None:
+        tasks = [t.task for t in self._tenants.values() if t.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+TRACKING = TrackingPoller()
+on_shutdown(TRACKING.stop)
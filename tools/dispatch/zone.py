@@ -1,7 +1,14 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch, make_st_delete
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    make_st_delete,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_dispatch_zone_tools"]
 
@@ -19,12 +26,19 @@ def register_dispatch_zone_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         active: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of zones with filters.
 
         Mirrors Zone_GetList.
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, only active returned by default.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -54,14 +68,14 @@ def register_dispatch_zone_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch zones."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def dispatch_create_zone(
@@ -106,10 +120,7 @@ def register_dispatch_zone_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create zone."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_get_zone(
@@ -129,10 +140,7 @@ def register_dispatch_zone_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch zone."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_update_zone(
@@ -178,10 +186,7 @@ def register_dispatch_zone_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update zone."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def dispatch_delete_zone(
@@ -201,9 +206,6 @@ def register_dispatch_zone_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete zone."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, drain_export, format_response
 
 __all__ = ["register_equipmentsystems_export_tools"]
 
@@ -12,6 +11,11 @@ def register_equipmentsystems_export_tools(mcp: Any) -> None:
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for installed equipment.
@@ -19,6 +23,9 @@ def register_equipmentsystems_export_tools(mcp: Any) -> None:
         Mirrors Export_ExportInstalledEquipment.
         - from_token: continuation token or starting date string (e.g., 2020-01-01)
         - include_recent_changes: if True, recent changes may repeat across requests
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -30,13 +37,13 @@ def register_equipmentsystems_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for installed equipment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_installed_equipment_tools"]
 
@@ -21,12 +27,19 @@ def register_installed_equipment_tools(mcp: Any) -> None:
         include_total: bool = False,
         sort: Optional[str] = None,
         active: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of installed equipment with filters.
 
         Mirrors InstalledEquipment_GetList.
         - active: one of "True", "Any", "False" (case-insensitive)
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -60,14 +73,14 @@ def register_installed_equipment_tools(mcp: Any) -> None:
             else:
                 return "Invalid 'active' value. Use one of: True, Any, False."
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch installed equipment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def equipmentsystems_create_installed_equipment(
@@ -140,10 +153,7 @@ def register_installed_equipment_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create installed equipment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def equipmentsystems_update_installed_equipment(
@@ -213,9 +223,6 @@ def register_installed_equipment_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update installed equipment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_forms_form_submission_tools"]
 
@@ -22,6 +21,10 @@ def register_forms_form_submission_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Retrieve form submissions (paginated) with filters.
@@ -31,6 +34,9 @@ def register_forms_form_submission_tools(mcp: Any) -> None:
         - active: True | Any | False (case-insensitive)
         - owner_type: Job | Call | Customer | Location | Equipment | Technician | JobAppointment | Membership | Truck | Project | ServiceAgreement | InvoiceItem (case-insensitive)
         - owners: list of { type: OwnerType, id: int }
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -96,13 +102,13 @@ def register_forms_form_submission_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch form submissions."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
@@ -1,7 +1,17 @@
-import json
+from pathlib import Path
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post
+from ..blobcache import BLOB_CACHE
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_upload,
+    collect_upload_paths,
+    upload_files,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_forms_jobs_tools"]
 
@@ -25,10 +35,28 @@ def register_forms_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch job attachment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
+
+    @mcp.tool()
+    async def forms_download_job_attachment(
+        tenant: int,
+        id: int,
+        environment: str = "production",
+    ) -> str:
+        """Download a job attachment's file into the local blob cache.
+
+        Mirrors Jobs_Get. Returns path, resource URI, size, SHA-256 and content type;
+        attachments are immutable, so repeat calls are served from the cache.
+        """
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/forms/v2/tenant/{tenant}/jobs/attachment/{id}"
+
+        data = await BLOB_CACHE.fetch(url, tenant, "job-attachment", id)
+        if not data:
+            return "Unable to download job attachment."
+
+        return format_response(data)
 
     @mcp.tool()
     async def forms_create_job_attachment(
@@ -53,10 +81,60 @@ def register_forms_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create job attachment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
+
+    @mcp.tool()
+    async def forms_upload_job_attachment(
+        tenant: int,
+        id: int,
+        path: str,
+        environment: str = "production",
+    ) -> str:
+        """Attach a local file to the specified Job.
+
+        Mirrors Jobs_CreateAttachment. The file is streamed from disk as multipart/form-data.
+        """
+
+        file_path = Path(path).expanduser()
+        if not file_path.is_file():
+            return f"File not found: {path}"
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/forms/v2/tenant/{tenant}/jobs/{id}/attachments"
+
+        data = await make_st_upload(url, file_path)
+        if not data:
+            return "Unable to create job attachment."
+
+        return format_response(data)
+
+    @mcp.tool()
+    async def forms_upload_job_attachments_directory(
+        tenant: int,
+        id: int,
+        directory: str,
+        pattern: str = "*",
+        concurrency: int = 4,
+        environment: str = "production",
+    ) -> str:
+        """Attach every file in a local directory (matching 'pattern') to the specified Job.
+
+        Mirrors Jobs_CreateAttachment once per file, streaming up to 'concurrency' files at a time.
+        Returns the API response per file name plus the names that failed.
+        """
+
+        paths = collect_upload_paths(directory, pattern)
+        if paths is None:
+            return f"Directory not found: {directory}"
+        if not paths:
+            return "No files matched."
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/forms/v2/tenant/{tenant}/jobs/{id}/attachments"
+
+        data = await upload_files(url, paths, concurrency=min(max(concurrency, 1), 16))
+
+        return format_response(data)
 
     @mcp.tool()
     async def forms_get_job_attachments(
@@ -68,11 +146,18 @@ def register_forms_jobs_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get attachments on the specified Job.
 
         Mirrors Jobs_GetJobAttachments.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -92,13 +177,13 @@ def register_forms_jobs_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch job attachments."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
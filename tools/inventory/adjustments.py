@@ -1,7 +1,14 @@
 import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_inventory_adjustments_tools"]
 
@@ -35,6 +42,10 @@ def register_inventory_adjustments_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of inventory adjustments with filters.
@@ -43,6 +54,9 @@ def register_inventory_adjustments_tools(mcp: Any) -> None:
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, API defaults to only active.
         - custom_fields_operator: one of "And", "Or" (case-insensitive).
         - CSV filters (ids, invoice_ids, etc.) should be provided as comma-separated strings.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -114,14 +128,14 @@ def register_inventory_adjustments_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch inventory adjustments."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_adjustments_update_custom_fields(
@@ -147,10 +161,7 @@ def register_inventory_adjustments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update adjustment custom fields."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_adjustments_update(
@@ -198,9 +209,6 @@ def register_inventory_adjustments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update inventory adjustment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, drain_export, format_response
 
 __all__ = ["register_inventory_export_tools"]
 
@@ -12,6 +11,11 @@ def register_inventory_export_tools(mcp: Any) -> None:
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for inventory adjustments.
@@ -19,6 +23,9 @@ def register_inventory_export_tools(mcp: Any) -> None:
         Mirrors Export_Adjustments.
         - from_token: continuation token or starting date string (e.g., 2020-01-01)
         - include_recent_changes: if True, recent changes may repeat across requests
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -30,20 +37,25 @@ def register_inventory_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for Inventory adjustments."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_export_purchase_orders(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for purchase orders.
@@ -51,6 +63,9 @@ def register_inventory_export_tools(mcp: Any) -> None:
         Mirrors Export_PurchaseOrders.
         - from_token: continuation token or starting date string (e.g., 2020-01-01)
         - include_recent_changes: if True, recent changes may repeat across requests
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -62,20 +77,25 @@ def register_inventory_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for Inventory purchase orders."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_export_returns(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for returns.
@@ -83,6 +103,9 @@ def register_inventory_export_tools(mcp: Any) -> None:
         Mirrors Export_Returns.
         - from_token: continuation token or starting date string (e.g., 2020-01-01)
         - include_recent_changes: if True, recent changes may repeat across requests
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -94,20 +117,25 @@ def register_inventory_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for Inventory returns."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_export_transfers(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for transfers.
@@ -115,6 +143,9 @@ def register_inventory_export_tools(mcp: Any) -> None:
         Mirrors Export_Transfers.
         - from_token: continuation token or starting date string (e.g., 2020-01-01)
         - include_recent_changes: if True, recent changes may repeat across requests
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -126,13 +157,13 @@ def register_inventory_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for Inventory transfers."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
@@ -1,7 +1,15 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    fetch_many_by_ids,
+    parse_id_list,
+    format_response,
+)
 
 __all__ = ["register_inventory_purchase_orders_tools"]
 
@@ -38,6 +46,10 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a list of purchase orders (paginated) with filters.
@@ -45,6 +57,9 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         Mirrors PurchaseOrders_GetList.
         - status: one of Pending, Sent, PartiallyReceived, Received, Exported, Canceled (case-insensitive)
         - CSV filters (ids, job_ids) should be provided as comma-separated strings.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -94,14 +109,14 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch purchase orders."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_purchase_orders_create(
@@ -162,10 +177,7 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create purchase order."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_purchase_orders_get_by_id(
@@ -182,10 +194,36 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch purchase order by id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
+
+    @mcp.tool()
+    async def inventory_purchase_orders_get_many(
+        tenant: int,
+        ids: str,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
+        environment: str = "production",
+    ) -> str:
+        """Get many purchase orders by ID in a few batched requests.
+
+        Built on PurchaseOrders_GetList (ids filter). 'ids' is a comma-separated list; hundreds are fine.
+        Results are keyed by id; ids the API did not return are listed under 'missing'.
+        Set compact=True for minified JSON output.
+        Pass fields="id,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
+
+        id_list = parse_id_list(ids)
+        if id_list is None:
+            return "'ids' must be a comma-separated list of integer IDs."
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/inventory/v2/tenant/{tenant}/purchase-orders"
+
+        data = await fetch_many_by_ids(url, id_list)
+        if not data:
+            return "Unable to fetch purchase orders."
+
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_purchase_orders_update(
@@ -255,10 +293,7 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update purchase order."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_purchase_orders_get_requests(
@@ -280,12 +315,19 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a list of purchase order requests (paginated).
 
         Mirrors PurchaseOrders_GetRequests.
         - request_status: one of PendingApproval, Approved, Rejected (case-insensitive)
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -328,14 +370,14 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch purchase order requests."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_purchase_orders_approve_request(
@@ -352,10 +394,7 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         if not data:
             return "Unable to approve purchase order request."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_purchase_orders_reject_request(
@@ -383,10 +422,7 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         if not data:
             return "Unable to reject purchase order request."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_purchase_orders_cancel(
@@ -415,9 +451,6 @@ def register_inventory_purchase_orders_tools(mcp: Any) -> None:
         if not data:
             return "Unable to cancel purchase order."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,4 +1,3 @@
-import json
 from typing import Any, Optional
 
 from ..utils import (
@@ -7,6 +6,8 @@ from ..utils import (
     make_st_post,
     make_st_put,
     make_st_delete,
+    fetch_all_pages,
+    format_response,
 )
 
 __all__ = ["register_inventory_purchase_order_markups_tools"]
@@ -25,11 +26,18 @@ def register_inventory_purchase_order_markups_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of purchase order markups.
 
         Mirrors PurchaseOrdersMarkup_Get.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -55,14 +63,14 @@ def register_inventory_purchase_order_markups_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch purchase order markups."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_purchase_order_markups_create(
@@ -87,10 +95,7 @@ def register_inventory_purchase_order_markups_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create purchase order markup."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_purchase_order_markups_update(
@@ -116,10 +121,7 @@ def register_inventory_purchase_order_markups_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update purchase order markup."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_purchase_order_markups_get_by_id(
@@ -136,10 +138,7 @@ def register_inventory_purchase_order_markups_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch purchase order markup by id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_purchase_order_markups_delete(
@@ -156,9 +155,6 @@ def register_inventory_purchase_order_markups_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete purchase order markup."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
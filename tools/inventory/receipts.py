@@ -1,7 +1,7 @@
 import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post
+from ..utils import get_base_url, make_st_request, make_st_post, fetch_all_pages, format_response
 
 __all__ = ["register_inventory_receipts_tools"]
 
@@ -33,6 +33,10 @@ def register_inventory_receipts_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of receipts with filters.
@@ -41,6 +45,9 @@ def register_inventory_receipts_tools(mcp: Any) -> None:
         - active: one of "True", "Any", "False" (case-insensitive).
         - custom_fields_operator: one of "And", "Or" (case-insensitive).
         - CSV filters (ids, vendor_ids, etc.) should be provided as comma-separated strings.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -106,14 +113,14 @@ def register_inventory_receipts_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch receipts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_receipts_create_receipt(
@@ -148,10 +155,7 @@ def register_inventory_receipts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create receipt."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_receipts_update_custom_fields(
@@ -173,10 +177,7 @@ def register_inventory_receipts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update receipt custom fields."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_receipts_cancel_receipts(
@@ -213,9 +214,6 @@ def register_inventory_receipts_tools(mcp: Any) -> None:
         if not data:
             return "Unable to cancel receipt."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_inventory_return_types_tools"]
 
@@ -34,10 +40,7 @@ def register_inventory_return_types_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create return type."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_return_types_update(
@@ -74,10 +77,7 @@ def register_inventory_return_types_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update return type."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_return_types_get_list(
@@ -92,9 +92,18 @@ def register_inventory_return_types_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of Return Types. Mirrors ReturnTypes_GetList."""
+        """Get a paginated list of Return Types. Mirrors ReturnTypes_GetList.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/inventory/v2/tenant/{tenant}/return-types"
@@ -119,13 +128,13 @@ def register_inventory_return_types_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params)
         if not data:
             return "Unable to fetch return types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
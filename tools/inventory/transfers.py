@@ -1,7 +1,14 @@
 import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_inventory_transfers_tools"]
 
@@ -34,6 +41,10 @@ def register_inventory_transfers_tools(mcp: Any) -> None:
         external_data_application_guid: Optional[str] = None,
         external_data_key: Optional[str] = None,
         external_data_values: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of inventory transfers with filters.
@@ -41,6 +52,9 @@ def register_inventory_transfers_tools(mcp: Any) -> None:
         Mirrors Transfers_GetList.
         - custom_fields_operator: one of "And", "Or" (case-insensitive)
         - CSV filters (ids, statuses, transfer_type_ids, from_location_ids, to_location_ids, sync_statuses) are comma-separated strings
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -103,14 +117,14 @@ def register_inventory_transfers_tools(mcp: Any) -> None:
         if external_data_values:
             params["externalDataValues"] = external_data_values
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch transfers."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_transfers_update_custom_fields(
@@ -132,10 +146,7 @@ def register_inventory_transfers_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update transfer custom fields."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def inventory_transfers_update(
@@ -175,9 +186,6 @@ def register_inventory_transfers_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update transfer."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
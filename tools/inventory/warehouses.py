@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_patch
+from ..utils import get_base_url, make_st_request, make_st_patch, fetch_all_pages, format_response
 
 __all__ = ["register_inventory_warehouses_tools"]
 
@@ -23,12 +22,19 @@ def register_inventory_warehouses_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of warehouses with filters. Mirrors Warehouses_GetList.
 
         - active: one of "True", "Any", "False" (case-insensitive)
         - CSV filters (ids) should be provided as comma-separated strings
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -66,14 +72,14 @@ def register_inventory_warehouses_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch warehouses."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def inventory_warehouses_update(
@@ -113,9 +119,6 @@ def register_inventory_warehouses_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update warehouse."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
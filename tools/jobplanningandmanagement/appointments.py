@@ -1,4 +1,3 @@
-import json
 from typing import Any, Optional, Sequence
 
 from ..utils import (
@@ -7,6 +6,8 @@ from ..utils import (
     make_st_post,
     make_st_delete,
     make_st_patch,
+    fetch_all_pages,
+    format_response,
 )
 
 __all__ = ["register_jobplanningandmanagement_appointments_tools"]
@@ -43,6 +44,10 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         page_size: Optional[int] = None,
         include_total: bool = False,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of appointments with filters.
@@ -50,6 +55,9 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         Mirrors Appointments_GetList.
         - status: one of Scheduled, Dispatched, Working, Hold, Done, Canceled (case-insensitive)
         - CSV filters (ids) should be provided as comma-separated strings.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -97,14 +105,14 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch appointments."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_appointments_add(
@@ -141,10 +149,7 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_appointments_get(
@@ -161,10 +166,7 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch appointment by id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_appointments_delete(
@@ -181,10 +183,7 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to delete appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_appointments_confirm(
@@ -201,10 +200,7 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to confirm appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_appointments_remove_confirmation(
@@ -221,10 +217,7 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to remove appointment confirmation."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_appointments_hold(
@@ -244,10 +237,7 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to put appointment on hold."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_appointments_remove_hold(
@@ -264,10 +254,7 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to remove appointment hold."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_appointments_reschedule(
@@ -301,10 +288,7 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to reschedule appointment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_appointments_update_special_instructions(
@@ -326,9 +310,6 @@ def register_jobplanningandmanagement_appointments_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update appointment special instructions."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
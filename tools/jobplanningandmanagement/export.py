@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, drain_export, format_response
 
 __all__ = ["register_jobplanningandmanagement_export_tools"]
 
@@ -12,6 +11,11 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for appointments.
@@ -19,6 +23,9 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         Mirrors Export_Appointments.
         - from_token: continuation token (or date string to start export from a point in time)
         - include_recent_changes: if True, receive recent changes sooner (results may repeat)
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -30,20 +37,25 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for JPM appointments."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_export_job_cancel_reasons(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for job canceled logs.
@@ -51,6 +63,9 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         Mirrors Export_JobCancelReasons.
         - from_token: continuation token (or date string to start export from a point in time)
         - include_recent_changes: if True, receive recent changes sooner (results may repeat)
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -62,20 +77,25 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for JPM job canceled logs."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_export_job_history(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for job history.
@@ -83,6 +103,9 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         Mirrors Export_JobHistory.
         - from_token: continuation token (or date string to start export from a point in time)
         - include_recent_changes: if True, receive recent changes sooner (results may repeat)
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -94,20 +117,25 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for JPM job history."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_export_job_notes(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for job notes.
@@ -115,6 +143,9 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         Mirrors Export_JobNotes.
         - from_token: continuation token (or date string to start export from a point in time)
         - include_recent_changes: if True, receive recent changes sooner (results may repeat)
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -126,20 +157,25 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for JPM job notes."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_export_jobs(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for jobs.
@@ -147,6 +183,9 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         Mirrors Export_Jobs.
         - from_token: continuation token (or date string to start export from a point in time)
         - include_recent_changes: if True, receive recent changes sooner (results may repeat)
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -158,20 +197,25 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for JPM jobs."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_export_project_notes(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for project notes.
@@ -179,6 +223,9 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         Mirrors Export_ProjectNotes.
         - from_token: continuation token (or date string to start export from a point in time)
         - include_recent_changes: if True, receive recent changes sooner (results may repeat)
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -190,20 +237,25 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for JPM project notes."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_export_projects(
         tenant: int,
         from_token: Optional[str] = None,
         include_recent_changes: bool = False,
+        all_chunks: bool = False,
+        max_items: Optional[int] = None,
+        resume: bool = False,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Export feed for projects.
@@ -211,6 +263,9 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         Mirrors Export_Projects.
         - from_token: continuation token (or date string to start export from a point in time)
         - include_recent_changes: if True, receive recent changes sooner (results may repeat)
+        Set all_chunks=True to follow continueFrom server-side until hasMore is false (budget: max_items); resume=True starts from the token saved by the previous drain.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -222,13 +277,13 @@ def register_jobplanningandmanagement_export_tools(mcp: Any) -> None:
         if include_recent_changes:
             params["includeRecentChanges"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_chunks:
+            data = await drain_export(url, params=params, max_items=max_items, resume=resume)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch export feed for JPM projects."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
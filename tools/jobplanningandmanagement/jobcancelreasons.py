@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_jobplanningandmanagement_job_cancel_reasons_tools"]
 
@@ -19,6 +18,10 @@ def register_jobplanningandmanagement_job_cancel_reasons_tools(mcp: Any) -> None
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of job cancel reasons.
@@ -26,6 +29,9 @@ def register_jobplanningandmanagement_job_cancel_reasons_tools(mcp: Any) -> None
         Mirrors JobCancelReasons_GetList.
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, API returns active and inactive by default.
         - sort: like "+FieldName" or "-FieldName". Allowed: Id, ModifiedOn, CreatedOn
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -55,13 +61,13 @@ def register_jobplanningandmanagement_job_cancel_reasons_tools(mcp: Any) -> None
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch job cancel reasons."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
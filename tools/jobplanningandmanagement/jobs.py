@@ -1,7 +1,16 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..mirror.store import MirrorError, query_mirror, get_mirror_record
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    fetch_many_by_ids,
+    parse_id_list,
+    format_response,
+)
 
 __all__ = ["register_jobplanningandmanagement_jobs_tools"]
 
@@ -53,6 +62,11 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         external_data_key: Optional[str] = None,
         external_data_values: Optional[str] = None,
         has_unused_appointments: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        source: str = "api",
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of jobs with filters.
@@ -63,8 +77,16 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         - priority: one of Low, Normal, High, Urgent (case-insensitive)
         - CSV filters (ids, tag_type_ids, external_data_values) should be provided as comma-separated strings.
         - has_unused_appointments is included only when True.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        source="mirror" answers from the local mirror (see mirror_sync) instead of the API.
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
+        source = (source or "api").strip().lower()
+        if source not in {"api", "mirror"}:
+            return "'source' must be 'api' or 'mirror'."
+
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/jobs"
 
@@ -143,14 +165,19 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if has_unused_appointments:
             params["hasUnusedAppointments"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if source == "mirror":
+            try:
+                data = await query_mirror(tenant, "jobs", environment, params)
+            except MirrorError as exc:
+                return str(exc)
+        elif all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch jobs."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_jobs_update(
@@ -214,19 +241,24 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update job."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_jobs_get(
         tenant: int,
         id: int,
         external_data_application_guid: Optional[str] = None,
+        source: str = "api",
         environment: str = "production",
     ) -> str:
-        """Get a job by ID. Mirrors Jobs_Get."""
+        """Get a job by ID. Mirrors Jobs_Get.
+
+        source="mirror" answers from the local mirror (see mirror_sync) instead of the API.
+        """
+
+        source = (source or "api").strip().lower()
+        if source not in {"api", "mirror"}:
+            return "'source' must be 'api' or 'mirror'."
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/jobs/{id}"
@@ -234,14 +266,46 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if external_data_application_guid:
             params["externalDataApplicationGuid"] = external_data_application_guid
 
-        data = await make_st_request(url, params=params or None)
+        if source == "mirror":
+            try:
+                data = await get_mirror_record(tenant, "jobs", environment, id)
+            except MirrorError as exc:
+                return str(exc)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch job by id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
+
+    @mcp.tool()
+    async def jpm_jobs_get_many(
+        tenant: int,
+        ids: str,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
+        environment: str = "production",
+    ) -> str:
+        """Get many jobs by ID in a few batched requests.
+
+        Built on Jobs_GetList (ids filter). 'ids' is a comma-separated list; hundreds are fine.
+        Results are keyed by id; ids the API did not return are listed under 'missing'.
+        Set compact=True for minified JSON output.
+        Pass fields="id,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
+
+        id_list = parse_id_list(ids)
+        if id_list is None:
+            return "'ids' must be a comma-separated list of integer IDs."
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/jpm/v2/tenant/{tenant}/jobs"
+
+        data = await fetch_many_by_ids(url, id_list)
+        if not data:
+            return "Unable to fetch jobs."
+
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_jobs_get_booked_log(
@@ -258,10 +322,7 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch job booked log."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_jobs_cancel(
@@ -281,10 +342,7 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to cancel job."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_jobs_get_canceled_logs(
@@ -293,9 +351,18 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get canceled logs for a job. Mirrors Jobs_GetJobCanceledLogs."""
+        """Get canceled logs for a job. Mirrors Jobs_GetJobCanceledLogs.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/jobs/{id}/canceled-log"
@@ -308,14 +375,14 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch job canceled logs."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_jobs_get_history(
@@ -332,10 +399,7 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch job history."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_jobs_get_notes(
@@ -344,9 +408,18 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get job notes. Mirrors Jobs_GetNotes."""
+        """Get job notes. Mirrors Jobs_GetNotes.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/jobs/{id}/notes"
@@ -359,14 +432,14 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch job notes."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_jobs_create_note(
@@ -392,10 +465,7 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create job note."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_jobs_remove_cancellation(
@@ -412,10 +482,7 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to remove job cancellation."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_jobs_create(
@@ -480,10 +547,7 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create job."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_jobs_get_cancel_reasons(
@@ -507,10 +571,7 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch job cancel reasons."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_jobs_get_custom_field_types(
@@ -523,9 +584,18 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get job custom field types. Mirrors Jobs_GetCustomFieldTypes."""
+        """Get job custom field types. Mirrors Jobs_GetCustomFieldTypes.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/jobs/custom-fields"
@@ -548,13 +618,13 @@ def register_jobplanningandmanagement_jobs_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch job custom field types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
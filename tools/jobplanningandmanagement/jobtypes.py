@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_jobplanningandmanagement_job_types_tools"]
 
@@ -35,6 +41,10 @@ def register_jobplanningandmanagement_job_types_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         external_data_application_guid: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of job types.
@@ -45,6 +55,9 @@ def register_jobplanningandmanagement_job_types_tools(mcp: Any) -> None:
         - order_by: id | modifiedOn | createdOn
         - order_by_direction: asc|ascending|desc|descending (case-insensitive)
         - CSV filters (ids) should be provided as comma-separated strings.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -94,14 +107,14 @@ def register_jobplanningandmanagement_job_types_tools(mcp: Any) -> None:
         if external_data_application_guid:
             params["externalDataApplicationGuid"] = external_data_application_guid
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch job types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_job_types_create(
@@ -159,10 +172,7 @@ def register_jobplanningandmanagement_job_types_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create job type."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_job_types_update(
@@ -223,10 +233,7 @@ def register_jobplanningandmanagement_job_types_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update job type."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_job_types_get(
@@ -248,9 +255,6 @@ def register_jobplanningandmanagement_job_types_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch job type by id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
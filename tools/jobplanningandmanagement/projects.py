@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_jobplanningandmanagement_projects_tools"]
 
@@ -38,9 +44,18 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         external_data_application_guid: Optional[str] = None,
         external_data_key: Optional[str] = None,
         external_data_values: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of projects with filters. Mirrors Projects_GetList."""
+        """Get a paginated list of projects with filters. Mirrors Projects_GetList.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/projects"
@@ -103,14 +118,14 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         if external_data_values:
             params["externalDataValues"] = external_data_values
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch projects."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_projects_create(
@@ -170,10 +185,7 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create project."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_projects_get_custom_field_types(
@@ -186,9 +198,18 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get project custom field types. Mirrors Projects_GetCustomFieldTypes."""
+        """Get project custom field types. Mirrors Projects_GetCustomFieldTypes.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/projects/custom-fields"
@@ -211,14 +232,14 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch project custom field types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_projects_detach_job(
@@ -235,10 +256,7 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         if not data:
             return "Unable to detach job from project."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_projects_update(
@@ -299,10 +317,7 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update project."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_projects_get(
@@ -324,10 +339,7 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch project by id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_projects_attach_job(
@@ -345,10 +357,7 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         if not data:
             return "Unable to attach job to project."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def jpm_projects_get_notes(
@@ -357,9 +366,18 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get project notes. Mirrors Projects_GetNotes."""
+        """Get project notes. Mirrors Projects_GetNotes.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/projects/{id}/notes"
@@ -372,14 +390,14 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch project notes."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_projects_create_note(
@@ -405,9 +423,6 @@ def register_jobplanningandmanagement_projects_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create project note."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
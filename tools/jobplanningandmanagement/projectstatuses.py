@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_jobplanningandmanagement_project_statuses_tools"]
 
@@ -20,9 +19,18 @@ def register_jobplanningandmanagement_project_statuses_tools(mcp: Any) -> None:
         created_on_or_after: Optional[str] = None,
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of project statuses. Mirrors ProjectStatuses_GetList."""
+        """Get a paginated list of project statuses. Mirrors ProjectStatuses_GetList.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/project-statuses"
@@ -49,14 +57,14 @@ def register_jobplanningandmanagement_project_statuses_tools(mcp: Any) -> None:
         if modified_on_or_after:
             params["modifiedOnOrAfter"] = modified_on_or_after
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch project statuses."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_project_statuses_get(
@@ -73,9 +81,6 @@ def register_jobplanningandmanagement_project_statuses_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch project status by id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
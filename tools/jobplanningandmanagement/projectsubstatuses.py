@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_jobplanningandmanagement_project_substatuses_tools"]
 
@@ -22,9 +21,18 @@ def register_jobplanningandmanagement_project_substatuses_tools(mcp: Any) -> Non
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         active: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of project sub statuses. Mirrors ProjectSubStatuses_GetList."""
+        """Get a paginated list of project sub statuses. Mirrors ProjectSubStatuses_GetList.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/project-substatuses"
@@ -59,14 +67,14 @@ def register_jobplanningandmanagement_project_substatuses_tools(mcp: Any) -> Non
             else:
                 return "Invalid 'active' value. Use one of: True, Any, False."
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch project sub statuses."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_project_substatuses_get(
@@ -83,9 +91,6 @@ def register_jobplanningandmanagement_project_substatuses_tools(mcp: Any) -> Non
         if not data:
             return "Unable to fetch project sub status by id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
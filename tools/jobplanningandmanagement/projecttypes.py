@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_jobplanningandmanagement_project_types_reference_tools"]
 
@@ -13,9 +12,18 @@ def register_jobplanningandmanagement_project_types_reference_tools(mcp: Any) ->
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of project types. Mirrors ProjectTypes_GetList."""
+        """Get a paginated list of project types. Mirrors ProjectTypes_GetList.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/jpm/v2/tenant/{tenant}/project-types"
@@ -28,14 +36,14 @@ def register_jobplanningandmanagement_project_types_reference_tools(mcp: Any) ->
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch project types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def jpm_project_types_get(
@@ -52,9 +60,6 @@ def register_jobplanningandmanagement_project_types_reference_tools(mcp: Any) ->
         if not data:
             return "Unable to fetch project type by id."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -0,0 +1,238 @@
+"""Precomputed tool manifest used to register tool groups lazily.
+
+The manifest stores each tool's name, description and JSON schemas per group,
+along with a hash of every module in the group. At startup, groups whose hashes
+still match are advertised straight from the manifest and only imported when
+one of their tools is first called. Groups whose source changed are introspected
+as usual and their manifest entry is rewritten, so the next start is lazy again.
+
+Build it with ``python -m tools.manifest``; ``--check`` exits non-zero when stale.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
+
+__all__ = [
+    "MANIFEST_VERSION",
+    "get_manifest_path",
+    "load_manifest",
+    "write_manifest",
+    "build_manifest",
+    "module_hashes",
+    "stale_groups",
+    "register_groups",
+]
+
+MANIFEST_VERSION = 2
+LOGGER = logging.getLogger(__name__)
+
+
+def get_manifest_path() -> Path:
+    override = os.environ.get("SERVICETITAN_MCP_TOOL_MANIFEST")
+    if override:
+        return Path(override)
+    return Path(__file__).with_name("tool_manifest.json")
+
+
+def load_manifest(path: Optional[Path] = None) -> Optional[dict[str, Any]]:
+    path = path or get_manifest_path()
+    try:
+        manifest = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        LOGGER.warning("Ignoring unreadable tool manifest %s", path, exc_info=True)
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        LOGGER.warning("Ignoring tool manifest %s with unsupported version", path)
+        return None
+    return manifest
+
+
+def write_manifest(manifest: dict[str, Any], path: Optional[Path] = None) -> Path:
+    path = path or get_manifest_path()
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, separators=(",", ":")))
+    os.replace(tmp, path)
+    return path
+
+
+class _ToolCollector:
+    """Stand-in for FastMCP that records tool functions instead of registering them."""
+
+    def __init__(self) -> None:
+        self.functions: dict[str, Callable[..., Any]] = {}
+
+    def tool(self, name: Optional[str] = None, **_: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            self.functions[name or fn.__name__] = fn
+            return fn
+
+        return decorator
+
+
+def _collect(registrar: Callable[[Any], None]) -> dict[str, Callable[..., Any]]:
+    collector = _ToolCollector()
+    registrar(collector)
+    return collector.functions
+
+
+def _entry(tool: Tool) -> dict[str, Any]:
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "parameters": tool.parameters,
+        "outputSchema": tool.output_schema,
+    }
+
+
+def module_hashes(package_dir: Path) -> dict[str, str]:
+    """SHA-256 of every module in a group package, keyed by relative path."""
+
+    return {
+        path.relative_to(package_dir).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(package_dir.rglob("*.py"))
+    }
+
+
+def _group_entry(package_dir: Path, tools: list[Tool]) -> dict[str, Any]:
+    return {"modules": module_hashes(package_dir), "tools": [_entry(tool) for tool in tools]}
+
+
+def build_manifest(groups: dict[str, tuple[Path, Callable[[Any], None]]]) -> dict[str, Any]:
+    """Introspect every tool of every group and return the manifest document."""
+
+    entries: dict[str, Any] = {}
+    for group, (package_dir, registrar) in groups.items():
+        functions = _collect(registrar)
+        tools = [Tool.from_function(fn, name=name) for name, fn in functions.items()]
+        entries[group] = _group_entry(package_dir, tools)
+    return {"version": MANIFEST_VERSION, "groups": entries}
+
+
+def stale_groups(manifest: Optional[dict[str, Any]], groups: dict[str, tuple[Path, Callable[[Any], None]]]) -> list[str]:
+    known = (manifest or {}).get("groups", {})
+    return [
+        group
+        for group, (package_dir, _) in groups.items()
+        if group not in known or known[group].get("modules") != module_hashes(package_dir)
+    ]
+
+
+class _GroupLoader:
+    """Imports a group on first use and introspects its tools one at a time."""
+
+    def __init__(self, registrar: Callable[[Any], None]) -> None:
+        self._registrar = registrar
+        self._functions: Optional[dict[str, Callable[..., Any]]] = None
+        self._tools: dict[str, Tool] = {}
+
+    def get_tool(self, name: str) -> Tool:
+        tool = self._tools.get(name)
+        if tool is None:
+            if self._functions is None:
+                self._functions = _collect(self._registrar)
+            tool = Tool.from_function(self._functions[name], name=name)
+            self._tools[name] = tool
+        return tool
+
+
+_PLACEHOLDER_METADATA: Optional[FuncMetadata] = None
+
+
+def _placeholder() -> str:
+    return ""
+
+
+def _placeholder_metadata() -> FuncMetadata:
+    global _PLACEHOLDER_METADATA
+    if _PLACEHOLDER_METADATA is None:
+        _PLACEHOLDER_METADATA = func_metadata(_placeholder)
+    return _PLACEHOLDER_METADATA
+
+
+class LazyTool(Tool):
+    """Tool advertised from the manifest; resolves the real tool on first call."""
+
+    loader: Any = None
+    manifest_output_schema: Optional[dict[str, Any]] = None
+
+    @property
+    def output_schema(self) -> Optional[dict[str, Any]]:  # type: ignore[override]
+        return self.manifest_output_schema
+
+    async def run(self, arguments: dict[str, Any], context: Any = None, convert_result: bool = False) -> Any:
+        try:
+            tool = self.loader.get_tool(self.name)
+        except Exception as e:
+            raise ToolError(f"Error loading tool {self.name}: {e}") from e
+        return await tool.run(arguments, context=context, convert_result=convert_result)
+
+
+def _register_lazy_group(mcp: Any, entries: list[dict[str, Any]], registrar: Callable[[Any], None]) -> None:
+    loader = _GroupLoader(registrar)
+    metadata = _placeholder_metadata()
+    # FastMCP has no public hook for pre-built Tool objects, so add them directly.
+    registry = mcp._tool_manager._tools
+    for entry in entries:
+        registry[entry["name"]] = LazyTool(
+            fn=_placeholder,
+            name=entry["name"],
+            description=entry["description"],
+            parameters=entry["parameters"],
+            fn_metadata=metadata,
+            is_async=True,
+            loader=loader,
+            manifest_output_schema=entry.get("outputSchema"),
+        )
+
+
+def register_groups(mcp: Any, groups: dict[str, tuple[Path, Callable[[Any], None]]]) -> None:
+    """Register groups lazily where the manifest is current, eagerly elsewhere.
+
+    Eagerly registered groups are written back to the manifest (best effort).
+    """
+
+    manifest = load_manifest() or {"version": MANIFEST_VERSION, "groups": {}}
+    stale = set(stale_groups(manifest, groups))
+    registry = mcp._tool_manager._tools
+
+    for group, (package_dir, registrar) in groups.items():
+        if group not in stale:
+            _register_lazy_group(mcp, manifest["groups"][group]["tools"], registrar)
+            continue
+        before = set(registry)
+        registrar(mcp)
+        added = [tool for name, tool in registry.items() if name not in before]
+        manifest["groups"][group] = _group_entry(package_dir, added)
+
+    if stale:
+        LOGGER.info("Introspected tool groups with changed sources: %s", ", ".join(sorted(stale)))
+        try:
+            write_manifest(manifest)
+        except OSError:
+            LOGGER.warning("Could not update tool manifest %s", get_manifest_path(), exc_info=True)
+
+
+if __name__ == "__main__":
+    from . import tool_group_sources
+
+    args = [arg for arg in sys.argv[1:] if arg != "--check"]
+    target = Path(args[0]) if args else None
+    sources = tool_group_sources()
+    if "--check" in sys.argv[1:]:
+        stale = stale_groups(load_manifest(target), sources)
+        if stale:
+            sys.exit(f"Tool manifest is stale for: {', '.join(stale)}")
+        print("Tool manifest is up to date")
+    else:
+        print(f"Wrote tool manifest to {write_manifest(build_manifest(sources), target)}")
@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_marketing_campaign_costs_tools"]
 
@@ -17,11 +23,18 @@ def register_marketing_campaign_costs_tools(mcp: Any) -> None:
         month: Optional[int] = None,
         campaign_id: Optional[int] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of campaign costs.
 
         Mirrors CampaignCosts_GetList.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -43,14 +56,14 @@ def register_marketing_campaign_costs_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch campaign costs."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def marketing_campaign_costs_create(
@@ -80,10 +93,7 @@ def register_marketing_campaign_costs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create campaign cost."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def marketing_campaign_costs_update(
@@ -106,10 +116,7 @@ def register_marketing_campaign_costs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update campaign cost."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def marketing_campaign_costs_get(
@@ -129,9 +136,6 @@ def register_marketing_campaign_costs_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch campaign cost by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_marketing_campaigns_tools"]
 
@@ -31,12 +37,19 @@ def register_marketing_campaigns_tools(mcp: Any) -> None:
         created_on_or_after: Optional[str] = None,
         campaign_phone_number: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of campaigns.
 
         Mirrors Campaigns_GetList.
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, API defaults to only active.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -71,14 +84,14 @@ def register_marketing_campaigns_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch campaigns."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def marketing_campaigns_create(
@@ -126,10 +139,7 @@ def register_marketing_campaigns_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create campaign."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def marketing_campaigns_update(
@@ -195,10 +205,7 @@ def register_marketing_campaigns_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update campaign."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def marketing_campaigns_get(
@@ -218,10 +225,7 @@ def register_marketing_campaigns_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch campaign by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def marketing_campaigns_get_costs(
@@ -233,11 +237,18 @@ def register_marketing_campaigns_tools(mcp: Any) -> None:
         year: Optional[int] = None,
         month: Optional[int] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of campaign costs for a campaign.
 
         Mirrors Campaigns_GetCosts.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -257,13 +268,13 @@ def register_marketing_campaigns_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch campaign costs for campaign."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post
+from ..utils import get_base_url, make_st_request, make_st_post, fetch_all_pages, format_response
 
 __all__ = ["register_marketing_suppressions_tools"]
 
@@ -47,12 +46,19 @@ def register_marketing_suppressions_tools(mcp: Any) -> None:
         ids: Optional[str] = None,
         email: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of suppressions.
 
         Mirrors Suppressions_GetList.
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, API defaults to only active.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -85,14 +91,14 @@ def register_marketing_suppressions_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch suppressions."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def marketing_suppressions_add(
@@ -124,10 +130,7 @@ def register_marketing_suppressions_tools(mcp: Any) -> None:
             return "Unable to add suppressions."
 
         # 200 returns empty body; our helper returns {"status": 200} if empty
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def marketing_suppressions_remove(
@@ -153,10 +156,7 @@ def register_marketing_suppressions_tools(mcp: Any) -> None:
         if not data:
             return "Unable to remove suppressions."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def marketing_suppressions_get(
@@ -177,9 +177,6 @@ def register_marketing_suppressions_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch suppression by email."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
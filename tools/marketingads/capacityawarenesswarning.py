@@ -1,7 +1,6 @@
-import json
 from typing import Any
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, format_response
 
 __all__ = ["register_marketingads_capacity_awareness_warning_tools"]
 
@@ -24,9 +23,6 @@ def register_marketingads_capacity_awareness_warning_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch capacity awareness warnings."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
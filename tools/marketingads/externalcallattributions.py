@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_post
+from ..utils import get_base_url, make_st_post, format_response
 
 __all__ = ["register_marketingads_external_call_attributions_tools"]
 
@@ -86,9 +85,6 @@ def register_marketingads_external_call_attributions_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create external call attribution."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_marketingreputation_reviews_tools"]
 
@@ -33,11 +32,18 @@ def register_marketingreputation_reviews_tools(mcp: Any) -> None:
         include_reviews_without_location: bool = False,
         include_reviews_without_campaign: bool = False,
         include_reviews_without_technician: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of reviews with filters.
 
         Mirrors marketingreputation/v2 reviews.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -92,13 +98,13 @@ def register_marketingreputation_reviews_tools(mcp: Any) -> None:
         if include_reviews_without_technician:
             params["includeReviewsWithoutTechnician"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch reviews."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
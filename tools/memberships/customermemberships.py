@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_memberships_customer_memberships_tools"]
 
@@ -40,6 +46,10 @@ def register_memberships_customer_memberships_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of customer memberships with filters.
@@ -48,6 +58,9 @@ def register_memberships_customer_memberships_tools(mcp: Any) -> None:
         - active: one of "True", "Any", "False" (case-insensitive). If omitted, API defaults to only active.
         - status: one of Active, Suspended, Expired, Canceled, Deleted
         - billing_frequency: one of OneTime, Monthly, EveryOtherMonth, Quarterly, BiAnnual, Annual
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -95,14 +108,14 @@ def register_memberships_customer_memberships_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch customer memberships."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def memberships_customer_memberships_get_custom_fields(
@@ -115,11 +128,18 @@ def register_memberships_customer_memberships_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a list of custom field types for customer memberships.
 
         Mirrors CustomerMemberships_GetCustomFields.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -143,14 +163,14 @@ def register_memberships_customer_memberships_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch membership custom field types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def memberships_customer_memberships_create(
@@ -192,10 +212,7 @@ def register_memberships_customer_memberships_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create membership sale invoice."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_customer_memberships_update(
@@ -279,10 +296,7 @@ def register_memberships_customer_memberships_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update customer membership."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_customer_memberships_get(
@@ -302,10 +316,7 @@ def register_memberships_customer_memberships_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch customer membership by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_customer_memberships_get_status_changes(
@@ -325,9 +336,6 @@ def register_memberships_customer_memberships_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch membership status changes."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
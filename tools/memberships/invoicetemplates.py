@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch
+from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch, format_response
 
 __all__ = ["register_memberships_invoice_templates_tools"]
 
@@ -29,10 +28,7 @@ def register_memberships_invoice_templates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create invoice template."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_invoice_templates_update(
@@ -72,10 +68,7 @@ def register_memberships_invoice_templates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update invoice template."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_invoice_templates_get(
@@ -95,10 +88,7 @@ def register_memberships_invoice_templates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch invoice template by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_invoice_templates_get_list(
@@ -122,9 +112,6 @@ def register_memberships_invoice_templates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch invoice templates list."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
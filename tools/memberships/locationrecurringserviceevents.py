@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post
+from ..utils import get_base_url, make_st_request, make_st_post, fetch_all_pages, format_response
 
 __all__ = ["register_memberships_location_recurring_service_events_tools"]
 
@@ -27,12 +26,19 @@ def register_memberships_location_recurring_service_events_tools(mcp: Any) -> No
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of recurring service events.
 
         Mirrors LocationRecurringServiceEvents_GetList.
         - status (follow-up): NotAttempted, Unreachable, Contacted, Won, Dismissed
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -61,14 +67,14 @@ def register_memberships_location_recurring_service_events_tools(mcp: Any) -> No
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch recurring service events."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def memberships_location_recurring_service_events_mark_complete(
@@ -90,10 +96,7 @@ def register_memberships_location_recurring_service_events_tools(mcp: Any) -> No
         if not data:
             return "Unable to mark recurring service event complete."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_location_recurring_service_events_mark_incomplete(
@@ -115,9 +118,6 @@ def register_memberships_location_recurring_service_events_tools(mcp: Any) -> No
         if not data:
             return "Unable to mark recurring service event incomplete."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
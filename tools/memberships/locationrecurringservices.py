@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_patch
+from ..utils import get_base_url, make_st_request, make_st_patch, fetch_all_pages, format_response
 
 __all__ = ["register_memberships_location_recurring_services_tools"]
 
@@ -38,12 +37,19 @@ def register_memberships_location_recurring_services_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of recurring services.
 
         Mirrors LocationRecurringServices_GetList.
         - active: one of "True", "Any", "False" (case-insensitive)
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -76,14 +82,14 @@ def register_memberships_location_recurring_services_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch recurring services."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def memberships_location_recurring_services_update(
@@ -192,10 +198,7 @@ def register_memberships_location_recurring_services_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update recurring service."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_location_recurring_services_get(
@@ -215,9 +218,6 @@ def register_memberships_location_recurring_services_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch recurring service by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
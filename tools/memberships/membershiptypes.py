@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_memberships_membership_types_tools"]
 
@@ -39,6 +38,10 @@ def register_memberships_membership_types_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of membership types.
@@ -46,6 +49,9 @@ def register_memberships_membership_types_tools(mcp: Any) -> None:
         Mirrors MembershipTypes_GetList.
         - active: one of "True", "Any", "False"
         - billing_frequency: OneTime|Monthly|EveryOtherMonth|Quarterly|BiAnnual|Annual
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -86,14 +92,14 @@ def register_memberships_membership_types_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch membership types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def memberships_membership_types_get(
@@ -113,10 +119,7 @@ def register_memberships_membership_types_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch membership type by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_membership_types_get_discounts_list(
@@ -136,10 +139,7 @@ def register_memberships_membership_types_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch membership type discounts."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_membership_types_get_duration_billing_list(
@@ -168,10 +168,7 @@ def register_memberships_membership_types_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch membership type duration/billing items."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def memberships_membership_types_get_recurring_service_items(
@@ -191,9 +188,6 @@ def register_memberships_membership_types_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch membership type recurring service items."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -0,0 +1,19 @@
+"""Process-wide counters for the HTTP layer, reported by ``diagnostics_get_metrics``."""
+
+from typing import Dict
+
+__all__ = ["increment", "snapshot", "reset"]
+
+_COUNTERS: Dict[str, float] = {}
+
+
+def increment(name: str, value: float = 1) -> None:
+    _COUNTERS[name] = _COUNTERS.get(name, 0) + value
+
+
+def snapshot() -> Dict[str, float]:
+    return dict(sorted(_COUNTERS.items()))
+
+
+def reset() -> None:
+    _COUNTERS.clear()
@@ -0,0 +1,10 @@
+from typing import Any
+
+from .sync import register_mirror_sync_tools
+
+__all__ = ["register_mirror_tools"]
+
+
+def register_mirror_tools(mcp: Any) -> None:
+    """Register local mirror tools with the provided MCP server instance."""
+    register_mirror_sync_tools(mcp)
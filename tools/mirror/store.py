@@ -0,0 +1,359 @@
+import json
+import time
+import asyncio
+import sqlite3
+from contextlib import aclosing, closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ..utils import get_base_url, get_state_dir, iter_export_chunks
+
+__all__ = [
+    "MIRROR_ENTITIES",
+    "MirrorError",
+    "sync_mirror_entity",
+    "query_mirror",
+    "get_mirror_record",
+    "get_mirror_status",
+]
+
+
+class MirrorError(Exception):
+    """Raised when a mirror query cannot be answered locally."""
+
+
+@dataclass(frozen=True)
+class MirrorEntity:
+    name: str
+    export_path: str
+    # (column, sqlite type, dotted field path in the export record)
+    columns: tuple[tuple[str, str, str], ...]
+    # list-tool query param -> (column, operator)
+    filters: dict[str, tuple[str, str]]
+    # The list endpoint returns only active records unless 'active' is given.
+    active_by_default: bool = False
+
+
+_COMMON_COLUMNS = (
+    ("active", "INTEGER", "active"),
+    ("created_on", "TEXT", "createdOn"),
+    ("modified_on", "TEXT", "modifiedOn"),
+)
+_COMMON_FILTERS = {
+    "ids": ("id", "in"),
+    "active": ("active", "tristate"),
+    "createdBefore": ("created_on", "lt"),
+    "createdOnOrAfter": ("created_on", "gte"),
+    "modifiedBefore": ("modified_on", "lt"),
+    "modifiedOnOrAfter": ("modified_on", "gte"),
+}
+
+MIRROR_ENTITIES: dict[str, MirrorEntity] = {
+    "customers": MirrorEntity(
+        name="customers",
+        export_path="/crm/v2/tenant/{tenant}/export/customers",
+        columns=(("name", "TEXT", "name"),) + _COMMON_COLUMNS,
+        filters={**_COMMON_FILTERS, "name": ("name", "like")},
+        active_by_default=True,
+    ),
+    "locations": MirrorEntity(
+        name="locations",
+        export_path="/crm/v2/tenant/{tenant}/export/locations",
+        columns=(("name", "TEXT", "name"), ("customer_id", "INTEGER", "customerId")) + _COMMON_COLUMNS,
+        filters={**_COMMON_FILTERS, "name": ("name", "like"), "customerId": ("customer_id", "eq")},
+        active_by_default=True,
+    ),
+    "jobs": MirrorEntity(
+        name="jobs",
+        export_path="/jpm/v2/tenant/{tenant}/export/jobs",
+        columns=(
+            ("job_number", "TEXT", "jobNumber"),
+            ("customer_id", "INTEGER", "customerId"),
+            ("location_id", "INTEGER", "locationId"),
+            ("project_id", "INTEGER", "projectId"),
+            ("job_status", "TEXT", "jobStatus"),
+            ("business_unit_id", "INTEGER", "businessUnitId"),
+            ("job_type_id", "INTEGER", "jobTypeId"),
+            ("completed_on", "TEXT", "completedOn"),
+        )
+        + _COMMON_COLUMNS,
+        filters={
+            **_COMMON_FILTERS,
+            "number": ("job_number", "eq"),
+            "customerId": ("customer_id", "eq"),
+            "locationId": ("location_id", "eq"),
+            "projectId": ("project_id", "eq"),
+            "jobStatus": ("job_status", "eq"),
+            "businessUnitId": ("business_unit_id", "eq"),
+            "jobTypeId": ("job_type_id", "eq"),
+            "completedBefore": ("completed_on", "lt"),
+            "completedOnOrAfter": ("completed_on", "gte"),
+        },
+    ),
+    "invoices": MirrorEntity(
+        name="invoices",
+        export_path="/accounting/v2/tenant/{tenant}/export/invoices",
+        columns=(
+            ("number", "TEXT", "referenceNumber"),
+            ("customer_id", "INTEGER", "customer.id"),
+            ("location_id", "INTEGER", "location.id"),
+            ("job_id", "INTEGER", "job.id"),
+            ("job_number", "TEXT", "job.number"),
+            ("business_unit_id", "INTEGER", "businessUnit.id"),
+            ("invoice_date", "TEXT", "invoiceDate"),
+        )
+        + _COMMON_COLUMNS,
+        filters={
+            **_COMMON_FILTERS,
+            "number": ("number", "eq"),
+            "customerId": ("customer_id", "eq"),
+            "jobId": ("job_id", "eq"),
+            "jobNumber": ("job_number", "eq"),
+            "businessUnitId": ("business_unit_id", "eq"),
+            "invoicedOnOrAfter": ("invoice_date", "gte"),
+            "invoicedOnBefore": ("invoice_date", "lt"),
+        },
+    ),
+}
+
+_OPERATORS = {"eq": "=", "lt": "<", "gte": ">="}
+_TRISTATE = {"true": 1, "false": 0}
+
+
+def _env_key(environment: str) -> str:
+    return "integration" if "integration" in get_base_url(environment) else "production"
+
+
+def _db_path(tenant: int, environment: str) -> Path:
+    return get_state_dir("mirror") / f"{_env_key(environment)}-{int(tenant)}.sqlite3"
+
+
+_INITIALIZED: set[Path] = set()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    initialized = path in _INITIALIZED and path.exists()
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if initialized:
+        return conn
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS sync_state ("
+        "entity TEXT PRIMARY KEY, continue_from TEXT, synced_at REAL, complete INTEGER)"
+    )
+    for entity in MIRROR_ENTITIES.values():
+        cols = ", ".join(f"{col} {kind}" for col, kind, _ in entity.columns)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {entity.name} (id INTEGER PRIMARY KEY, {cols}, data TEXT NOT NULL)")
+        for col, _, _ in entity.columns:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{entity.name}_{col} ON {entity.name} ({col})")
+    conn.commit()
+    _INITIALIZED.add(path)
+    return conn
+
+
+def _extract(record: dict[str, Any], path: str) -> Any:
+    value: Any = record
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def _apply_chunk(path: Path, entity: MirrorEntity, records: list[dict[str, Any]], token: Optional[str], complete: bool) -> int:
+    names = ["id"] + [col for col, _, _ in entity.columns] + ["data"]
+    updates = ", ".join(f"{name} = excluded.{name}" for name in names[1:])
+    sql = (
+        f"INSERT INTO {entity.name} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+        f"ON CONFLICT(id) DO UPDATE SET {updates}"
+    )
+    rows = [
+        [record["id"]] + [_extract(record, field) for _, _, field in entity.columns] + [json.dumps(record)]
+        for record in records
+        if record.get("id") is not None
+    ]
+    with closing(_connect(path)) as conn, conn:
+        conn.executemany(sql, rows)
+        conn.execute(
+            "INSERT INTO sync_state (entity, continue_from, synced_at, complete) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(entity) DO UPDATE SET continue_from = COALESCE(excluded.continue_from, continue_from), "
+            "synced_at = excluded.synced_at, complete = excluded.complete",
+            (entity.name, token, time.time(), int(complete)),
+        )
+    return len(rows)
+
+
+def _read_state(path: Path, entity: str) -> Optional[tuple[Optional[str], float, bool]]:
+    with closing(_connect(path)) as conn:
+        row = conn.execute(
+            "SELECT continue_from, synced_at, complete FROM sync_state WHERE entity = ?", (entity,)
+        ).fetchone()
+    if row is None:
+        return None
+    return row[0], row[1], bool(row[2])
+
+
+async def sync_mirror_entity(tenant: int, entity_name: str, environment: str = "production", full: bool = False) -> dict[str, Any]:
+    """Bring one mirrored entity up to date from its export feed.
+
+    Resumes from the stored ``continueFrom`` token unless ``full`` is set. Each chunk
+    and its token are committed in one transaction, so an interrupted sync resumes
+    without gaps. Raises MirrorError when not even the first chunk could be fetched.
+    """
+
+    entity = MIRROR_ENTITIES.get(entity_name)
+    if entity is None:
+        raise MirrorError(f"Unknown mirror entity '{entity_name}'. Choose from: {', '.join(MIRROR_ENTITIES)}.")
+
+    path = _db_path(tenant, environment)
+    state = await asyncio.to_thread(_read_state, path, entity.name)
+    token = None if full or state is None else state[0]
+    url = f"{get_base_url(environment)}{entity.export_path.format(tenant=tenant)}"
+
+    started = time.perf_counter()
+    upserted = 0
+    chunks = 0
+    complete = False
+    async with aclosing(iter_export_chunks(url, {"includeRecentChanges": True}, from_token=token)) as feed:
+        async for chunk in feed:
+            chunks += 1
+            complete = not chunk.get("hasMore")
+            upserted += await asyncio.to_thread(
+                _apply_chunk, path, entity, chunk.get("data") or [], chunk.get("continueFrom"), complete
+            )
+    if not chunks:
+        raise MirrorError(f"Unable to fetch the {entity.name} export feed; the mirror was not updated.")
+
+    return {
+        "entity": entity.name,
+        "chunks": chunks,
+        "upserted": upserted,
+        "complete": complete,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def _require_synced(conn: sqlite3.Connection, entity: MirrorEntity) -> float:
+    row = conn.execute("SELECT synced_at FROM sync_state WHERE entity = ?", (entity.name,)).fetchone()
+    if row is None:
+        raise MirrorError(f"The {entity.name} mirror has not been synced yet; run mirror_sync first.")
+    return row[0]
+
+
+def _sort_clause(entity: MirrorEntity, sort: Optional[str]) -> str:
+    if not sort:
+        return "id ASC"
+    direction = "DESC" if sort.startswith("-") else "ASC"
+    field = sort.lstrip("+-").strip().lower()
+    columns = {"id": "id"}
+    columns.update({path.replace(".", "").lower(): col for col, _, path in entity.columns})
+    columns.update({col.replace("_", ""): col for col, _, _ in entity.columns})
+    if field not in columns:
+        raise MirrorError(f"Sorting by '{sort}' is not supported with source='mirror'.")
+    return f"{columns[field]} {direction}, id {direction}"
+
+
+async def query_mirror(
+    tenant: int, entity_name: str, environment: str, params: Optional[dict[str, Any]] = None
+) -> dict[str, Any]:
+    """Answer a list query from the local mirror using the list tool's API params.
+
+    Returns the API list shape (``page``, ``pageSize``, ``hasMore``, ``data``) plus
+    ``syncedAt``. Raises MirrorError for unsynced entities or unsupported filters.
+    """
+
+    entity = MIRROR_ENTITIES[entity_name]
+    params = dict(params or {})
+    page = max(int(params.pop("page", None) or 1), 1)
+    page_size = max(int(params.pop("pageSize", None) or 50), 1)
+    include_total = bool(params.pop("includeTotal", False))
+    order_by = _sort_clause(entity, params.pop("sort", None))
+
+    clauses: list[str] = []
+    args: list[Any] = []
+    if entity.active_by_default and "active" not in params:
+        params["active"] = "True"
+    for key, value in params.items():
+        if key not in entity.filters:
+            raise MirrorError(f"Filter '{key}' is not supported with source='mirror'.")
+        column, op = entity.filters[key]
+        if op == "in":
+            try:
+                ids = [int(part) for part in str(value).split(",") if part.strip()]
+            except ValueError:
+                raise MirrorError(f"'{key}' must be a comma-separated list of integer ids, got '{value}'.") from None
+            clauses.append(f"{column} IN ({', '.join('?' * len(ids))})")
+            args.extend(ids)
+        elif op == "like":
+            clauses.append(f"{column} LIKE ?")
+            args.append(f"%{value}%")
+        elif op == "tristate":
+            flag = str(value).strip().lower()
+            if flag != "any":
+                if flag not in _TRISTATE:
+                    raise MirrorError("'active' must be one of: True, Any, False.")
+                clauses.append(f"{column} = ?")
+                args.append(_TRISTATE[flag])
+        else:
+            clauses.append(f"{column} {_OPERATORS[op]} ?")
+            args.append(value)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    def run() -> tuple[Any, list[Any], Optional[int]]:
+        with closing(_connect(_db_path(tenant, environment))) as conn:
+            synced_at = _require_synced(conn, entity)
+            rows = conn.execute(
+                f"SELECT data FROM {entity.name} {where} ORDER BY {order_by} LIMIT ? OFFSET ?",
+                args + [page_size + 1, (page - 1) * page_size],
+            ).fetchall()
+            total = conn.execute(f"SELECT COUNT(*) FROM {entity.name} {where}", args).fetchone()[0] if include_total else None
+        return synced_at, rows, total
+
+    synced_at, rows, total = await asyncio.to_thread(run)
+    result: dict[str, Any] = {
+        "page": page,
+        "pageSize": page_size,
+        "hasMore": len(rows) > page_size,
+        "source": "mirror",
+        "syncedAt": synced_at,
+    }
+    if total is not None:
+        result["totalCount"] = total
+    result["data"] = [json.loads(row[0]) for row in rows[:page_size]]
+    return result
+
+
+async def get_mirror_record(tenant: int, entity_name: str, environment: str, record_id: int) -> Optional[dict[str, Any]]:
+    """Return one mirrored record by id, or None when it is not in the mirror."""
+
+    entity = MIRROR_ENTITIES[entity_name]
+
+    def run() -> Any:
+        with closing(_connect(_db_path(tenant, environment))) as conn:
+            _require_synced(conn, entity)
+            return conn.execute(f"SELECT data FROM {entity.name} WHERE id = ?", (int(record_id),)).fetchone()
+
+    row = await asyncio.to_thread(run)
+    return json.loads(row[0]) if row else None
+
+
+def get_mirror_status(tenant: int, environment: str = "production") -> dict[str, Any]:
+    path = _db_path(tenant, environment)
+    status: dict[str, Any] = {"path": str(path), "entities": {}}
+    with closing(_connect(path)) as conn:
+        for entity in MIRROR_ENTITIES.values():
+            state = conn.execute(
+                "SELECT synced_at, complete FROM sync_state WHERE entity = ?", (entity.name,)
+            ).fetchone()
+            rows = conn.execute(f"SELECT COUNT(*) FROM {entity.name}").fetchone()[0]
+            status["entities"][entity.name] = {
+                "rows": rows,
+                "syncedAt": state[0] if state else None,
+                "complete": bool(state[1]) if state else False,
+            }
+    return status
@@ -0,0 +1,45 @@
+import asyncio
+from typing import Any, Optional
+
+from ..utils import format_response
+from .store import MIRROR_ENTITIES, MirrorError, get_mirror_status, sync_mirror_entity
+
+__all__ = ["register_mirror_sync_tools"]
+
+
+def register_mirror_sync_tools(mcp: Any) -> None:
+    @mcp.tool()
+    async def mirror_sync(
+        tenant: int,
+        entities: Optional[str] = None,
+        full: bool = False,
+        environment: str = "production",
+    ) -> str:
+        """Sync the local mirror from the export feeds.
+
+        'entities' is a comma-separated subset of customers, locations, jobs, invoices (default: all).
+        Incremental by default (resumes from the stored continuation token); full=True re-drains from the start.
+        Once synced, read tools accept source="mirror" to answer from the local tables.
+        """
+
+        names = [n.strip().lower() for n in (entities or "").split(",") if n.strip()] or list(MIRROR_ENTITIES)
+
+        results: list[dict[str, Any]] = []
+        for name in names:
+            try:
+                results.append(await sync_mirror_entity(tenant, name, environment, full=full))
+            except MirrorError as exc:
+                return str(exc)
+
+        return format_response({"results": results})
+
+    @mcp.tool()
+    async def mirror_status(
+        tenant: int,
+        environment: str = "production",
+    ) -> str:
+        """Show row counts and last sync time for each mirrored entity."""
+
+        data = await asyncio.to_thread(get_mirror_status, tenant, environment)
+
+        return format_response(data)
@@ -1,7 +1,14 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch, make_st_delete
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    make_st_delete,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_payroll_gross_pay_items_tools"]
 
@@ -32,12 +39,19 @@ def register_payroll_gross_pay_items_tools(mcp: Any) -> None:
         modified_on_or_before: Optional[str] = None,
         modified_before: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a paginated list of gross pay items.
 
         Mirrors GrossPayItems_GetList.
         - employee_type: Technician | Employee
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -76,14 +90,14 @@ def register_payroll_gross_pay_items_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch gross pay items."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payroll_gross_pay_items_create(
@@ -119,10 +133,7 @@ def register_payroll_gross_pay_items_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create gross pay item."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def payroll_gross_pay_items_update(
@@ -159,10 +170,7 @@ def register_payroll_gross_pay_items_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update gross pay item."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def payroll_gross_pay_items_delete(
@@ -182,9 +190,6 @@ def register_payroll_gross_pay_items_tools(mcp: Any) -> None:
         if not data:
             return "Unable to delete gross pay item."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, format_response
 
 __all__ = ["register_payroll_payroll_adjustments_get_tools"]
 
@@ -41,9 +40,6 @@ def register_payroll_payroll_adjustments_get_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch payroll adjustment by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_payroll_payrolls_tools"]
 
@@ -41,6 +40,10 @@ def register_payroll_payrolls_tools(mcp: Any) -> None:
         created_before: Optional[str] = None,
         created_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a list of employee payrolls.
@@ -48,6 +51,9 @@ def register_payroll_payrolls_tools(mcp: Any) -> None:
         Mirrors Payrolls_GetEmployeePayrolls.
         - status: Pending|Expired|Approved|Paid|Locked
         - active: True|Any|False
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -89,14 +95,14 @@ def register_payroll_payrolls_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch employee payrolls."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payroll_payrolls_get_list(
@@ -115,6 +121,10 @@ def register_payroll_payrolls_tools(mcp: Any) -> None:
         created_before: Optional[str] = None,
         created_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a list of payrolls.
@@ -123,6 +133,9 @@ def register_payroll_payrolls_tools(mcp: Any) -> None:
         - employee_type: Technician|Employee
         - status: Pending|Expired|Approved|Paid|Locked
         - active: True|Any|False
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -169,14 +182,14 @@ def register_payroll_payrolls_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch payrolls."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payroll_payrolls_get_technician_payrolls(
@@ -195,6 +208,10 @@ def register_payroll_payrolls_tools(mcp: Any) -> None:
         created_before: Optional[str] = None,
         created_on_or_after: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a list of technician payrolls.
@@ -202,6 +219,9 @@ def register_payroll_payrolls_tools(mcp: Any) -> None:
         Mirrors Payrolls_GetTechnicianPayrolls.
         - status: Pending|Expired|Approved|Paid|Locked
         - active: True|Any|False
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -243,13 +263,13 @@ def register_payroll_payrolls_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch technician payrolls."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_put
+from ..utils import get_base_url, make_st_request, make_st_put, fetch_all_pages, format_response
 
 __all__ = ["register_payroll_payroll_settings_tools"]
 
@@ -47,10 +46,7 @@ def register_payroll_payroll_settings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update employee payroll settings."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def payroll_payroll_settings_get_employee(
@@ -70,10 +66,7 @@ def register_payroll_payroll_settings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch employee payroll settings."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def payroll_payroll_settings_get_list(
@@ -87,6 +80,10 @@ def register_payroll_payroll_settings_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         active: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets the payroll settings list.
@@ -94,6 +91,9 @@ def register_payroll_payroll_settings_tools(mcp: Any) -> None:
         Mirrors PayrollSettings_GetPayrollSettingsList.
         - employee_type: Technician|Employee
         - active: True|Any|False
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -126,14 +126,14 @@ def register_payroll_payroll_settings_tools(mcp: Any) -> None:
             else:
                 return "Invalid 'active' value. Use one of: True, Any, False."
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch payroll settings list."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payroll_payroll_settings_update_technician(
@@ -167,10 +167,7 @@ def register_payroll_payroll_settings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update technician payroll settings."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def payroll_payroll_settings_get_technician(
@@ -190,9 +187,6 @@ def register_payroll_payroll_settings_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch technician payroll settings."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
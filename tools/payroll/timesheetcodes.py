@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_payroll_timesheet_codes_tools"]
 
@@ -28,6 +27,10 @@ def register_payroll_timesheet_codes_tools(mcp: Any) -> None:
         include_total: bool = False,
         active: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a list of timesheet codes.
@@ -35,6 +38,9 @@ def register_payroll_timesheet_codes_tools(mcp: Any) -> None:
         Mirrors TimesheetCodes_GetList.
         - active: True|Any|False
         - sort: e.g. +CreatedOn, -ModifiedOn
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -63,14 +69,14 @@ def register_payroll_timesheet_codes_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch timesheet codes."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payroll_timesheet_codes_get(
@@ -90,9 +96,6 @@ def register_payroll_timesheet_codes_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch timesheet code by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_payroll_timesheets_tools"]
 
@@ -32,6 +31,10 @@ def register_payroll_timesheets_tools(mcp: Any) -> None:
         started_on: Optional[str] = None,
         ended_on: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a list of job timesheets by multiple jobs.
@@ -40,6 +43,9 @@ def register_payroll_timesheets_tools(mcp: Any) -> None:
         - active: True|Any|False
         - sort: e.g. +CreatedOn, -ModifiedOn
         - job_ids: CSV string
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -76,14 +82,14 @@ def register_payroll_timesheets_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch job timesheets by jobs."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payroll_timesheets_get_job_timesheets(
@@ -101,6 +107,10 @@ def register_payroll_timesheets_tools(mcp: Any) -> None:
         started_on: Optional[str] = None,
         ended_on: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a list of job timesheets.
@@ -108,6 +118,9 @@ def register_payroll_timesheets_tools(mcp: Any) -> None:
         Mirrors Timesheets_GetJobTimesheets.
         - active: True|Any|False
         - sort: e.g. +CreatedOn, -ModifiedOn
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -142,14 +155,14 @@ def register_payroll_timesheets_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch job timesheets."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def payroll_timesheets_get_non_job_timesheets(
@@ -165,6 +178,10 @@ def register_payroll_timesheets_tools(mcp: Any) -> None:
         employee_type: Optional[str] = None,
         active: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Gets a list of non job timesheets for employee.
@@ -173,6 +190,9 @@ def register_payroll_timesheets_tools(mcp: Any) -> None:
         - employee_type: Technician|Employee
         - active: True|Any|False
         - sort: e.g. +CreatedOn, -ModifiedOn
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -210,13 +230,13 @@ def register_payroll_timesheets_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch non job timesheets."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
@@ -9,7 +9,9 @@ from .images import register_pricebook_images_tools
 from .materials import register_pricebook_materials_tools
 from .materialsmarkup import register_pricebook_materials_markup_tools
 from .pricebookbulk import register_pricebook_bulk_tools
+from .search import register_pricebook_search_tools
 from .services import register_pricebook_services_tools
+from .sync import register_pricebook_sync_tools
 
 __all__ = ["register_pricebook_tools"]
 
@@ -24,6 +26,8 @@ def register_pricebook_tools(mcp: Any) -> None:
     register_pricebook_materials_tools(mcp)
     register_pricebook_materials_markup_tools(mcp)
     register_pricebook_bulk_tools(mcp)
+    register_pricebook_search_tools(mcp)
     register_pricebook_services_tools(mcp)
+    register_pricebook_sync_tools(mcp)
 
 
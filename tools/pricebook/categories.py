@@ -1,7 +1,14 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch, make_st_delete
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    make_st_delete,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_pricebook_categories_tools"]
 
@@ -77,10 +84,7 @@ def register_pricebook_categories_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create category."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_categories_get_list(
@@ -95,6 +99,10 @@ def register_pricebook_categories_tools(mcp: Any) -> None:
         created_on_or_after: Optional[str] = None,
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of pricebook categories.
@@ -102,6 +110,9 @@ def register_pricebook_categories_tools(mcp: Any) -> None:
         Mirrors Categories_GetList.
         - category_type: Services|Materials
         - active: True|Any|False
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -135,14 +146,14 @@ def register_pricebook_categories_tools(mcp: Any) -> None:
         if modified_on_or_after:
             params["modifiedOnOrAfter"] = modified_on_or_after
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch categories."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def pricebook_categories_get(
@@ -162,10 +173,7 @@ def register_pricebook_categories_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch category by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_categories_update(
@@ -221,10 +229,7 @@ def register_pricebook_categories_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update category."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_categories_delete(
@@ -244,9 +249,6 @@ def register_pricebook_categories_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete category."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
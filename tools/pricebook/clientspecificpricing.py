@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_patch
+from ..utils import get_base_url, make_st_request, make_st_patch, fetch_all_pages, format_response
 
 __all__ = ["register_pricebook_client_specific_pricing_tools"]
 
@@ -25,12 +24,19 @@ def register_pricebook_client_specific_pricing_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get all client-specific pricing rate sheets.
 
         Mirrors ClientSpecificPricing_GetAllRateSheets.
         - active: True|Any|False
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -53,14 +59,14 @@ def register_pricebook_client_specific_pricing_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch client-specific pricing rate sheets."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def pricebook_client_specific_pricing_update_rate_sheet(
@@ -86,9 +92,6 @@ def register_pricebook_client_specific_pricing_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update client-specific pricing rate sheet."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
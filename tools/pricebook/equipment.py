@@ -1,7 +1,14 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_patch, make_st_delete
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_patch,
+    make_st_delete,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_pricebook_equipment_tools"]
 
@@ -148,10 +155,7 @@ def register_pricebook_equipment_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create equipment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_equipment_get_list(
@@ -169,6 +173,10 @@ def register_pricebook_equipment_tools(mcp: Any) -> None:
         external_data_application_guid: Optional[str] = None,
         external_data_key: Optional[str] = None,
         external_data_values: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """Get a paginated list of equipment.
@@ -176,6 +184,9 @@ def register_pricebook_equipment_tools(mcp: Any) -> None:
         Mirrors Equipment_GetList.
         - active: True|Any|False
         - ids: CSV up to 50
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -212,14 +223,14 @@ def register_pricebook_equipment_tools(mcp: Any) -> None:
         if external_data_values:
             params["externalDataValues"] = external_data_values
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch equipment list."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def pricebook_equipment_get(
@@ -244,10 +255,7 @@ def register_pricebook_equipment_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch equipment by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_equipment_update(
@@ -383,10 +391,7 @@ def register_pricebook_equipment_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update equipment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_equipment_delete(
@@ -406,9 +411,6 @@ def register_pricebook_equipment_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete equipment."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
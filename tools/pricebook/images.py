@@ -1,7 +1,15 @@
-import json
+from pathlib import Path
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_post, make_st_request
+from ..utils import (
+    get_base_url,
+    make_st_post,
+    make_st_request,
+    make_st_upload,
+    collect_upload_paths,
+    upload_files,
+    format_response,
+)
 
 __all__ = ["register_pricebook_images_tools"]
 
@@ -30,10 +38,59 @@ def register_pricebook_images_tools(mcp: Any) -> None:
         if not data:
             return "Unable to upload image."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
+
+    @mcp.tool()
+    async def pricebook_images_upload_file(
+        tenant: int,
+        path: str,
+        environment: str = "production",
+    ) -> str:
+        """Upload a local image file to temporary storage.
+
+        Mirrors Images_Post. The file is streamed from disk as multipart/form-data,
+        so it never passes through the conversation as base64.
+        """
+
+        file_path = Path(path).expanduser()
+        if not file_path.is_file():
+            return f"File not found: {path}"
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/pricebook/v2/tenant/{tenant}/images"
+
+        data = await make_st_upload(url, file_path)
+        if not data:
+            return "Unable to upload image."
+
+        return format_response(data)
+
+    @mcp.tool()
+    async def pricebook_images_upload_directory(
+        tenant: int,
+        directory: str,
+        pattern: str = "*",
+        concurrency: int = 4,
+        environment: str = "production",
+    ) -> str:
+        """Upload every image in a local directory (matching 'pattern', e.g. "*.jpg").
+
+        Mirrors Images_Post once per file, streaming up to 'concurrency' files at a time.
+        Returns the API response per file name plus the names that failed.
+        """
+
+        paths = collect_upload_paths(directory, pattern)
+        if paths is None:
+            return f"Directory not found: {directory}"
+        if not paths:
+            return "No files matched."
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/pricebook/v2/tenant/{tenant}/images"
+
+        data = await upload_files(url, paths, concurrency=min(max(concurrency, 1), 16))
+
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_images_get(
@@ -57,9 +114,6 @@ def register_pricebook_images_tools(mcp: Any) -> None:
         if not data:
             return "Unable to get image path."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -0,0 +1,226 @@
+"""In-memory search index over the local pricebook snapshot.
+
+Built per tenant and entity from ``load_snapshot`` and rebuilt only when an
+incremental ``refresh_snapshot`` reports changes. Rows are kept as tuples in a list;
+the token index maps each word of code, name, display name and vendor part numbers to
+a sorted ``array('I')`` of row numbers. Prefix lookups bisect sorted key lists: the
+token vocabulary, and compact (alphanumeric-only) codes and vendor part numbers.
+"""
+
+import re
+import time
+import heapq
+import asyncio
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, NamedTuple, Optional
+
+from ..utils import _env_int
+from .snapshot import PricebookSyncError, _tenant_dir, load_snapshot, refresh_snapshot
+
+__all__ = ["SEARCH_ENTITIES", "PricebookIndex", "search_pricebook"]
+
+SEARCH_ENTITIES = ("materials", "services", "equipment")
+# Seconds before a search first pulls the export feed's recent changes.
+INDEX_MAX_AGE = _env_int("SERVICETITAN_MCP_PRICEBOOK_INDEX_MAX_AGE", 900)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+# Exact code, code prefix, vendor part prefix, words only.
+_RANK_CODE, _RANK_CODE_PREFIX, _RANK_VENDOR_PREFIX, _RANK_WORDS = range(4)
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _compact(text: str) -> str:
+    return "".join(_tokens(text))
+
+
+class _Row(NamedTuple):
+    id: int
+    code: str
+    name: str
+    price: Any
+    active: bool
+    vendor_parts: tuple[str, ...]
+
+
+def _vendor_parts(record: dict[str, Any]) -> tuple[str, ...]:
+    vendors = [record.get("primaryVendor")] + list(record.get("otherVendors") or [])
+    return tuple(
+        dict.fromkeys(
+            str(v["vendorPart"]) for v in vendors if isinstance(v, dict) and v.get("vendorPart")
+        )
+    )
+
+
+def _prefix_range(keys: list[str], prefix: str) -> range:
+    start = bisect_left(keys, prefix)
+    end = bisect_left(keys, prefix + "\uffff", start)
+    return range(start, end)
+
+
+class PricebookIndex:
+    def __init__(self, entity: str, records: Iterable[dict[str, Any]], synced_at: Optional[float]) -> None:
+        self.entity = entity
+        self.synced_at = synced_at
+        self.rows: list[_Row] = []
+        postings: dict[str, list[int]] = {}
+        codes: list[tuple[str, int]] = []
+        parts: list[tuple[str, int]] = []
+
+        # Rows are numbered in name order, so ties within a rank sort by row number.
+        def order(record: dict[str, Any]) -> tuple[str, str]:
+            return str(record.get("displayName") or record.get("name") or "").lower(), str(record.get("code") or "")
+
+        for record in sorted(records, key=order):
+            row = len(self.rows)
+            item = _Row(
+                id=record["id"],
+                code=str(record.get("code") or ""),
+                name=str(record.get("displayName") or record.get("name") or ""),
+                price=record.get("price"),
+                active=bool(record.get("active", True)),
+                vendor_parts=_vendor_parts(record),
+            )
+            self.rows.append(item)
+            words = " ".join((item.code, item.name, str(record.get("name") or ""), *item.vendor_parts))
+            for token in set(_tokens(words)):
+                postings.setdefault(token, []).append(row)
+            if item.code:
+                codes.append((_compact(item.code), row))
+            parts.extend((_compact(part), row) for part in item.vendor_parts)
+
+        self.active = bytearray(row.active for row in self.rows)
+        self.vocabulary = sorted(postings)
+        self.postings = {token: array("I", postings[token]) for token in self.vocabulary}
+        codes.sort()
+        parts.sort()
+        self.code_keys = [key for key, _ in codes]
+        self.code_rows = array("I", (row for _, row in codes))
+        self.part_keys = [key for key, _ in parts]
+        self.part_rows = array("I", (row for _, row in parts))
+
+    def _word_matches(self, tokens: list[str]) -> set[int]:
+        matched: Optional[set[int]] = None
+        for position, token in enumerate(tokens):
+            rows: set[int] = set()
+            if position == len(tokens) - 1:
+                # The last word may still be being typed.
+                for index in _prefix_range(self.vocabulary, token):
+                    rows.update(self.postings[self.vocabulary[index]])
+            else:
+                rows.update(self.postings.get(token, ()))
+            matched = rows if matched is None else matched & rows
+            if not matched:
+                return set()
+        return matched or set()
+
+    def search(self, query: str) -> dict[int, int]:
+        """Return {row: rank} for rows matching every word of ``query`` or prefixing a code/part number."""
+
+        ranks: dict[int, int] = {}
+        key = _compact(query)
+        if not key:
+            return ranks
+        for index in _prefix_range(self.code_keys, key):
+            row = self.code_rows[index]
+            ranks[row] = _RANK_CODE if self.code_keys[index] == key else _RANK_CODE_PREFIX
+        for index in _prefix_range(self.part_keys, key):
+            ranks.setdefault(self.part_rows[index], _RANK_VENDOR_PREFIX)
+        for row in self._word_matches(_tokens(query)):
+            ranks.setdefault(row, _RANK_WORDS)
+        return ranks
+
+
+# (tenant dir, entity) -> index
+_INDEXES: dict[tuple[str, str], PricebookIndex] = {}
+_LOCKS: dict[tuple[str, str], asyncio.Lock] = {}
+# (tenant dir, entity) -> time of the last incomplete refresh; no new drain within max_age.
+_FAILED_AT: dict[tuple[str, str], float] = {}
+
+
+async def _get_index(tenant: int, entity: str, environment: str, max_age: float, refresh: bool) -> PricebookIndex:
+    key = (str(_tenant_dir(tenant, environment)), entity)
+    async with _LOCKS.setdefault(key, asyncio.Lock()):
+        index = _INDEXES.get(key)
+        # Parsing a snapshot can take a while for large catalogs; keep it off the loop.
+        snapshot = await asyncio.to_thread(load_snapshot, tenant, entity, environment)
+        stale = not snapshot["syncedAt"] or time.time() - snapshot["syncedAt"] > max_age
+        recently_failed = time.time() - _FAILED_AT.get(key, 0) <= max_age
+        if refresh or (stale and not recently_failed):
+            result = await refresh_snapshot(tenant, entity, environment)
+            if result["complete"]:
+                _FAILED_AT.pop(key, None)
+            else:
+                _FAILED_AT[key] = time.time()
+            snapshot = await asyncio.to_thread(load_snapshot, tenant, entity, environment)
+            if index is not None and not result["changed"]:
+                index.synced_at = snapshot["syncedAt"]
+        if not snapshot["syncedAt"]:
+            raise PricebookSyncError(
+                f"Unable to load the {entity} pricebook from the export feed; try again later or with refresh=True."
+            )
+        if index is None or index.synced_at != snapshot["syncedAt"]:
+            records = list(snapshot["records"].values())
+            index = await asyncio.to_thread(PricebookIndex, entity, records, snapshot["syncedAt"])
+            _INDEXES[key] = index
+        return index
+
+
+async def search_pricebook(
+    tenant: int,
+    query: str,
+    entities: Iterable[str] = SEARCH_ENTITIES,
+    environment: str = "production",
+    limit: int = 20,
+    active_only: bool = True,
+    max_age: float = INDEX_MAX_AGE,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    """Search the indexed snapshot, refreshing it first if older than ``max_age`` seconds.
+
+    Raises ``PricebookSyncError`` when an entity has never been synced and its export fails.
+    A failed refresh is not retried within ``max_age`` unless ``refresh`` is set.
+    """
+
+    limit = max(limit, 1)
+
+    indexes = await asyncio.gather(
+        *(_get_index(tenant, entity, environment, max_age, refresh) for entity in entities)
+    )
+
+    started = time.perf_counter()
+    total = 0
+    candidates: list[tuple[int, str, str, PricebookIndex, _Row]] = []
+    for index in indexes:
+        ranks = index.search(query)
+        if active_only:
+            active = index.active
+            ranks = {row: rank for row, rank in ranks.items() if active[row]}
+        total += len(ranks)
+        for row, rank in heapq.nsmallest(limit, ranks.items(), key=lambda hit: (hit[1], hit[0])):
+            item = index.rows[row]
+            candidates.append((rank, item.name.lower(), item.code, index, item))
+    candidates.sort(key=lambda hit: hit[:3])
+    took = time.perf_counter() - started
+
+    return {
+        "query": query,
+        "total": total,
+        "tookMs": round(took * 1000, 3),
+        "syncedAt": {index.entity: index.synced_at for index in indexes},
+        "data": [
+            {
+                "entity": index.entity,
+                "id": item.id,
+                "code": item.code,
+                "name": item.name,
+                "price": item.price,
+                "active": item.active,
+                "vendorParts": list(item.vendor_parts),
+            }
+            for _, _, _, index, item in candidates[:limit]
+        ],
+    }
@@ -1,4 +1,3 @@
-import json
 from typing import Any, Optional, Sequence
 
 from ..utils import (
@@ -7,6 +6,8 @@ from ..utils import (
     make_st_post,
     make_st_patch,
     make_st_delete,
+    fetch_all_pages,
+    format_response,
 )
 
 __all__ = ["register_pricebook_materials_tools"]
@@ -40,6 +41,10 @@ def register_pricebook_materials_tools(mcp: Any) -> None:
         external_data_application_guid: Optional[str] = None,
         external_data_key: Optional[str] = None,
         external_data_values: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """List materials with filters and pagination.
@@ -47,6 +52,9 @@ def register_pricebook_materials_tools(mcp: Any) -> None:
         Mirrors Materials_GetList.
         - active: True|Any|False
         - ids, cost_type_ids: CSV strings
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         base_url = get_base_url(environment)
@@ -87,14 +95,14 @@ def register_pricebook_materials_tools(mcp: Any) -> None:
         if external_data_values:
             params["externalDataValues"] = external_data_values
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch materials."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def pricebook_materials_create(
@@ -213,10 +221,7 @@ def register_pricebook_materials_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create material."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_materials_get_cost_types(
@@ -235,10 +240,7 @@ def register_pricebook_materials_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch material cost types."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_materials_get(
@@ -263,10 +265,7 @@ def register_pricebook_materials_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch material by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_materials_update(
@@ -384,10 +383,7 @@ def register_pricebook_materials_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update material."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_materials_delete(
@@ -407,9 +403,6 @@ def register_pricebook_materials_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete material."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
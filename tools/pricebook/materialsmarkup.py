@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_put
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_put,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_pricebook_materials_markup_tools"]
 
@@ -12,9 +18,18 @@ def register_pricebook_materials_markup_tools(mcp: Any) -> None:
         tenant: int,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get materials markup collection (MaterialsMarkup_GetList)."""
+        """Get materials markup collection (MaterialsMarkup_GetList).
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/pricebook/v2/tenant/{tenant}/materialsmarkup"
@@ -25,14 +40,14 @@ def register_pricebook_materials_markup_tools(mcp: Any) -> None:
         if page_size is not None:
             params["pageSize"] = page_size
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch materials markup."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def pricebook_materials_markup_create(
@@ -59,10 +74,7 @@ def register_pricebook_materials_markup_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create materials markup."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_materials_markup_update(
@@ -89,10 +101,7 @@ def register_pricebook_materials_markup_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update materials markup."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_materials_markup_get(
@@ -109,9 +118,6 @@ def register_pricebook_materials_markup_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch materials markup by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
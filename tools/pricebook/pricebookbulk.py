@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_post, make_st_put
+from ..utils import get_base_url, make_st_post, make_st_put, format_response
 
 __all__ = ["register_pricebook_bulk_tools"]
 
@@ -35,10 +34,7 @@ def register_pricebook_bulk_tools(mcp: Any) -> None:
         if not data:
             return "Unable to perform pricebook bulk update."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_bulk_create(
@@ -68,9 +64,6 @@ def register_pricebook_bulk_tools(mcp: Any) -> None:
         if not data:
             return "Unable to perform pricebook bulk create."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
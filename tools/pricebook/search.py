@@ -0,0 +1,50 @@
+from typing import Any, Optional
+
+from ..utils import format_response
+from .index import SEARCH_ENTITIES, search_pricebook
+from .snapshot import PricebookSyncError
+
+__all__ = ["register_pricebook_search_tools"]
+
+
+def register_pricebook_search_tools(mcp: Any) -> None:
+    @mcp.tool()
+    async def pricebook_search(
+        tenant: int,
+        query: str,
+        entities: Optional[str] = None,
+        limit: int = 20,
+        active_only: bool = True,
+        refresh: bool = False,
+        environment: str = "production",
+    ) -> str:
+        """Search materials, services and equipment by code, name or vendor part number.
+
+        Answers from an in-memory index of the local pricebook snapshot (see pricebook_sync_snapshot).
+        The first search drains the export feeds; later ones only pull recent changes once the
+        snapshot is older than SERVICETITAN_MCP_PRICEBOOK_INDEX_MAX_AGE seconds, or when refresh=True.
+        Exact and prefix code matches rank first, then vendor part prefixes, then word matches
+        (the last word also matches as a prefix). 'entities' is a comma-separated subset.
+        """
+
+        names = [n.strip().lower() for n in (entities or "").split(",") if n.strip()] or list(SEARCH_ENTITIES)
+        unknown = [n for n in names if n not in SEARCH_ENTITIES]
+        if unknown:
+            return f"Unknown pricebook entity '{unknown[0]}'. Choose from: {', '.join(SEARCH_ENTITIES)}."
+        if not query.strip():
+            return "Query must not be empty."
+
+        try:
+            data = await search_pricebook(
+                tenant,
+                query,
+                names,
+                environment=environment,
+                limit=min(max(limit, 1), 200),
+                active_only=active_only,
+                refresh=refresh,
+            )
+        except PricebookSyncError as exc:
+            return str(exc)
+
+        return format_response(data)
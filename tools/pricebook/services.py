@@ -1,4 +1,3 @@
-import json
 from typing import Any, Optional, Sequence
 
 from ..utils import (
@@ -7,6 +6,8 @@ from ..utils import (
     make_st_post,
     make_st_patch,
     make_st_delete,
+    fetch_all_pages,
+    format_response,
 )
 
 __all__ = ["register_pricebook_services_tools"]
@@ -118,10 +119,7 @@ def register_pricebook_services_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create service."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_services_get_list(
@@ -140,9 +138,18 @@ def register_pricebook_services_tools(mcp: Any) -> None:
         external_data_application_guid: Optional[str] = None,
         external_data_key: Optional[str] = None,
         external_data_values: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get list of services (Services_GetList)."""
+        """Get list of services (Services_GetList).
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/pricebook/v2/tenant/{tenant}/services"
@@ -180,14 +187,14 @@ def register_pricebook_services_tools(mcp: Any) -> None:
         if external_data_values:
             params["externalDataValues"] = external_data_values
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch services."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def pricebook_services_get(
@@ -212,10 +219,7 @@ def register_pricebook_services_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch service by ID."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_services_update(
@@ -315,10 +319,7 @@ def register_pricebook_services_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update service."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def pricebook_services_delete(
@@ -335,9 +336,6 @@ def register_pricebook_services_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete service."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
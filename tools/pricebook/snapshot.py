@@ -0,0 +1,283 @@
+"""Local pricebook snapshot and catalog diff/sync engine.
+
+The snapshot holds every material, service, equipment item and category of a
+tenant, drained from the pricebook export feeds and refreshed incrementally from the
+stored continuation token. A catalog file from an external system is diffed against
+it by hashing each record over the fields the catalog supplies, and only the
+differences are pushed as chunked PricebookBulk create/update requests. The plan is
+saved with per-chunk progress so a failed sync can resume where it stopped.
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import tempfile
+from contextlib import aclosing
+from pathlib import Path
+from typing import Any, Optional
+
+from ..scheduler import BULK, request_priority
+from ..utils import get_base_url, get_state_dir, iter_export_chunks, make_st_post, make_st_put
+
+__all__ = [
+    "PRICEBOOK_SNAPSHOT_ENTITIES",
+    "SYNC_ENTITIES",
+    "PricebookSyncError",
+    "load_snapshot",
+    "refresh_snapshot",
+    "load_catalog",
+    "diff_catalog",
+    "build_plan",
+    "save_plan",
+    "load_plan",
+    "run_plan",
+]
+
+PRICEBOOK_SNAPSHOT_ENTITIES = ("materials", "services", "equipment", "categories")
+# Entities PricebookBulk can create/update; the catalog file uses the same keys.
+SYNC_ENTITIES = ("materials", "services", "equipment")
+# Server-managed fields never compared or sent.
+_READ_ONLY_FIELDS = frozenset({"id", "createdOn", "modifiedOn", "createdById"})
+
+# (path) -> (mtime, snapshot); snapshots can run to tens of MB, so keep them parsed.
+_LOADED: dict[Path, tuple[float, dict[str, Any]]] = {}
+
+
+class PricebookSyncError(Exception):
+    """Raised when a catalog sync cannot be planned or resumed."""
+
+
+def _tenant_dir(tenant: int, environment: str) -> Path:
+    env_key = "integration" if "integration" in get_base_url(environment) else "production"
+    return get_state_dir("pricebook", f"{env_key}-{int(tenant)}")
+
+
+def _write_json(path: Path, data: Any) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _read_snapshot(path: Path) -> dict[str, Any]:
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return {"continueFrom": None, "syncedAt": None, "records": {}}
+    cached = _LOADED.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, json.loads(path.read_text()))
+        _LOADED[path] = cached
+    return cached[1]
+
+
+def load_snapshot(tenant: int, entity: str, environment: str = "production") -> dict[str, Any]:
+    """Return ``{continueFrom, syncedAt, records: {id: record}}`` (empty if never refreshed)."""
+
+    return _read_snapshot(_tenant_dir(tenant, environment) / f"{entity}.json")
+
+
+async def refresh_snapshot(tenant: int, entity: str, environment: str = "production", full: bool = False) -> dict[str, Any]:
+    """Apply the export feed to the snapshot, from the stored token unless ``full``.
+
+    The snapshot is only saved when the feed was drained to the end (``complete``);
+    after a failed export the stored snapshot and token are left as they were.
+    """
+
+    if entity not in PRICEBOOK_SNAPSHOT_ENTITIES:
+        raise PricebookSyncError(
+            f"Unknown pricebook entity '{entity}'. Choose from: {', '.join(PRICEBOOK_SNAPSHOT_ENTITIES)}."
+        )
+
+    path = _tenant_dir(tenant, environment) / f"{entity}.json"
+    current = await asyncio.to_thread(_read_snapshot, path)
+    records: dict[str, Any] = {} if full else dict(current["records"])
+    token = None if full else current.get("continueFrom")
+    url = f"{get_base_url(environment)}/pricebook/v2/tenant/{tenant}/export/{entity}"
+
+    started = time.perf_counter()
+    chunks = 0
+    changed = 0
+    complete = False
+    async with aclosing(iter_export_chunks(url, {"includeRecentChanges": True}, from_token=token)) as feed:
+        async for chunk in feed:
+            chunks += 1
+            for record in chunk.get("data") or []:
+                if isinstance(record, dict) and record.get("id") is not None:
+                    records[str(record["id"])] = record
+                    changed += 1
+            token = chunk.get("continueFrom") or token
+            complete = not chunk.get("hasMore")
+
+    if complete:
+        snapshot = {"continueFrom": token, "syncedAt": time.time(), "records": records}
+        await asyncio.to_thread(_write_json, path, snapshot)
+        _LOADED[path] = (path.stat().st_mtime, snapshot)
+
+    return {
+        "entity": entity,
+        "chunks": chunks,
+        "changed": changed,
+        "records": len(records),
+        "complete": complete,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def load_catalog(catalog_path: str) -> dict[str, list[dict[str, Any]]]:
+    """Read a catalog file: ``{"materials": [...], "services": [...], "equipment": [...]}``.
+
+    Records use the API field names and are matched to the snapshot by ``code``.
+    """
+
+    path = Path(catalog_path).expanduser()
+    try:
+        catalog = json.loads(path.read_text())
+    except FileNotFoundError:
+        raise PricebookSyncError(f"Catalog file not found: {catalog_path}") from None
+    except ValueError as exc:
+        raise PricebookSyncError(f"Catalog file is not valid JSON: {exc}") from None
+    if not isinstance(catalog, dict) or not any(key in catalog for key in SYNC_ENTITIES):
+        raise PricebookSyncError(f"Catalog must be an object with any of: {', '.join(SYNC_ENTITIES)}.")
+    return {key: list(catalog.get(key) or []) for key in SYNC_ENTITIES if key in catalog}
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _record_hash(record: dict[str, Any], keys: list[str]) -> str:
+    return hashlib.sha1(_canonical([record.get(key) for key in keys]).encode()).hexdigest()
+
+
+def diff_catalog(
+    entity: str,
+    catalog_records: list[dict[str, Any]],
+    snapshot_records: dict[str, Any],
+    deactivate_missing: bool = False,
+) -> dict[str, Any]:
+    """Compute the minimal creates and partial updates turning the snapshot into the catalog."""
+
+    by_code = {
+        str(record.get("code")).strip(): record
+        for record in snapshot_records.values()
+        if isinstance(record, dict) and record.get("code")
+    }
+
+    creates: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    unchanged = 0
+    invalid: list[int] = []
+    seen: set[str] = set()
+
+    for index, item in enumerate(catalog_records):
+        code = str(item.get("code") or "").strip() if isinstance(item, dict) else ""
+        if not code:
+            invalid.append(index)
+            continue
+        seen.add(code)
+        existing = by_code.get(code)
+        body = {key: value for key, value in item.items() if key not in _READ_ONLY_FIELDS}
+        if existing is None:
+            creates.append(body)
+            continue
+        keys = sorted(body)
+        if _record_hash(body, keys) == _record_hash(existing, keys):
+            unchanged += 1
+            continue
+        changed = {key: body[key] for key in keys if _canonical(body[key]) != _canonical(existing.get(key))}
+        updates.append({"id": existing["id"], **changed})
+
+    deactivated = 0
+    if deactivate_missing:
+        for code, record in by_code.items():
+            if code not in seen and record.get("active", True):
+                updates.append({"id": record["id"], "active": False})
+                deactivated += 1
+
+    return {
+        "entity": entity,
+        "creates": creates,
+        "updates": updates,
+        "unchanged": unchanged,
+        "deactivated": deactivated,
+        "invalid": invalid,
+    }
+
+
+def build_plan(diffs: list[dict[str, Any]], chunk_size: int, catalog_sha256: str) -> dict[str, Any]:
+    chunk_size = max(chunk_size, 1)
+    chunks: list[dict[str, Any]] = []
+    for diff in diffs:
+        for method, records in (("POST", diff["creates"]), ("PUT", diff["updates"])):
+            for start in range(0, len(records), chunk_size):
+                chunks.append(
+                    {"entity": diff["entity"], "method": method, "records": records[start : start + chunk_size], "done": False}
+                )
+    summary = {
+        diff["entity"]: {
+            "creates": len(diff["creates"]),
+            "updates": len(diff["updates"]) - diff["deactivated"],
+            "deactivations": diff["deactivated"],
+            "unchanged": diff["unchanged"],
+            "invalid": diff["invalid"],
+        }
+        for diff in diffs
+    }
+    return {"catalogSha256": catalog_sha256, "createdAt": time.time(), "summary": summary, "chunks": chunks}
+
+
+def _plan_path(tenant: int, environment: str) -> Path:
+    return _tenant_dir(tenant, environment) / "sync_plan.json"
+
+
+def save_plan(tenant: int, environment: str, plan: dict[str, Any]) -> None:
+    _write_json(_plan_path(tenant, environment), plan)
+
+
+def load_plan(tenant: int, environment: str) -> Optional[dict[str, Any]]:
+    try:
+        return json.loads(_plan_path(tenant, environment).read_text())
+    except FileNotFoundError:
+        return None
+
+
+async def run_plan(tenant: int, environment: str, plan: dict[str, Any], concurrency: int = 4) -> dict[str, Any]:
+    """Send the plan's pending chunks, saving progress after each one."""
+
+    url = f"{get_base_url(environment)}/pricebook/v2/tenant/{tenant}/pricebook"
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    pending = [chunk for chunk in plan["chunks"] if not chunk["done"]]
+    failed = 0
+    started = time.perf_counter()
+    # Progress is saved from every push; one writer at a time.
+    save_lock = asyncio.Lock()
+
+    async def push(chunk: dict[str, Any]) -> None:
+        nonlocal failed
+        send = make_st_post if chunk["method"] == "POST" else make_st_put
+        async with semaphore:
+            with request_priority(BULK):
+                data = await send(url, json_body={chunk["entity"]: chunk["records"]})
+        if data is None:
+            failed += 1
+            return
+        chunk["done"] = True
+        async with save_lock:
+            await asyncio.to_thread(save_plan, tenant, environment, plan)
+
+    await asyncio.gather(*(push(chunk) for chunk in pending))
+
+    return {
+        "chunksSent": len(pending) - failed,
+        "chunksFailed": failed,
+        "recordsSent": sum(len(c["records"]) for c in pending if c["done"]),
+        "complete": failed == 0,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
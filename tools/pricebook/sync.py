@@ -0,0 +1,103 @@
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Any, Optional
+
+from ..utils import format_response
+from .snapshot import (
+    PRICEBOOK_SNAPSHOT_ENTITIES,
+    PricebookSyncError,
+    build_plan,
+    diff_catalog,
+    load_catalog,
+    load_plan,
+    load_snapshot,
+    refresh_snapshot,
+    run_plan,
+    save_plan,
+)
+
+__all__ = ["register_pricebook_sync_tools"]
+
+
+def register_pricebook_sync_tools(mcp: Any) -> None:
+    @mcp.tool()
+    async def pricebook_sync_snapshot(
+        tenant: int,
+        entities: Optional[str] = None,
+        full: bool = False,
+        environment: str = "production",
+    ) -> str:
+        """Refresh the local pricebook snapshot from the export feeds.
+
+        'entities' is a comma-separated subset of materials, services, equipment, categories (default: all).
+        Incremental by default (continues from the stored continuation token); full=True re-drains.
+        An entity whose export fails reports complete=false and keeps its previous snapshot.
+        """
+
+        names = [n.strip().lower() for n in (entities or "").split(",") if n.strip()] or list(PRICEBOOK_SNAPSHOT_ENTITIES)
+
+        try:
+            results = await asyncio.gather(*(refresh_snapshot(tenant, name, environment, full=full) for name in names))
+        except PricebookSyncError as exc:
+            return str(exc)
+
+        return format_response({"results": list(results)})
+
+    @mcp.tool()
+    async def pricebook_sync_catalog(
+        tenant: int,
+        catalog_path: str,
+        dry_run: bool = False,
+        deactivate_missing: bool = False,
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        resume: bool = False,
+        environment: str = "production",
+    ) -> str:
+        """Sync an external catalog file into the pricebook with minimal bulk requests.
+
+        The catalog is a JSON object {"materials": [...], "services": [...], "equipment": [...]} of
+        records in API shape, matched to existing items by 'code'. The local snapshot is refreshed
+        first, each record is diffed by hash, and only new items (PricebookBulk_Create) and changed
+        fields (PricebookBulk_Update) are sent in chunks of 'chunk_size', 'concurrency' at a time.
+        deactivate_missing=True also deactivates active items absent from the catalog.
+        dry_run=True returns the plan summary without sending anything.
+        resume=True re-sends only the chunks that failed in the last run of the same catalog.
+        """
+
+        try:
+            catalog = await asyncio.to_thread(load_catalog, catalog_path)
+        except PricebookSyncError as exc:
+            return str(exc)
+        catalog_sha256 = hashlib.sha256(Path(catalog_path).expanduser().read_bytes()).hexdigest()
+
+        plan = await asyncio.to_thread(load_plan, tenant, environment) if resume else None
+        if resume and (plan is None or plan.get("catalogSha256") != catalog_sha256):
+            return "No saved sync plan for this catalog; run without resume=True."
+
+        if plan is None:
+            try:
+                refreshed = await asyncio.gather(*(refresh_snapshot(tenant, entity, environment) for entity in catalog))
+            except PricebookSyncError as exc:
+                return str(exc)
+            # Diffing against a partial snapshot would re-create existing items and deactivate live ones.
+            incomplete = [result["entity"] for result in refreshed if not result["complete"]]
+            if incomplete:
+                return f"Unable to refresh the pricebook snapshot for {', '.join(incomplete)}; nothing was sent."
+            snapshots = await asyncio.gather(
+                *(asyncio.to_thread(load_snapshot, tenant, entity, environment) for entity in catalog)
+            )
+            diffs = [
+                diff_catalog(entity, records, snapshot["records"], deactivate_missing)
+                for (entity, records), snapshot in zip(catalog.items(), snapshots)
+            ]
+            plan = build_plan(diffs, chunk_size, catalog_sha256)
+            await asyncio.to_thread(save_plan, tenant, environment, plan)
+
+        pending = [chunk for chunk in plan["chunks"] if not chunk["done"]]
+        data: dict[str, Any] = {"summary": plan["summary"], "chunksPending": len(pending)}
+        if not dry_run and pending:
+            data["result"] = await run_plan(tenant, environment, plan, concurrency=min(max(concurrency, 1), 16))
+
+        return format_response(data)
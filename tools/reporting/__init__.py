@@ -3,6 +3,7 @@ from typing import Any
 from .dynamicvaluesets import register_reporting_dynamic_value_sets_tools
 from .reportcategories import register_reporting_report_categories_tools
 from .reportcategoryreports import register_reporting_report_category_reports_tools
+from .reportsnapshots import register_reporting_report_snapshots_tools
 
 __all__ = ["register_reporting_tools"]
 
@@ -12,5 +13,6 @@ def register_reporting_tools(mcp: Any) -> None:
     register_reporting_dynamic_value_sets_tools(mcp)
     register_reporting_report_categories_tools(mcp)
     register_reporting_report_category_reports_tools(mcp)
+    register_reporting_report_snapshots_tools(mcp)
 
 
@@ -0,0 +1,316 @@
+"""Export every page of a report's data to a columnar file in the spool.
+
+Report data comes back as ``fields`` plus row arrays. ``export_report`` asks for
+``includeTotal`` on the first page to plan the page count, fetches the remaining
+pages a few at a time in the bulk lane, and appends them in page order to an Arrow
+IPC (or Parquet) file when ``pyarrow`` is installed, else to a gzipped CSV. Number
+columns are written as int64 until a non-integral value shows up, at which point the
+column (and anything already written) is widened to float64. Per-column statistics
+are gathered while writing, so callers get a spool handle and a summary instead of
+the rows.
+"""
+
+import os
+import csv
+import gzip
+import time
+import asyncio
+import logging
+import tempfile
+from typing import Any, Optional, Sequence
+
+from ..scheduler import BULK, request_priority
+from ..utils import _env_int, get_state_dir, make_st_post, spool_file
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # optional; CSV is written instead
+    pyarrow = None
+
+__all__ = ["REPORT_EXPORT_FORMATS", "ReportExportError", "export_report"]
+
+LOGGER = logging.getLogger(__name__)
+
+REPORT_EXPORT_FORMATS = ("auto", "arrow", "parquet", "csv")
+REPORT_PAGE_SIZE = 5000
+REPORT_EXPORT_CONCURRENCY = _env_int("SERVICETITAN_MCP_REPORT_CONCURRENCY", 4)
+# Distinct values tracked per text column before reporting a lower bound.
+_DISTINCT_CAP = 1000
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+_CONTENT_TYPES = {
+    "arrow": "application/vnd.apache.arrow.file",
+    "parquet": "application/vnd.apache.parquet",
+    "csv": "text/csv+gzip",
+}
+
+
+class ReportExportError(Exception):
+    """Raised when a report cannot be exported in the requested format."""
+
+
+def _to_number(value: Any) -> int | float | None:
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    text = str(value).strip()
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _fits_int64(value: int | float) -> bool:
+    if isinstance(value, float):
+        return value.is_integer() and _INT64_MIN <= value <= _INT64_MAX
+    return _INT64_MIN <= value <= _INT64_MAX
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    return value if isinstance(value, bool) else None
+
+
+def _to_text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class _Column:
+    def __init__(self, field: dict[str, Any]) -> None:
+        self.name = str(field.get("name") or "")
+        self.label = field.get("label")
+        self.data_type = str(field.get("dataType") or "String")
+        self.convert = {"Number": _to_number, "Boolean": _to_bool}.get(self.data_type, _to_text)
+        # Number columns stay int64 until a value does not fit.
+        self.integral = self.data_type == "Number"
+        self.count = 0
+        self.nulls = 0
+        self.minimum: Any = None
+        self.maximum: Any = None
+        self.total: int | float = 0
+        self.distinct: set[Any] = set()
+        self.distinct_capped = False
+
+    def observe(self, values: list[Any]) -> None:
+        present = [v for v in values if v is not None]
+        self.nulls += len(values) - len(present)
+        self.count += len(present)
+        if not present:
+            return
+        if self.data_type == "Number":
+            self.total += sum(present)
+        if self.data_type != "Boolean":
+            low, high = min(present), max(present)
+            self.minimum = low if self.minimum is None else min(self.minimum, low)
+            self.maximum = high if self.maximum is None else max(self.maximum, high)
+        if self.data_type != "Number" and not self.distinct_capped:
+            self.distinct.update(present)
+            if len(self.distinct) > _DISTINCT_CAP:
+                self.distinct_capped = True
+                self.distinct.clear()
+
+    def summary(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"name": self.name, "label": self.label, "dataType": self.data_type}
+        data["count"] = self.count
+        data["nulls"] = self.nulls
+        if self.data_type != "Boolean":
+            data["min"] = self.minimum
+            data["max"] = self.maximum
+        if self.data_type == "Number":
+            data["sum"] = self.total
+            data["mean"] = self.total / self.count if self.count else None
+        else:
+            data["distinct"] = f">{_DISTINCT_CAP}" if self.distinct_capped else len(self.distinct)
+        return data
+
+
+class _ReportWriter:
+    """Convert row pages to typed columns, update their stats and append them to the file."""
+
+    def __init__(self, fmt: str, fd: int, path: str, columns: list[_Column]) -> None:
+        self.fmt = fmt
+        self.path = path
+        self.columns = columns
+        self._sink: Any = None
+        if fmt == "csv":
+            self._fh = gzip.open(os.fdopen(fd, "wb"), "wt", newline="", compresslevel=6)
+            self._csv = csv.writer(self._fh)
+            self._csv.writerow([column.name for column in columns])
+            return
+        self._open(os.fdopen(fd, "wb"))
+
+    def _open(self, fh: Any) -> None:
+        types = {"Boolean": pyarrow.bool_()}
+        self.schema = pyarrow.schema(
+            [
+                pyarrow.field(
+                    column.name,
+                    (pyarrow.int64() if column.integral else pyarrow.float64())
+                    if column.data_type == "Number"
+                    else types.get(column.data_type, pyarrow.string()),
+                )
+                for column in self.columns
+            ]
+        )
+        self._fh = fh
+        if self.fmt == "parquet":
+            self._sink = pyarrow.parquet.ParquetWriter(fh, self.schema, compression="zstd")
+        else:
+            options = pyarrow.ipc.IpcWriteOptions(compression="zstd")
+            self._sink = pyarrow.ipc.new_file(fh, self.schema, options=options)
+
+    def _widen(self) -> None:
+        """Rewrite what was written so far with the current (wider) column types."""
+
+        self._sink.close()
+        self._fh.close()
+        if self.fmt == "parquet":
+            table = pyarrow.parquet.read_table(self.path)
+        else:
+            with pyarrow.OSFile(self.path, "rb") as source:
+                table = pyarrow.ipc.open_file(source).read_all()
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".part")
+        self._open(os.fdopen(fd, "wb"))
+        table = table.cast(self.schema)
+        if table.num_rows:
+            self._sink.write_table(table)
+        os.replace(tmp, self.path)
+
+    def write(self, rows: list[Any]) -> None:
+        values = [
+            [column.convert(row[index] if index < len(row) else None) for row in rows]
+            for index, column in enumerate(self.columns)
+        ]
+        widened = False
+        for index, column in enumerate(self.columns):
+            if not column.integral:
+                continue
+            if all(v is None or _fits_int64(v) for v in values[index]):
+                values[index] = [v if v is None else int(v) for v in values[index]]
+            else:
+                column.integral = False
+                widened = True
+        for column, column_values in zip(self.columns, values):
+            column.observe(column_values)
+        if self.fmt == "csv":
+            self._csv.writerows(zip(*values))
+            return
+        if widened:
+            self._widen()
+        batch = pyarrow.record_batch(
+            [pyarrow.array(column_values, type=field.type) for column_values, field in zip(values, self.schema)],
+            schema=self.schema,
+        )
+        if self.fmt == "parquet":
+            self._sink.write_batch(batch)
+        else:
+            self._sink.write(batch)
+
+    def close(self) -> None:
+        if self._sink is not None:
+            self._sink.close()
+        self._fh.close()
+
+
+async def export_report(
+    url: str,
+    parameters: Sequence[dict[str, Any]],
+    *,
+    fmt: str = "auto",
+    page_size: int = REPORT_PAGE_SIZE,
+    concurrency: int = REPORT_EXPORT_CONCURRENCY,
+) -> dict[str, Any] | None:
+    """Fetch all pages of ``url`` (a report ``/data`` endpoint) into a spooled columnar file.
+
+    Returns ``{format, path, uri, sha256, bytes, contentType, rows, totalCount, pages,
+    pagesFetched, complete, columns: [stats...]}``; None if the first page fails. A
+    failure on a later page keeps the rows written so far and reports ``nextPage``.
+    """
+
+    if fmt == "auto":
+        fmt = "arrow" if pyarrow is not None else "csv"
+    if fmt in ("arrow", "parquet") and pyarrow is None:
+        raise ReportExportError(f"Format '{fmt}' requires pyarrow; install it or use format='csv'.")
+
+    body = {"parameters": list(parameters)}
+    page_size = max(page_size, 1)
+
+    async def fetch(page: int) -> Any:
+        params: dict[str, Any] = {"page": page, "pageSize": page_size}
+        if page == 1:
+            params["includeTotal"] = True
+        with request_priority(BULK):
+            return await make_st_post(url, json_body=body, params=params)
+
+    started = time.perf_counter()
+    first = await fetch(1)
+    if not first:
+        return None
+
+    total = first.get("totalCount")
+    pages = max(-(-int(total) // page_size), 1) if total is not None else None
+    columns = [_Column(field) for field in first.get("fields") or []]
+
+    fd, tmp = tempfile.mkstemp(dir=get_state_dir("spool"), suffix=".part")
+    writer = _ReportWriter(fmt, fd, tmp, columns)
+    rows = 0
+    pages_fetched = 1
+    next_page = 2
+    has_more = bool(first.get("hasMore"))
+    failed = False
+    pending: dict[int, asyncio.Task[Any]] = {}
+    window = max(concurrency, 1)
+
+    try:
+        data = first.get("data") or []
+        await asyncio.to_thread(writer.write, data)
+        rows += len(data)
+        while has_more and (pages is None or next_page <= pages):
+            last = next_page + window - 1 if pages is None else min(next_page + window - 1, pages)
+            for page in range(next_page, last + 1):
+                if page not in pending:
+                    pending[page] = asyncio.create_task(fetch(page))
+
+            result = await pending.pop(next_page)
+            if not result:
+                LOGGER.warning("Stopped exporting report %s at page %s", url, next_page)
+                failed = True
+                break
+            data = result.get("data") or []
+            await asyncio.to_thread(writer.write, data)
+            rows += len(data)
+            pages_fetched += 1
+            has_more = bool(result.get("hasMore"))
+            next_page += 1
+    except BaseException:
+        writer.close()
+        os.unlink(tmp)
+        raise
+    finally:
+        for task in pending.values():
+            task.cancel()
+
+    await asyncio.to_thread(writer.close)
+    spooled = await asyncio.to_thread(spool_file, tmp)
+
+    result: dict[str, Any] = {
+        "format": fmt,
+        **spooled,
+        "contentType": _CONTENT_TYPES[fmt],
+        "rows": rows,
+        "totalCount": total,
+        "pages": pages,
+        "pagesFetched": pages_fetched,
+        "complete": not failed,
+    }
+    if failed:
+        result["nextPage"] = next_page
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    result["columns"] = [column.summary() for column in columns]
+    return result
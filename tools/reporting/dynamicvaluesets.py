@@ -1,7 +1,7 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, fetch_all_pages, format_response
+from .metadata import REPORT_METADATA
 
 __all__ = ["register_reporting_dynamic_value_sets_tools"]
 
@@ -14,11 +14,20 @@ def register_reporting_dynamic_value_sets_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """List values for a given dynamic value set (key and display name).
 
         Mirrors DynamicValueSets_GetDynamicSet.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items);
+        without max_items or paging arguments the full set is served from the report metadata cache.
+        Set compact=True for minified JSON output.
+        Rows are arrays described by the response's 'fields' header; pass fields="<column>,<column>"
+        with names from that header to return only those columns.
         """
 
         if not dynamic_set_id:
@@ -35,13 +44,15 @@ def register_reporting_dynamic_value_sets_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages and not params and max_items is None:
+            data = await REPORT_METADATA.value_set(tenant, dynamic_set_id, environment)
+        elif all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch dynamic value set."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
 
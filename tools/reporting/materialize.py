@@ -0,0 +1,274 @@
+"""Materialized report snapshots kept fresh by a background worker.
+
+Operators register a (tenant, category, report id, parameters) set with a refresh
+interval. ``ReportMaterializer`` persists the registrations in
+``<state dir>/reports/materialized.json``. One asyncio task refreshes due entries one
+at a time in the bulk lane, so they queue behind interactive calls and use the
+tenant's rate budget like any other bulk work. Each refresh merges every page and
+writes it atomically to ``reports/snapshots/<key>.json``. ``reporting_get_report_data``
+serves a matching snapshot together with its ``asOf`` time. A failed refresh is
+retried with exponential backoff, capped at the interval.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import hashlib
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from .. import metrics
+from ..scheduler import BULK, request_priority
+from ..utils import _resolve_env_key_from_url, get_base_url, get_state_dir, make_st_post, on_shutdown
+from .columnar import REPORT_PAGE_SIZE
+
+__all__ = ["ReportMaterializer", "MATERIALIZER", "snapshot_key"]
+
+LOGGER = logging.getLogger(__name__)
+
+# Pages merged into one snapshot (REPORT_PAGE_SIZE rows each).
+MATERIALIZE_MAX_PAGES = 20
+MATERIALIZE_MIN_INTERVAL = 60
+# Longest the worker sleeps before re-reading its schedule.
+_MAX_IDLE = 300.0
+
+
+def _report_url(entry: dict[str, Any]) -> str:
+    base_url = get_base_url(entry["environment"])
+    return (
+        f"{base_url}/reporting/v2/tenant/{entry['tenant']}/report-category/"
+        f"{entry['reportCategory']}/reports/{entry['reportId']}/data"
+    )
+
+
+def snapshot_key(
+    tenant: int, report_category: str, report_id: int, parameters: Sequence[dict[str, Any]], environment: str
+) -> str:
+    env_key = _resolve_env_key_from_url(get_base_url(environment))
+    params = sorted((str(p.get("name")), p.get("value")) for p in parameters)
+    canonical = json.dumps([env_key, int(tenant), report_category, int(report_id), params], default=str)
+    return hashlib.sha1(canonical.encode()).hexdigest()[:16]
+
+
+def _write_json(path: Path, data: Any) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _iso(epoch: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat() if epoch else None
+
+
+class ReportMaterializer:
+    def __init__(self) -> None:
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._refreshing: dict[str, asyncio.Task[Optional[dict[str, Any]]]] = {}
+        self._worker: Optional[asyncio.Task[None]] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._save_lock = asyncio.Lock()
+
+    @staticmethod
+    def _registry_path() -> Path:
+        return get_state_dir("reports") / "materialized.json"
+
+    @staticmethod
+    def _snapshot_path(key: str) -> Path:
+        return get_state_dir("reports", "snapshots") / f"{key}.json"
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self._registry_path().read_text()).get("entries", {})
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError):
+                LOGGER.warning("Ignoring unreadable report materialization registry", exc_info=True)
+                self._entries = {}
+        return self._entries
+
+    async def _save(self) -> None:
+        # Copied on the loop so the worker thread never sees the registry mid-update.
+        entries = {key: dict(entry) for key, entry in self._load().items()}
+        async with self._save_lock:
+            await asyncio.to_thread(_write_json, self._registry_path(), {"entries": entries})
+
+    def _next_due(self, entry: dict[str, Any]) -> float:
+        if entry.get("failures"):
+            backoff = min(entry["interval"], 60 * 2 ** (entry["failures"] - 1))
+            return entry.get("lastAttempt", 0) + backoff
+        return (entry.get("asOf") or 0) + entry["interval"]
+
+    async def register(
+        self,
+        tenant: int,
+        report_category: str,
+        report_id: int,
+        parameters: Sequence[dict[str, Any]],
+        interval: float,
+        environment: str = "production",
+    ) -> dict[str, Any]:
+        key = snapshot_key(tenant, report_category, report_id, parameters, environment)
+        entries = self._load()
+        entry = {
+            "key": key,
+            "environment": environment,
+            "tenant": int(tenant),
+            "reportCategory": report_category,
+            "reportId": int(report_id),
+            "parameters": list(parameters),
+            "interval": max(float(interval), MATERIALIZE_MIN_INTERVAL),
+            "asOf": None,
+            "failures": 0,
+        }
+        # Re-registering changes the interval but keeps the existing snapshot state.
+        previous = entries.get(key, {})
+        entry.update({k: previous[k] for k in ("asOf", "failures", "lastAttempt", "lastError", "rows") if k in previous})
+        entries[key] = entry
+        await self._save()
+        self.start()
+        return self.describe(entry)
+
+    async def unregister(self, key: str) -> bool:
+        entry = self._load().pop(key, None)
+        if entry is None:
+            return False
+        await self._save()
+        self._snapshots.pop(key, None)
+        self._snapshot_path(key).unlink(missing_ok=True)
+        return True
+
+    def find(
+        self, tenant: int, report_category: str, report_id: int, parameters: Sequence[dict[str, Any]], environment: str
+    ) -> Optional[dict[str, Any]]:
+        return self._load().get(snapshot_key(tenant, report_category, report_id, parameters, environment))
+
+    def describe(self, entry: dict[str, Any]) -> dict[str, Any]:
+        data = {k: v for k, v in entry.items() if k not in ("asOf", "lastAttempt")}
+        data["asOf"] = _iso(entry.get("asOf"))
+        data["nextRefresh"] = _iso(max(self._next_due(entry), time.time()))
+        return data
+
+    def entries(self) -> list[dict[str, Any]]:
+        return [self.describe(entry) for entry in self._load().values()]
+
+    def snapshot(self, key: str) -> Optional[dict[str, Any]]:
+        cached = self._snapshots.get(key)
+        if cached is None:
+            try:
+                cached = json.loads(self._snapshot_path(key).read_text())
+            except (FileNotFoundError, ValueError):
+                return None
+            self._snapshots[key] = cached
+        return cached
+
+    async def _fetch(self, entry: dict[str, Any]) -> Optional[dict[str, Any]]:
+        url = _report_url(entry)
+        body = {"parameters": entry["parameters"]}
+        rows: list[Any] = []
+        fields: Any = None
+        total = None
+        has_more = True
+        page = 0
+        with request_priority(BULK):
+            while has_more and page < MATERIALIZE_MAX_PAGES:
+                page += 1
+                params: dict[str, Any] = {"page": page, "pageSize": REPORT_PAGE_SIZE}
+                if page == 1:
+                    params["includeTotal"] = True
+                data = await make_st_post(url, json_body=body, params=params)
+                if not data:
+                    return None
+                if page == 1:
+                    fields = data.get("fields")
+                    total = data.get("totalCount")
+                rows.extend(data.get("data") or [])
+                has_more = bool(data.get("hasMore"))
+        return {"fields": fields, "totalCount": total, "hasMore": has_more, "data": rows}
+
+    async def _refresh(self, key: str) -> Optional[dict[str, Any]]:
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        started = time.monotonic()
+        entry["lastAttempt"] = time.time()
+        try:
+            data = await self._fetch(entry)
+        except Exception:
+            LOGGER.warning("Refreshing materialized report %s failed", key, exc_info=True)
+            data = None
+
+        if data is None:
+            entry["failures"] = entry.get("failures", 0) + 1
+            entry["lastError"] = "Unable to fetch report data."
+            metrics.increment("report_snapshots.failures")
+            await self._save()
+            return None
+
+        as_of = time.time()
+        snapshot = {"asOf": _iso(as_of), "materialized": key, **data}
+        await asyncio.to_thread(_write_json, self._snapshot_path(key), snapshot)
+        self._snapshots[key] = snapshot
+        entry.update({"asOf": as_of, "failures": 0, "rows": len(data["data"])})
+        entry.pop("lastError", None)
+        await self._save()
+        metrics.increment("report_snapshots.refreshes")
+        metrics.increment("report_snapshots.refresh_seconds", time.monotonic() - started)
+        return snapshot
+
+    async def refresh(self, key: str) -> Optional[dict[str, Any]]:
+        """Refresh one snapshot now; concurrent callers share the same refresh."""
+
+        task = self._refreshing.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(key))
+            self._refreshing[key] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while True:
+            self._wake.clear()
+            entries = self._load()
+            for key in [k for k, e in entries.items() if self._next_due(e) <= time.time()]:
+                await self.refresh(key)
+            now = time.time()
+            idle = min((self._next_due(e) - now for e in entries.values()), default=_MAX_IDLE)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=min(max(idle, 1.0), _MAX_IDLE))
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Start the worker on the running loop if there is anything to refresh."""
+
+        if not self._load():
+            return
+        if self._worker is None or self._worker.done():
+            self._wake = asyncio.Event()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        else:
+            assert self._wake is not None
+            self._wake.set()
+
+    async def stop(self) -> None:
+        tasks = [task for task in (self._worker, *self._refreshing.values()) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+
+
+MATERIALIZER = ReportMaterializer()
+on_shutdown(MATERIALIZER.stop)
@@ -0,0 +1,248 @@
+"""Cached report descriptions and dynamic value sets, and local parameter validation.
+
+Both are keyed by URL, which already carries host, tenant, category and report id.
+A fresh entry (younger than ``REPORT_METADATA_TTL``) is returned as is. A stale entry
+that is younger than ``REPORT_METADATA_MAX_STALE`` is also returned immediately,
+while one background task per key refetches it. Only entries older than that block
+on the API.
+
+``prepare_parameters`` checks report parameters against the description before
+anything is posted. It resolves names case-insensitively and coerces values to the
+declared ``dataType``, wrapping scalars for ``isArray``. It maps display names in
+``acceptValues`` (static or dynamic set) to their keys and reports unknown, missing
+or invalid parameters in one message. Values missing from a truncated dynamic set
+are passed through unchecked.
+"""
+
+import re
+import time
+import asyncio
+import difflib
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from .. import metrics
+from ..utils import _env_int, fetch_all_pages, get_base_url, make_st_request, on_shutdown
+
+__all__ = [
+    "REPORT_METADATA_TTL",
+    "ReportMetadataCache",
+    "REPORT_METADATA",
+    "ReportParameterError",
+    "prepare_parameters",
+]
+
+REPORT_METADATA_TTL = _env_int("SERVICETITAN_MCP_REPORT_METADATA_TTL", 3600)
+REPORT_METADATA_MAX_STALE = _env_int("SERVICETITAN_MCP_REPORT_METADATA_MAX_STALE", 86400)
+# Dynamic value sets are fetched whole for validation; larger sets are truncated and
+# then only used to map display names, not to reject values.
+_VALUE_SET_MAX_ITEMS = 10000
+
+_TIME_RE = re.compile(r"^\d{1,2}:\d{2}(:\d{2})?$")
+_TRUE = {"true", "1", "yes", "y"}
+_FALSE = {"false", "0", "no", "n"}
+
+
+class ReportParameterError(Exception):
+    """Raised when report parameters fail local validation."""
+
+
+class ReportMetadataCache:
+    def __init__(self, ttl: float, max_stale: float) -> None:
+        self.ttl = ttl
+        self.max_stale = max(max_stale, ttl)
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._refreshing: dict[str, asyncio.Task[Any]] = {}
+
+    async def _load(self, url: str, all_pages: bool) -> Any:
+        if all_pages:
+            data = await fetch_all_pages(url, max_items=_VALUE_SET_MAX_ITEMS)
+        else:
+            data = await make_st_request(url)
+        if data:
+            self._entries[url] = (time.monotonic(), data)
+        return data
+
+    def _refresh_in_background(self, url: str, all_pages: bool) -> None:
+        if url in self._refreshing:
+            return
+        task = asyncio.ensure_future(self._load(url, all_pages))
+        self._refreshing[url] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(url, None))
+
+    async def get(self, url: str, all_pages: bool = False) -> Any:
+        entry = self._entries.get(url)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                metrics.increment("report_metadata.hits")
+                return entry[1]
+            if age < self.max_stale:
+                metrics.increment("report_metadata.stale")
+                self._refresh_in_background(url, all_pages)
+                return entry[1]
+        metrics.increment("report_metadata.misses")
+        return await self._load(url, all_pages)
+
+    async def description(self, tenant: int, report_category: str, report_id: int, environment: str) -> Any:
+        base_url = get_base_url(environment)
+        return await self.get(f"{base_url}/reporting/v2/tenant/{tenant}/report-category/{report_category}/reports/{report_id}")
+
+    async def value_set(self, tenant: int, dynamic_set_id: str, environment: str) -> Any:
+        base_url = get_base_url(environment)
+        return await self.get(f"{base_url}/reporting/v2/tenant/{tenant}/dynamic-value-sets/{dynamic_set_id}", all_pages=True)
+
+    async def close(self) -> None:
+        for task in list(self._refreshing.values()):
+            task.cancel()
+
+    def clear(self) -> int:
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def stats(self) -> dict[str, Any]:
+        return {"entries": len(self._entries), "refreshing": len(self._refreshing), "ttl": self.ttl}
+
+
+REPORT_METADATA = ReportMetadataCache(REPORT_METADATA_TTL, REPORT_METADATA_MAX_STALE)
+on_shutdown(REPORT_METADATA.close)
+
+
+def _choices(rows: Sequence[Any]) -> dict[str, Any]:
+    """Map each allowed key and lower-cased display name to the key to send."""
+
+    choices: dict[str, Any] = {}
+    for row in rows or []:
+        if isinstance(row, (list, tuple)) and row:
+            key, name = row[0], row[1] if len(row) > 1 else None
+        elif isinstance(row, dict):
+            key = next((row[k] for k in ("value", "key", "id") if k in row), None)
+            name = row.get("name") or row.get("label")
+        else:
+            continue
+        if key is None:
+            continue
+        choices[str(key).lower()] = key
+        if name is not None:
+            choices.setdefault(str(name).lower(), key)
+    return choices
+
+
+def _coerce(value: Any, data_type: str) -> Any:
+    try:
+        return _coerce_value(value, data_type)
+    except (TypeError, ValueError):
+        raise ValueError(f"expected {data_type}, got {value!r}") from None
+
+
+def _coerce_value(value: Any, data_type: str) -> Any:
+    if data_type == "Number":
+        if isinstance(value, bool):
+            raise TypeError(value)
+        if isinstance(value, (int, float)):
+            return value
+        text = str(value).strip()
+        number = float(text)
+        return int(number) if number.is_integer() and "." not in text else number
+    if data_type == "Boolean":
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+        raise ValueError(value)
+    if data_type == "Date":
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()[:10]
+        text = str(value).strip()
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).date().isoformat()
+    if data_type == "Time":
+        text = str(value).strip()
+        if not _TIME_RE.match(text):
+            raise ValueError(value)
+        return text
+    return value if isinstance(value, str) else str(value)
+
+
+async def prepare_parameters(
+    tenant: int,
+    report_category: str,
+    report_id: int,
+    parameters: Sequence[dict[str, Any]],
+    environment: str = "production",
+) -> list[dict[str, Any]]:
+    """Validate and coerce ``parameters`` against the cached report description.
+
+    Returns the parameters to send; raises ``ReportParameterError`` listing every problem.
+    If the description cannot be fetched the parameters are passed through unchanged.
+    """
+
+    description = await REPORT_METADATA.description(tenant, report_category, report_id, environment)
+    declared = {p["name"]: p for p in (description or {}).get("parameters") or [] if isinstance(p, dict) and p.get("name")}
+    if not declared:
+        return list(parameters)
+
+    by_lower = {name.lower(): name for name in declared}
+    errors: list[str] = []
+    prepared: dict[str, Any] = {}
+
+    for item in parameters:
+        if not isinstance(item, dict) or "name" not in item:
+            errors.append(f"{item!r}: expected an object like {{\"name\": str, \"value\": Any}}")
+            continue
+        given = str(item["name"])
+        name = by_lower.get(given.lower())
+        if name is None:
+            hint = difflib.get_close_matches(given, list(declared), n=1)
+            errors.append(f"'{given}': unknown parameter" + (f" (did you mean '{hint[0]}'?)" if hint else ""))
+            continue
+
+        spec = declared[name]
+        data_type = str(spec.get("dataType") or "String")
+        value = item.get("value")
+        if spec.get("isArray"):
+            values = value.split(",") if isinstance(value, str) else value if isinstance(value, list) else [value]
+        else:
+            values = [value]
+
+        accepted = spec.get("acceptValues") or {}
+        choices: dict[str, Any] = {}
+        # A truncated dynamic set can only map names; values missing from it are sent as given.
+        partial = False
+        if accepted.get("dynamicSetId"):
+            value_set = await REPORT_METADATA.value_set(tenant, accepted["dynamicSetId"], environment)
+            choices = _choices((value_set or {}).get("data"))
+            partial = bool((value_set or {}).get("hasMore"))
+        elif accepted.get("values"):
+            choices = _choices(accepted["values"])
+
+        try:
+            coerced = []
+            for raw in values:
+                if raw is None:
+                    coerced.append(None)
+                    continue
+                if choices:
+                    key = choices.get(str(raw).strip().lower())
+                    if key is None and partial:
+                        key = raw
+                    if key is None:
+                        sample = ", ".join(str(k) for k in list(dict.fromkeys(choices.values()))[:10])
+                        raise ValueError(f"'{raw}' is not an accepted value (e.g. {sample})")
+                    raw = key
+                coerced.append(_coerce(raw, data_type))
+        except ValueError as exc:
+            errors.append(f"'{name}': {exc}")
+            continue
+        prepared[name] = coerced if spec.get("isArray") else coerced[0]
+
+    for name, spec in declared.items():
+        if spec.get("isRequired") and prepared.get(name) in (None, []) and not any(e.startswith(f"'{name}'") for e in errors):
+            errors.append(f"'{name}': required ({spec.get('dataType') or 'String'})")
+
+    if errors:
+        raise ReportParameterError("Invalid report parameters: " + "; ".join(errors))
+    return [{"name": name, "value": value} for name, value in prepared.items()]
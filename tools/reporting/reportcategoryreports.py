@@ -1,7 +1,9 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_post, make_st_request
+from ..utils import get_base_url, make_st_post, make_st_request, fetch_all_pages, format_response
+from .columnar import REPORT_EXPORT_CONCURRENCY, REPORT_EXPORT_FORMATS, REPORT_PAGE_SIZE, ReportExportError, export_report
+from .materialize import MATERIALIZER
+from .metadata import REPORT_METADATA, ReportParameterError, prepare_parameters
 
 __all__ = ["register_reporting_report_category_reports_tools"]
 
@@ -14,11 +16,18 @@ def register_reporting_report_category_reports_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
         """List reports within the given category.
 
         Mirrors ReportCategoryReports_GetReports.
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
         """
 
         if not report_category:
@@ -35,14 +44,14 @@ def register_reporting_report_category_reports_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch reports for category."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def reporting_get_report_description(
@@ -54,22 +63,17 @@ def register_reporting_report_category_reports_tools(mcp: Any) -> None:
         """Get report description including input parameters and output fields.
 
         Mirrors ReportCategoryReports_Get.
+        Served from a cache (SERVICETITAN_MCP_REPORT_METADATA_TTL) that refreshes in the background.
         """
 
         if not report_category:
             return "'report_category' is required."
 
-        base_url = get_base_url(environment)
-        url = f"{base_url}/reporting/v2/tenant/{tenant}/report-category/{report_category}/reports/{report_id}"
-
-        data = await make_st_request(url)
+        data = await REPORT_METADATA.description(tenant, report_category, report_id, environment)
         if not data:
             return "Unable to fetch report description."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def reporting_get_report_data(
@@ -80,17 +84,40 @@ def register_reporting_report_category_reports_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        validate: bool = True,
+        refresh: bool = False,
         environment: str = "production",
     ) -> str:
         """Get report data for a given report and parameters.
 
         Mirrors ReportCategoryReports_GetData.
         'parameters' should be a list of objects like {"name": str, "value": Any}.
+        Parameters are checked and coerced against the cached report description before sending
+        (names are case-insensitive, display names of accepted values map to their keys);
+        set validate=False to send them as given.
+        Reports registered with reporting_materialize_report are answered from their latest snapshot
+        (with 'asOf') when page, page_size and include_total are not set; refresh=True refreshes it first.
         """
 
         if not report_category:
             return "'report_category' is required."
 
+        parameters = list(parameters) if parameters else []
+        if validate:
+            try:
+                parameters = await prepare_parameters(tenant, report_category, report_id, parameters, environment)
+            except ReportParameterError as exc:
+                return str(exc)
+
+        if page is None and page_size is None and not include_total:
+            entry = MATERIALIZER.find(tenant, report_category, report_id, parameters, environment)
+            if entry is not None:
+                snapshot = None if refresh else MATERIALIZER.snapshot(entry["key"])
+                if snapshot is None:
+                    snapshot = await MATERIALIZER.refresh(entry["key"])
+                if snapshot is not None:
+                    return format_response(snapshot)
+
         base_url = get_base_url(environment)
         url = f"{base_url}/reporting/v2/tenant/{tenant}/report-category/{report_category}/reports/{report_id}/data"
 
@@ -103,16 +130,64 @@ def register_reporting_report_category_reports_tools(mcp: Any) -> None:
             params_qs["includeTotal"] = True
 
         body: dict[str, Any] = {
-            "parameters": list(parameters) if parameters else [],
+            "parameters": parameters,
         }
 
         data = await make_st_post(url, json_body=body, params=params_qs or None)
         if not data:
             return "Unable to fetch report data."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
+    @mcp.tool()
+    async def reporting_export_report_data(
+        tenant: int,
+        report_category: str,
+        report_id: int,
+        parameters: Optional[Sequence[dict[str, Any]]] = None,
+        format: str = "auto",
+        page_size: int = REPORT_PAGE_SIZE,
+        concurrency: int = REPORT_EXPORT_CONCURRENCY,
+        validate: bool = True,
+        environment: str = "production",
+    ) -> str:
+        """Export every page of a report's data to a columnar file and return a handle plus column stats.
+
+        Uses ReportCategoryReports_GetData with includeTotal to plan the page count, then fetches
+        the remaining pages 'concurrency' at a time. format: auto (Arrow IPC if pyarrow is
+        installed, else gzipped CSV), arrow, parquet or csv. The file is served as the returned
+        servicetitan://spool/{sha256} resource; rows are not returned inline.
+        'parameters' should be a list of objects like {"name": str, "value": Any}; they are validated
+        as in reporting_get_report_data unless validate=False.
+        """
+
+        if not report_category:
+            return "'report_category' is required."
+        fmt = (format or "auto").strip().lower()
+        if fmt not in REPORT_EXPORT_FORMATS:
+            return f"Unknown format '{format}'. Choose from: {', '.join(REPORT_EXPORT_FORMATS)}."
+
+        parameters = list(parameters) if parameters else []
+        if validate:
+            try:
+                parameters = await prepare_parameters(tenant, report_category, report_id, parameters, environment)
+            except ReportParameterError as exc:
+                return str(exc)
+
+        base_url = get_base_url(environment)
+        url = f"{base_url}/reporting/v2/tenant/{tenant}/report-category/{report_category}/reports/{report_id}/data"
+
+        try:
+            data = await export_report(
+                url,
+                parameters,
+                fmt=fmt,
+                page_size=page_size,
+                concurrency=min(max(concurrency, 1), 16),
+            )
+        except ReportExportError as exc:
+            return str(exc)
+        if not data:
+            return "Unable to fetch report data."
 
+        return format_response(data)
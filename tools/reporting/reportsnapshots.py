@@ -0,0 +1,52 @@
+from typing import Any, Optional, Sequence
+
+from ..utils import format_response
+from .materialize import MATERIALIZER
+from .metadata import ReportParameterError, prepare_parameters
+
+__all__ = ["register_reporting_report_snapshots_tools"]
+
+
+def register_reporting_report_snapshots_tools(mcp: Any) -> None:
+    @mcp.tool()
+    async def reporting_materialize_report(
+        tenant: int,
+        report_category: str,
+        report_id: int,
+        parameters: Optional[Sequence[dict[str, Any]]] = None,
+        interval_minutes: float = 15,
+        environment: str = "production",
+    ) -> str:
+        """Keep a snapshot of a report refreshed in the background every 'interval_minutes' (min 1).
+
+        reporting_get_report_data calls with the same parameters (and no page/page_size/include_total)
+        then return the latest snapshot with its 'asOf' time instead of querying the API;
+        pass refresh=True there to force a refresh. Registrations persist across restarts.
+        """
+
+        if not report_category:
+            return "'report_category' is required."
+
+        try:
+            prepared = await prepare_parameters(tenant, report_category, report_id, list(parameters or []), environment)
+        except ReportParameterError as exc:
+            return str(exc)
+
+        entry = await MATERIALIZER.register(
+            tenant, report_category, report_id, prepared, interval_minutes * 60, environment=environment
+        )
+        return format_response(entry)
+
+    @mcp.tool()
+    async def reporting_list_materialized_reports() -> str:
+        """List materialized reports with their parameters, asOf time, next refresh and last error."""
+
+        return format_response({"data": MATERIALIZER.entries()})
+
+    @mcp.tool()
+    async def reporting_unmaterialize_report(key: str) -> str:
+        """Stop refreshing a materialized report and delete its snapshot ('key' from reporting_list_materialized_reports)."""
+
+        if not await MATERIALIZER.unregister(key):
+            return f"No materialized report with key '{key}'."
+        return format_response({"removed": key})
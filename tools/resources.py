@@ -0,0 +1,29 @@
+import asyncio
+from typing import Any
+
+from .blobcache import read_spool
+from .utils import SPOOL_URI_PREFIX
+
+__all__ = ["register_resources"]
+
+
+def register_resources(mcp: Any) -> None:
+    """Register MCP resources shared by all tool groups."""
+
+    @mcp.resource(SPOOL_URI_PREFIX + "{sha256}", mime_type="application/octet-stream")
+    async def spool_file(sha256: str) -> bytes:
+        """A downloaded file (recording, voicemail, attachment) by its SHA-256."""
+
+        data = await asyncio.to_thread(read_spool, sha256)
+        if data is None:
+            raise ValueError(f"No spooled file {sha256}")
+        return data
+
+    @mcp.resource(SPOOL_URI_PREFIX + "{sha256}/{offset}/{length}", mime_type="application/octet-stream")
+    async def spool_file_range(sha256: str, offset: str, length: str) -> bytes:
+        """A byte range of a downloaded file, for reading large recordings in parts."""
+
+        data = await asyncio.to_thread(read_spool, sha256, int(offset), int(length))
+        if data is None:
+            raise ValueError(f"No spooled file {sha256}")
+        return data
@@ -1,4 +1,3 @@
-import json
 from typing import Any, Optional, Sequence
 
 from ..utils import (
@@ -8,6 +7,8 @@ from ..utils import (
     make_st_put,
     make_st_patch,
     make_st_delete,
+    fetch_all_pages,
+    format_response,
 )
 
 __all__ = ["register_sales_estimates_tools"]
@@ -48,9 +49,18 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         location_id: Optional[int] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Retrieve a paginated list of estimates with filters. Mirrors Estimates_GetList."""
+        """Retrieve a paginated list of estimates with filters. Mirrors Estimates_GetList.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/sales/v2/tenant/{tenant}/estimates"
@@ -104,14 +114,14 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if location_id is not None:
             params["locationId"] = location_id
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch estimates."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def sales_estimates_create(
@@ -168,10 +178,7 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create estimate."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def sales_estimates_get_items(
@@ -184,9 +191,18 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         include_total: bool = False,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get estimate items (paginated). Mirrors Estimates_GetItems."""
+        """Get estimate items (paginated). Mirrors Estimates_GetItems.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/sales/v2/tenant/{tenant}/estimates/items"
@@ -212,14 +228,14 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if include_total:
             params["includeTotal"] = True
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch estimate items."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def sales_estimates_update(
@@ -268,10 +284,7 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update estimate."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def sales_estimates_get(
@@ -288,10 +301,7 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch estimate."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def sales_estimates_dismiss(
@@ -308,10 +318,7 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to dismiss estimate."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def sales_estimates_put_item(
@@ -330,10 +337,7 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to put estimate item."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def sales_estimates_delete_item(
@@ -351,10 +355,7 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if data is None:
             return "Unable to delete estimate item."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def sales_estimates_sell(
@@ -373,10 +374,7 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to sell estimate."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def sales_estimates_unsell(
@@ -393,10 +391,7 @@ def register_sales_estimates_tools(mcp: Any) -> None:
         if not data:
             return "Unable to unsell estimate."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
 
@@ -0,0 +1,210 @@
+"""Client-side request scheduler: per-tenant token buckets and a global concurrency cap.
+
+Every attempt made by ``tools.utils._send`` first takes a token from the bucket of
+its (environment, tenant) and then one of ``max_concurrency`` slots. Both hand out
+permits in priority order, so interactive lookups overtake queued bulk work (page
+scans, export drains). The lane of the current call comes from ``request_priority``.
+"""
+
+import time
+import heapq
+import asyncio
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from . import metrics
+
+__all__ = [
+    "INTERACTIVE",
+    "BULK",
+    "TokenBucket",
+    "PrioritySemaphore",
+    "RequestScheduler",
+    "current_priority",
+    "request_priority",
+    "parse_rate",
+]
+
+# Lanes; lower values are served first.
+INTERACTIVE = 0
+BULK = 10
+
+_PRIORITY: ContextVar[int] = ContextVar("servicetitan_request_priority", default=INTERACTIVE)
+_SEQUENCE = itertools.count()
+
+
+def current_priority() -> int:
+    return _PRIORITY.get()
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Run the enclosed requests (and tasks created inside) in the given lane."""
+
+    token = _PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+def parse_rate(value: str) -> tuple[float, float]:
+    """Parse ``"rate[/burst]"`` (requests per second); burst defaults to one second of rate."""
+
+    rate, _, burst = value.partition("/")
+    return float(rate), float(burst or rate)
+
+
+class _Waiters:
+    """Priority queue of futures, FIFO within a lane."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, asyncio.Future[None]]] = []
+
+    def __bool__(self) -> bool:
+        self._discard_cancelled()
+        return bool(self._heap)
+
+    def _discard_cancelled(self) -> None:
+        while self._heap and self._heap[0][2].done():
+            heapq.heappop(self._heap)
+
+    def push(self, priority: int) -> asyncio.Future[None]:
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (priority, next(_SEQUENCE), future))
+        return future
+
+    def grant(self) -> bool:
+        self._discard_cancelled()
+        if not self._heap:
+            return False
+        heapq.heappop(self._heap)[2].set_result(None)
+        return True
+
+
+async def _wait(future: asyncio.Future[None], give_back: Callable[[], None]) -> None:
+    try:
+        await future
+    except asyncio.CancelledError:
+        # Granted just before the waiter was cancelled: return the permit.
+        if future.done() and not future.cancelled():
+            give_back()
+        raise
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.tokens = self.burst
+        self._updated = time.monotonic()
+        self._waiters = _Waiters()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _give_back(self) -> None:
+        self.tokens = min(self.burst, self.tokens + 1)
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._refill()
+        while self.tokens >= 1 and self._waiters.grant():
+            self.tokens -= 1
+        if self._waiters:
+            delay = (1 - self.tokens) / self.rate
+            self._timer = asyncio.get_running_loop().call_later(delay, self._wake)
+
+    async def acquire(self, priority: int = INTERACTIVE) -> float:
+        """Take one token, waiting in priority order; returns the seconds waited."""
+
+        self._refill()
+        if not self._waiters and self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        started = time.monotonic()
+        future = self._waiters.push(priority)
+        self._wake()
+        await _wait(future, self._give_back)
+        return time.monotonic() - started
+
+
+class PrioritySemaphore:
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+        self._waiters = _Waiters()
+
+    async def acquire(self, priority: int = INTERACTIVE) -> None:
+        if not self._waiters and self.active < self.limit:
+            self.active += 1
+            return
+        future = self._waiters.push(priority)
+        await _wait(future, self.release)
+
+    def release(self) -> None:
+        # Hand the slot straight to the next waiter so it cannot be taken out of order.
+        if not self._waiters.grant():
+            self.active -= 1
+
+
+class RequestScheduler:
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        max_concurrency: int,
+        overrides: Optional[dict[str, tuple[float, float]]] = None,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.overrides = overrides or {}
+        self.slots = PrioritySemaphore(max(max_concurrency, 1))
+        self._buckets: dict[tuple[str, str], Optional[TokenBucket]] = {}
+
+    def _bucket(self, environment: str, tenant: str) -> Optional[TokenBucket]:
+        key = (environment, tenant)
+        if key not in self._buckets:
+            rate, burst = self.overrides.get(
+                f"{environment}:{tenant}", self.overrides.get(environment, (self.rate, self.burst))
+            )
+            self._buckets[key] = TokenBucket(rate, burst) if rate > 0 else None
+        return self._buckets[key]
+
+    async def acquire(self, environment: str, tenant: Optional[str]) -> None:
+        """Wait for a tenant token and a concurrency slot; pair with ``release``."""
+
+        priority = current_priority()
+        lane = "bulk" if priority >= BULK else "interactive"
+        started = time.monotonic()
+        bucket = self._bucket(environment, tenant) if tenant else None
+        if bucket is not None:
+            await bucket.acquire(priority)
+        await self.slots.acquire(priority)
+        waited = time.monotonic() - started
+        metrics.increment(f"scheduler.{lane}.requests")
+        if waited > 0.001:
+            metrics.increment(f"scheduler.{lane}.queued")
+            metrics.increment(f"scheduler.{lane}.wait_seconds", waited)
+
+    def release(self) -> None:
+        self.slots.release()
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "maxConcurrency": self.slots.limit,
+            "active": self.slots.active,
+            "buckets": {
+                f"{env}:{tenant}": {"rate": b.rate, "burst": b.burst, "tokens": round(b.tokens, 2)}
+                for (env, tenant), b in self._buckets.items()
+                if b is not None
+            },
+        }
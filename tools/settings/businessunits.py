@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_put
+from ..utils import get_base_url, make_st_request, make_st_put, fetch_all_pages, format_response
 
 __all__ = ["register_settings_business_units_tools"]
 
@@ -30,9 +29,18 @@ def register_settings_business_units_tools(mcp: Any) -> None:
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
         external_data_application_guid: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of business units. Mirrors BusinessUnits_GetList."""
+        """Get a paginated list of business units. Mirrors BusinessUnits_GetList.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/settings/v2/tenant/{tenant}/business-units"
@@ -64,14 +72,14 @@ def register_settings_business_units_tools(mcp: Any) -> None:
         if external_data_application_guid:
             params["externalDataApplicationGuid"] = external_data_application_guid
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch business units."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def settings_business_units_update(
@@ -110,10 +118,7 @@ def register_settings_business_units_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update business unit."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def settings_business_units_get(
@@ -135,10 +140,7 @@ def register_settings_business_units_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch business unit."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
 
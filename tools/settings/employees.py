@@ -1,7 +1,13 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_request, make_st_post, make_st_put
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_post,
+    make_st_put,
+    fetch_all_pages,
+    format_response,
+)
 
 __all__ = ["register_settings_employees_tools"]
 
@@ -31,9 +37,18 @@ def register_settings_employees_tools(mcp: Any) -> None:
         created_on_or_after: Optional[str] = None,
         modified_before: Optional[str] = None,
         modified_on_or_after: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of employees. Mirrors Employees_GetList."""
+        """Get a paginated list of employees. Mirrors Employees_GetList.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/settings/v2/tenant/{tenant}/employees"
@@ -67,14 +82,14 @@ def register_settings_employees_tools(mcp: Any) -> None:
         if modified_on_or_after:
             params["modifiedOnOrAfter"] = modified_on_or_after
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch employees."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def settings_employees_create(
@@ -124,10 +139,7 @@ def register_settings_employees_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create employee."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def settings_employees_update(
@@ -179,10 +191,7 @@ def register_settings_employees_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update employee."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def settings_employees_get(
@@ -199,10 +208,7 @@ def register_settings_employees_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch employee."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def settings_employees_account_actions(
@@ -221,10 +227,7 @@ def register_settings_employees_tools(mcp: Any) -> None:
         if not data:
             return "Unable to perform employee account action."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
 
@@ -1,7 +1,6 @@
-import json
 from typing import Any
 
-from ..utils import get_base_url, make_st_request
+from ..utils import get_base_url, make_st_request, format_response
 
 __all__ = ["register_taskmanagement_client_side_data_tools"]
 
@@ -21,9 +20,6 @@ def register_taskmanagement_client_side_data_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch task management client-side data."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
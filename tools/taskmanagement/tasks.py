@@ -1,7 +1,6 @@
-import json
 from typing import Any, Optional, Sequence
 
-from ..utils import get_base_url, make_st_post, make_st_request
+from ..utils import get_base_url, make_st_post, make_st_request, fetch_all_pages, format_response
 
 __all__ = ["register_taskmanagement_tasks_tools"]
 
@@ -79,10 +78,7 @@ def register_taskmanagement_tasks_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create task."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def taskmanagement_tasks_get_tasks(
@@ -118,9 +114,18 @@ def register_taskmanagement_tasks_tools(mcp: Any) -> None:
         task_number: Optional[int] = None,
         job_number: Optional[str] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a list of tasks (Tasks_GetTasks)."""
+        """Get a list of tasks (Tasks_GetTasks).
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/taskmanagement/v2/tenant/{tenant}/tasks"
@@ -194,14 +199,14 @@ def register_taskmanagement_tasks_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch tasks."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def taskmanagement_tasks_get_task(
@@ -223,10 +228,7 @@ def register_taskmanagement_tasks_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch the specified task."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def taskmanagement_tasks_create_subtask(
@@ -255,9 +257,6 @@ def register_taskmanagement_tasks_tools(mcp: Any) -> None:
         if not data:
             return "Unable to create subtask."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
 
@@ -1,8 +1,18 @@
 import base64
-import json
+import asyncio
 from typing import Any, Optional
 
-from ..utils import get_base_url, make_st_request, make_st_put, make_st_get_bytes
+from ..utils import (
+    get_base_url,
+    make_st_request,
+    make_st_put,
+    make_st_get_bytes,
+    fetch_all_pages,
+    format_response,
+    parse_id_list,
+)
+from ..blobcache import BLOB_CACHE
+from ..scheduler import BULK, request_priority
 
 __all__ = ["register_telecom_calls_tools"]
 
@@ -40,9 +50,18 @@ def register_telecom_calls_tools(mcp: Any) -> None:
         agent_is_external: Optional[bool] = None,
         agent_external_id: Optional[int] = None,
         sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        compact: Optional[bool] = None,
+        fields: Optional[str] = None,
         environment: str = "production",
     ) -> str:
-        """Get a paginated list of telecom calls (v3). Mirrors Calls_Calls."""
+        """Get a paginated list of telecom calls (v3). Mirrors Calls_Calls.
+
+        Set all_pages=True to follow hasMore server-side and merge every page (capped by max_items).
+        Set compact=True for minified JSON output.
+        Pass fields="id,name,modifiedOn" (dotted paths allowed) to return only those fields of each record.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/telecom/v3/tenant/{tenant}/calls"
@@ -92,14 +111,14 @@ def register_telecom_calls_tools(mcp: Any) -> None:
         if sort:
             params["sort"] = sort
 
-        data = await make_st_request(url, params=params or None)
+        if all_pages:
+            data = await fetch_all_pages(url, params=params, max_items=max_items)
+        else:
+            data = await make_st_request(url, params=params or None)
         if not data:
             return "Unable to fetch telecom calls."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data, compact=compact, fields=fields)
 
     @mcp.tool()
     async def telecom_calls_update(
@@ -142,10 +161,7 @@ def register_telecom_calls_tools(mcp: Any) -> None:
         if not data:
             return "Unable to update telecom call."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def telecom_calls_get_details(
@@ -162,23 +178,32 @@ def register_telecom_calls_tools(mcp: Any) -> None:
         if not data:
             return "Unable to fetch telecom call details."
 
-        try:
-            return json.dumps(data, indent=2)
-        except Exception:
-            return str(data)
+        return format_response(data)
 
     @mcp.tool()
     async def telecom_calls_get_recording(
         tenant: int,
         id: int,
         as_base64: bool = True,
+        to_file: bool = False,
         environment: str = "production",
     ) -> str:
-        """Get call recording bytes; returns base64 string by default."""
+        """Get call recording bytes; returns base64 string by default.
+
+        to_file=True streams the audio to the local blob cache instead and returns its path,
+        resource URI, size and SHA-256 (nothing is buffered in memory or base64-encoded);
+        later calls for the same call are served from the cache.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/telecom/v2/tenant/{tenant}/calls/{id}/recording"
 
+        if to_file:
+            data = await BLOB_CACHE.fetch(url, tenant, "recording", id)
+            if not data:
+                return "Unable to fetch call recording."
+            return format_response(data)
+
         content = await make_st_get_bytes(url)
         if content is None:
             return "Unable to fetch call recording."
@@ -186,27 +211,75 @@ def register_telecom_calls_tools(mcp: Any) -> None:
         if as_base64:
             return base64.b64encode(content).decode("ascii")
         # Return a short JSON wrapper with length to avoid raw binary in UI
-        return json.dumps({"bytes": len(content)}, indent=2)
+        return format_response({"bytes": len(content)})
 
     @mcp.tool()
     async def telecom_calls_get_voicemail(
         tenant: int,
         id: int,
         as_base64: bool = True,
+        to_file: bool = False,
         environment: str = "production",
     ) -> str:
-        """Get call voicemail bytes; returns base64 string by default."""
+        """Get call voicemail bytes; returns base64 string by default.
+
+        to_file=True streams the audio to the local blob cache instead and returns its path,
+        resource URI, size and SHA-256 (nothing is buffered in memory or base64-encoded);
+        later calls for the same call are served from the cache.
+        """
 
         base_url = get_base_url(environment)
         url = f"{base_url}/telecom/v2/tenant/{tenant}/calls/{id}/voicemail"
 
+        if to_file:
+            data = await BLOB_CACHE.fetch(url, tenant, "voicemail", id)
+            if not data:
+                return "Unable to fetch call voicemail."
+            return format_response(data)
+
         content = await make_st_get_bytes(url)
         if content is None:
             return "Unable to fetch call voicemail."
 
         if as_base64:
             return base64.b64encode(content).decode("ascii")
-        return json.dumps({"bytes": len(content)}, indent=2)
+        return format_response({"bytes": len(content)})
+
+    @mcp.tool()
+    async def telecom_calls_download_recordings(
+        tenant: int,
+        ids: str,
+        kind: str = "recording",
+        concurrency: int = 4,
+        environment: str = "production",
+    ) -> str:
+        """Stream recordings (or voicemails) for many calls to the local blob cache concurrently.
+
+        'ids' is a comma-separated list of call IDs; kind is 'recording' or 'voicemail'.
+        Returns path, resource URI, size and SHA-256 per call, plus the ids that failed.
+        """
+
+        kind = (kind or "recording").strip().lower()
+        if kind not in {"recording", "voicemail"}:
+            return "'kind' must be 'recording' or 'voicemail'."
+        id_list = parse_id_list(ids)
+        if id_list is None:
+            return "'ids' must be a comma-separated list of integer IDs."
+
+        base_url = get_base_url(environment)
+        semaphore = asyncio.Semaphore(min(max(concurrency, 1), 16))
 
+        async def download(call_id: int) -> Optional[dict[str, Any]]:
+            async with semaphore:
+                with request_priority(BULK):
+                    return await BLOB_CACHE.fetch(
+                        f"{base_url}/telecom/v2/tenant/{tenant}/calls/{call_id}/{kind}", tenant, kind, call_id
+                    )
 
+        results = await asyncio.gather(*(download(call_id) for call_id in id_list))
+        data = {
+            "files": {str(call_id): result for call_id, result in zip(id_list, results) if result},
+            "failed": [call_id for call_id, result in zip(id_list, results) if not result],
+        }
 
+        return format_response(data)
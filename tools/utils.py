@@ -1,20 +1,41 @@
 import os
+import re
+import json
+import hashlib
+import tempfile
+import mimetypes
 import time
+import random
+import asyncio
 import logging
-from typing import Any, Optional
+from contextlib import aclosing, asynccontextmanager
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Optional
 
 import httpx
 from importlib.metadata import PackageNotFoundError, version as get_version
 
+from . import metrics
+from .cache import ResponseCache, params_key, url_scope
+from .scheduler import BULK, RequestScheduler, parse_rate, request_priority
+
 PRODUCTION_BASE_URL = "https://api.servicetitan.io"
 INTEGRATION_BASE_URL = "https://api-integration.servicetitan.io"
 LOGGER = logging.getLogger(__name__)
+DEFAULT_TIMEOUT = 30.0
 
 try:
     USER_AGENT = f"servicetitan-mcp/{get_version('servicetitan-mcp')}"
 except PackageNotFoundError:
     USER_AGENT = "servicetitan-mcp"
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 
 def get_base_url(environment: str) -> str:
     env_normalized = (environment or "").strip().lower()
@@ -23,9 +44,6 @@ def get_base_url(environment: str) -> str:
     return PRODUCTION_BASE_URL
 
 
-_TOKEN_CACHE: dict[str, tuple[str, float]] = {}
-
-
 def _resolve_env_key_from_url(url: Optional[str]) -> str:
     if not url:
         return "production"
@@ -34,51 +52,304 @@ def _resolve_env_key_from_url(url: Optional[str]) -> str:
     return "production"
 
 
-def _fetch_access_token(env_key: str) -> Optional[str]:
-    # Check cache
-    cached = _TOKEN_CACHE.get(env_key)
-    now = time.time()
-    if cached and cached[1] > now:
-        return cached[0]
+def get_state_dir(*parts: str) -> Path:
+    """Return (and create) a directory under the server's local state root.
+
+    The root is ``SERVICETITAN_MCP_STATE_DIR`` or ``$XDG_CACHE_HOME/servicetitan-mcp``.
+    """
+
+    root = os.environ.get("SERVICETITAN_MCP_STATE_DIR")
+    if not root:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(cache_home, "servicetitan-mcp")
+    path = Path(root, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _compact_default() -> bool:
+    return os.environ.get("SERVICETITAN_MCP_JSON_MODE", "pretty").strip().lower() == "compact"
+
+
+@lru_cache(maxsize=256)
+def _parse_field_spec(fields: str) -> dict[str, Any]:
+    tree: dict[str, Any] = {}
+    for path in fields.split(","):
+        parts = [part.strip() for part in path.split(".") if part.strip()]
+        node = tree
+        for i, part in enumerate(parts):
+            if i == len(parts) - 1:
+                node[part] = None
+            elif node.get(part, {}) is None:
+                break  # a parent path already keeps the whole subtree
+            else:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _project(value: Any, tree: dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected: dict[str, Any] = {}
+    for key, subtree in tree.items():
+        if key in value:
+            projected[key] = value[key] if subtree is None else _project(value[key], subtree)
+    return projected
+
+
+def project_fields(data: Any, fields: Optional[str]) -> Any:
+    """Keep only the comma-separated, dotted ``fields`` of each record.
+
+    For list/export envelopes the projection applies to the ``data`` records and the
+    paging keys (``hasMore``, ``continueFrom``, ...) are kept; an id-keyed ``data``
+    map (see ``fetch_many_by_ids``) has each record projected. Tabular envelopes
+    (array rows described by a ``fields`` header, as in reporting) keep the columns
+    whose names match, case-insensitively. Returns new objects; ``data`` itself is
+    never modified.
+    """
+
+    if not fields or not fields.strip():
+        return data
+    tree = _parse_field_spec(fields)
+    if (
+        isinstance(data, dict)
+        and isinstance(data.get("fields"), list)
+        and isinstance(data.get("data"), list)
+        and all(isinstance(row, list) for row in data["data"])
+    ):
+        wanted = {name.lower() for name in tree}
+        columns = [
+            index
+            for index, field in enumerate(data["fields"])
+            if isinstance(field, dict) and str(field.get("name", "")).lower() in wanted
+        ]
+        return {
+            **data,
+            "fields": [data["fields"][index] for index in columns],
+            "data": [[row[index] if index < len(row) else None for index in columns] for row in data["data"]],
+        }
+    if isinstance(data, dict) and isinstance(data.get("data"), list):
+        return {**data, "data": _project(data["data"], tree)}
+    if isinstance(data, dict) and isinstance(data.get("data"), dict) and "missing" in data:
+        return {**data, "data": {key: _project(record, tree) for key, record in data["data"].items()}}
+    return _project(data, tree)
+
+
+def format_response(data: Any, compact: Optional[bool] = None, fields: Optional[str] = None) -> str:
+    """Serialize a tool result to JSON text.
+
+    Pretty-printed by default; compact (no indentation, tight separators) when
+    ``compact`` is set or ``SERVICETITAN_MCP_JSON_MODE=compact``. ``fields`` trims
+    records first (see ``project_fields``). Uses orjson when installed and falls
+    back to ``str(data)`` for values JSON cannot represent.
+    """
+
+    data = project_fields(data, fields)
+    if compact is None:
+        compact = _compact_default()
+    if orjson is not None:
+        try:
+            option = orjson.OPT_NON_STR_KEYS | (0 if compact else orjson.OPT_INDENT_2)
+            return orjson.dumps(data, option=option).decode()
+        except TypeError:
+            pass
+    try:
+        if compact:
+            return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        return json.dumps(data, indent=2)
+    except Exception:
+        return str(data)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_flag(name: str, default: bool = True) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in {"0", "false", "no", "off"}
+
+
+# Reference-data GETs (see tools.cache.CACHE_TTL_POLICIES) are served from memory.
+RESPONSE_CACHE = ResponseCache(
+    max_entries=_env_int("SERVICETITAN_MCP_CACHE_MAX_ENTRIES", 1024),
+    max_bytes=_env_int("SERVICETITAN_MCP_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+    enabled=_env_flag("SERVICETITAN_MCP_CACHE"),
+)
 
+
+def _loads(body: bytes) -> Any:
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+# One pooled client per environment (i.e. per base URL), reused across tool calls so
+# TLS sessions and HTTP/2 connections survive between requests.
+_HTTP_CLIENTS: dict[str, tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+
+def _http2_enabled() -> bool:
+    if not _env_flag("SERVICETITAN_HTTP2"):
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        LOGGER.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=_env_int("SERVICETITAN_HTTP_MAX_CONNECTIONS", 100),
+        max_keepalive_connections=_env_int("SERVICETITAN_HTTP_MAX_KEEPALIVE", 20),
+        keepalive_expiry=_env_float("SERVICETITAN_HTTP_KEEPALIVE_EXPIRY", 60.0),
+    )
+    return httpx.AsyncClient(
+        http2=_http2_enabled(),
+        follow_redirects=False,
+        limits=limits,
+        timeout=DEFAULT_TIMEOUT,
+    )
+
+
+def get_http_client(url: Optional[str] = None) -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the environment that serves ``url``."""
+
+    env_key = _resolve_env_key_from_url(url)
+    loop = asyncio.get_running_loop()
+    entry = _HTTP_CLIENTS.get(env_key)
+    # A client is bound to the loop it first ran on; rebuild if that loop is gone.
+    if entry is None or entry[0].is_closed or entry[1] is not loop:
+        entry = (_build_http_client(), loop)
+        _HTTP_CLIENTS[env_key] = entry
+    return entry[0]
+
+
+async def close_http_clients() -> None:
+    """Close every pooled client. Safe to call more than once."""
+
+    entries = list(_HTTP_CLIENTS.values())
+    _HTTP_CLIENTS.clear()
+    for client, _ in entries:
+        try:
+            await client.aclose()
+        except Exception:
+            LOGGER.warning("Failed to close HTTP client", exc_info=True)
+
+
+# OAuth client-credentials tokens per environment: env_key -> (token, expires_at).
+_TOKEN_CACHE: dict[str, tuple[str, float]] = {}
+# In-flight refreshes, so concurrent callers share one request to the auth server.
+_TOKEN_REFRESHES: dict[str, asyncio.Task[Optional[str]]] = {}
+# Scheduled proactive refreshes, fired shortly before the cached token expires.
+_TOKEN_REFRESH_TIMERS: dict[str, asyncio.TimerHandle] = {}
+TOKEN_EXPIRY_BUFFER = 30.0
+TOKEN_REFRESH_LEAD = 120.0
+
+
+def _token_url(env_key: str) -> str:
+    if env_key == "integration":
+        return "https://auth-integration.servicetitan.io/connect/token"
+    return "https://auth.servicetitan.io/connect/token"
+
+
+async def _fetch_access_token(env_key: str) -> Optional[str]:
     client_id = os.environ.get("SERVICETITAN_CLIENT_ID")
     client_secret = os.environ.get("SERVICETITAN_CLIENT_SECRET")
     if not client_id or not client_secret:
         return None
 
-    token_url = (
-        "https://auth-integration.servicetitan.io/connect/token"
-        if env_key == "integration"
-        else "https://auth.servicetitan.io/connect/token"
-    )
-
+    token_url = _token_url(env_key)
     try:
-        with httpx.Client(timeout=10.0, http2=True) as client:
-            resp = client.post(
-                token_url,
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            access_token = data.get("access_token")
-            expires_in = int(data.get("expires_in", 900))
-            if access_token:
-                # cache with 60s safety buffer
-                _TOKEN_CACHE[env_key] = (access_token, now + max(expires_in - 60, 300))
-                return access_token
+        response = await get_http_client(token_url).post(
+            token_url,
+            data={
+                "grant_type": "client_credentials",
+                "client_id": client_id,
+                "client_secret": client_secret,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = response.json()
     except Exception:
         LOGGER.error("Failed to fetch access token for %s", env_key, exc_info=True)
         return None
 
-    return None
+    access_token = data.get("access_token")
+    if not access_token:
+        return None
+
+    expires_in = float(data.get("expires_in", 900))
+    now = time.time()
+    _TOKEN_CACHE[env_key] = (access_token, now + max(expires_in - TOKEN_EXPIRY_BUFFER, 0.0))
+    _schedule_token_refresh(env_key, max(expires_in - TOKEN_REFRESH_LEAD, expires_in / 2))
+    return access_token
+
+
+def _schedule_token_refresh(env_key: str, delay: float) -> None:
+    previous = _TOKEN_REFRESH_TIMERS.pop(env_key, None)
+    if previous is not None:
+        previous.cancel()
+    loop = asyncio.get_running_loop()
+    _TOKEN_REFRESH_TIMERS[env_key] = loop.call_later(delay, _refresh_access_token, env_key)
+
+
+def _refresh_access_token(env_key: str) -> asyncio.Task[Optional[str]]:
+    """Start a token refresh for ``env_key`` or join the one already running."""
+
+    task = _TOKEN_REFRESHES.get(env_key)
+    if task is None or task.done():
+        task = asyncio.get_running_loop().create_task(_fetch_access_token(env_key))
+        _TOKEN_REFRESHES[env_key] = task
+
+        def _forget(done: asyncio.Task[Optional[str]]) -> None:
+            if _TOKEN_REFRESHES.get(env_key) is done:
+                del _TOKEN_REFRESHES[env_key]
 
+        task.add_done_callback(_forget)
+    return task
 
-def build_headers(url: Optional[str] = None) -> dict[str, str]:
+
+async def get_access_token(env_key: str) -> Optional[str]:
+    """Return a valid access token without blocking the event loop.
+
+    Cached tokens are served directly; otherwise every concurrent caller awaits
+    the same in-flight refresh.
+    """
+
+    cached = _TOKEN_CACHE.get(env_key)
+    if cached and cached[1] > time.time():
+        return cached[0]
+    # Shield so a cancelled tool call does not abort the refresh other callers await.
+    return await asyncio.shield(_refresh_access_token(env_key))
+
+
+def _cancel_token_refreshes() -> None:
+    for handle in _TOKEN_REFRESH_TIMERS.values():
+        handle.cancel()
+    _TOKEN_REFRESH_TIMERS.clear()
+    for task in _TOKEN_REFRESHES.values():
+        task.cancel()
+    _TOKEN_REFRESHES.clear()
+
+
+async def build_headers(url: Optional[str] = None) -> dict[str, str]:
     headers: dict[str, str] = {
         "Accept": "application/json",
         "Content-Type": "application/json",
@@ -87,7 +358,7 @@ def build_headers(url: Optional[str] = None) -> dict[str, str]:
 
     # Always fetch via client credentials
     env_key = _resolve_env_key_from_url(url)
-    access_token = _fetch_access_token(env_key) or None
+    access_token = await get_access_token(env_key)
     if access_token:
         headers["Authorization"] = f"Bearer {access_token}"
 
@@ -98,56 +369,324 @@ def build_headers(url: Optional[str] = None) -> dict[str, str]:
     return headers
 
 
-async def make_st_request(url: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any] | None:
-    headers = build_headers(url)
+# Callbacks (sync or async) run by server_lifespan on shutdown, e.g. to flush indexes.
+_STARTUP_HOOKS: list[Callable[[], Any]] = []
+_SHUTDOWN_HOOKS: list[Callable[[], Any]] = []
 
-    async with httpx.AsyncClient(http2=True, follow_redirects=False) as client:
+
+def on_startup(hook: Callable[[], Any]) -> None:
+    if hook not in _STARTUP_HOOKS:
+        _STARTUP_HOOKS.append(hook)
+
+
+def on_shutdown(hook: Callable[[], Any]) -> None:
+    if hook not in _SHUTDOWN_HOOKS:
+        _SHUTDOWN_HOOKS.append(hook)
+
+
+@asynccontextmanager
+async def server_lifespan(server: Any) -> AsyncIterator[dict[str, Any]]:
+    """FastMCP lifespan that runs startup hooks, then shutdown hooks, stops token refreshes and releases pooled connections."""
+
+    for hook in _STARTUP_HOOKS:
         try:
-            response = await client.get(url, headers=headers, params=params, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
+            result = hook()
+            if asyncio.iscoroutine(result):
+                await result
         except Exception:
-            LOGGER.error("GET %s failed", url, exc_info=True)
-            return None
+            LOGGER.warning("Startup hook %r failed", hook, exc_info=True)
+    try:
+        yield {}
+    finally:
+        for hook in reversed(_SHUTDOWN_HOOKS):
+            try:
+                result = hook()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                LOGGER.warning("Shutdown hook %r failed", hook, exc_info=True)
+        _cancel_token_refreshes()
+        await close_http_clients()
 
 
-async def make_st_post(url: str, json_body: Any | None = None, params: Optional[dict[str, Any]] = None) -> dict[str, Any] | None:
-    headers = build_headers(url)
+def _rate_overrides() -> dict[str, tuple[float, float]]:
+    overrides: dict[str, tuple[float, float]] = {}
+    for item in os.environ.get("SERVICETITAN_MCP_RATE_LIMIT_OVERRIDES", "").split(","):
+        key, _, value = item.partition("=")
+        if key.strip() and value.strip():
+            try:
+                overrides[key.strip().lower()] = parse_rate(value.strip())
+            except ValueError:
+                LOGGER.warning("Ignoring invalid rate limit override %r", item)
+    return overrides
+
+
+def _default_rate() -> tuple[float, float]:
+    try:
+        return parse_rate(os.environ.get("SERVICETITAN_MCP_RATE_LIMIT", "20/40"))
+    except ValueError:
+        return 20.0, 40.0
+
+
+# Client-side quota: a token bucket per (environment, tenant) plus a global cap on
+# requests in flight. Bulk work (page scans, export drains) yields to interactive calls.
+SCHEDULER = RequestScheduler(
+    *_default_rate(),
+    max_concurrency=_env_int("SERVICETITAN_MCP_MAX_CONCURRENCY", 16),
+    overrides=_rate_overrides(),
+)
+
+
+# Retry policy shared by every make_st_* helper. Idempotent requests are retried on
+# 429, 502-504 and transport errors; other requests only on 429 and failed connects,
+# where the server never processed them. Retries draw from a budget refilled by a
+# fraction of first attempts, so a struggling API does not see amplified load.
+RETRY_MAX_ATTEMPTS = _env_int("SERVICETITAN_MCP_RETRY_MAX_ATTEMPTS", 4)
+RETRY_BASE_DELAY = _env_float("SERVICETITAN_MCP_RETRY_BASE_DELAY", 0.5)
+RETRY_MAX_DELAY = _env_float("SERVICETITAN_MCP_RETRY_MAX_DELAY", 30.0)
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# POST endpoints that only read data.
+_READ_ONLY_POSTS = (
+    re.compile(r"/reporting/v2/tenant/[^/]+/report-category/[^/]+/reports/[^/]+/data$"),
+    re.compile(r"/dispatch/v2/tenant/[^/]+/capacity$"),
+)
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def is_idempotent(method: str, url: str) -> bool:
+    method = method.upper()
+    if method in _IDEMPOTENT_METHODS:
+        return True
+    path = httpx.URL(url).path
+    return method == "POST" and any(pattern.search(path) for pattern in _READ_ONLY_POSTS)
+
+
+class RetryBudget:
+    """Token bucket: each first attempt adds ``ratio`` tokens, each retry spends one."""
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0) -> None:
+        self.ratio = ratio
+        self.reserve = reserve
+        self.tokens = reserve
+
+    def deposit(self) -> None:
+        self.tokens = min(self.reserve, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+RETRY_BUDGET = RetryBudget(
+    ratio=_env_float("SERVICETITAN_MCP_RETRY_BUDGET_RATIO", 0.2),
+    reserve=_env_float("SERVICETITAN_MCP_RETRY_BUDGET_RESERVE", 10.0),
+)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+async def _wait_before_retry(method: str, url: str, attempt: int, reason: str, retry_after: Optional[float]) -> bool:
+    """Sleep before the next attempt; False when the request should fail instead."""
+
+    if attempt >= RETRY_MAX_ATTEMPTS:
+        metrics.increment("retry.gave_up")
+        return False
+    if retry_after is not None and retry_after > RETRY_MAX_DELAY:
+        metrics.increment("retry.gave_up")
+        return False
+    if not RETRY_BUDGET.withdraw():
+        metrics.increment("retry.budget_exhausted")
+        return False
+    # Full jitter; a server-provided Retry-After wins.
+    delay = retry_after if retry_after is not None else random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1)))
+    LOGGER.warning("%s %s: %s, retry %s in %.2fs", method, url, reason, attempt, delay)
+    metrics.increment("retry.attempts")
+    metrics.increment(f"retry.reason.{reason}")
+    metrics.increment("retry.wait_seconds", delay)
+    await asyncio.sleep(delay)
+    return True
+
+
+async def _send(
+    method: str,
+    url: str,
+    *,
+    params: Optional[dict[str, Any]] = None,
+    json_body: Any | None = None,
+    files: Any | None = None,
+    headers: Optional[dict[str, str]] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    idempotent: Optional[bool] = None,
+    stream: bool = False,
+) -> httpx.Response:
+    """Send one request under the scheduler and retry policy.
 
-    async with httpx.AsyncClient(http2=True, follow_redirects=False) as client:
+    With ``stream=True`` the body is left unread; the caller must close the response.
+    """
+
+    client = get_http_client(url)
+    if idempotent is None:
+        idempotent = is_idempotent(method, url)
+    RETRY_BUDGET.deposit()
+
+    scope = url_scope(url)
+    env_key = _resolve_env_key_from_url(url)
+    tenant = scope[1] if scope else None
+
+    attempt = 0
+    while True:
+        attempt += 1
+        error: Optional[httpx.TransportError] = None
+        await SCHEDULER.acquire(env_key, tenant)
         try:
-            response = await client.post(url, headers=headers, params=params, json=json_body, timeout=30.0)
-            response.raise_for_status()
-            return response.json() if response.content else {"status": response.status_code}
-        except Exception:
-            LOGGER.error("POST %s failed", url, exc_info=True)
-            return None
+            request = client.build_request(
+                method, url, headers=headers, params=params, json=json_body, files=files, timeout=timeout
+            )
+            response = await client.send(request, stream=stream)
+        except httpx.TransportError as exc:
+            error = exc
+        finally:
+            SCHEDULER.release()
+
+        if error is not None:
+            if not (idempotent or isinstance(error, _UNSENT_ERRORS)):
+                raise error
+            if not await _wait_before_retry(method, url, attempt, type(error).__name__, None):
+                raise error
+            continue
+
+        status = response.status_code
+        if response.is_error:
+            await response.aclose()
+        if status in RETRYABLE_STATUSES and (idempotent or status == 429):
+            if await _wait_before_retry(method, url, attempt, str(status), _retry_after(response)):
+                continue
+        response.raise_for_status()
+        return response
+
+
+# Identical GETs already in flight: (method, url, params) -> shared task. The URL
+# carries host and tenant, so callers only ever join requests for the same tenant.
+_INFLIGHT_GETS: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+COALESCE_GETS = _env_flag("SERVICETITAN_MCP_COALESCE")
+
+
+def _invalidate(url: str) -> None:
+    """Forget cached and in-flight GETs for the tenant/family that ``url`` writes to."""
+
+    RESPONSE_CACHE.invalidate(url)
+    scope = url_scope(url)
+    if scope is not None:
+        for key in [k for k in _INFLIGHT_GETS if url_scope(k[1]) == scope]:
+            del _INFLIGHT_GETS[key]
+
+
+def _forget_inflight(key: tuple[Any, ...], task: asyncio.Task[Any]) -> None:
+    # A write may already have detached this task and a newer one may own the key.
+    if _INFLIGHT_GETS.get(key) is task:
+        del _INFLIGHT_GETS[key]
+
+
+async def _get_json(url: str, params: Optional[dict[str, Any]]) -> tuple[bytes, Any] | None:
+    """GET ``url``; returns the raw body and its parsed JSON, or None on failure."""
+
+    generation = RESPONSE_CACHE.generation(url)
+    headers = await build_headers(url)
+
+    try:
+        response = await _send("GET", url, headers=headers, params=params)
+        data = response.json()
+    except Exception:
+        LOGGER.error("GET %s failed", url, exc_info=True)
+        return None
+
+    RESPONSE_CACHE.put(url, params, response.content, generation)
+    return response.content, data
+
+
+async def make_st_request(url: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any] | None:
+    cached = RESPONSE_CACHE.get(url, params)
+    if cached is not None:
+        return _loads(cached)
+
+    if not COALESCE_GETS:
+        result = await _get_json(url, params)
+        return result[1] if result is not None else None
+
+    key = ("GET", url, params_key(params))
+    task = _INFLIGHT_GETS.get(key)
+    owner = task is None
+    if task is None:
+        task = asyncio.ensure_future(_get_json(url, params))
+        _INFLIGHT_GETS[key] = task
+        task.add_done_callback(lambda done: _forget_inflight(key, done))
+        metrics.increment("coalesce.upstream")
+    else:
+        metrics.increment("coalesce.joined")
+    # Shielded so one caller being cancelled does not fail the others sharing the call.
+    result = await asyncio.shield(task)
+    if result is None:
+        return None
+    # The caller that started the request keeps the parsed body; joiners parse their own
+    # copy of the raw bytes, so no two callers share (and can mutate) one object.
+    body, data = result
+    return data if owner else _loads(body)
+
+
+async def make_st_post(url: str, json_body: Any | None = None, params: Optional[dict[str, Any]] = None) -> dict[str, Any] | None:
+    headers = await build_headers(url)
+
+    try:
+        response = await _send("POST", url, headers=headers, params=params, json_body=json_body)
+        return response.json() if response.content else {"status": response.status_code}
+    except Exception:
+        LOGGER.error("POST %s failed", url, exc_info=True)
+        return None
+    finally:
+        # Read-only POSTs (report data, capacity) leave cached GETs valid.
+        if not is_idempotent("POST", url):
+            _invalidate(url)
 
 
 async def make_st_patch(url: str, json_body: Any | None = None, params: Optional[dict[str, Any]] = None) -> dict[str, Any] | None:
-    headers = build_headers(url)
+    headers = await build_headers(url)
 
-    async with httpx.AsyncClient(http2=True, follow_redirects=False) as client:
-        try:
-            response = await client.patch(url, headers=headers, params=params, json=json_body, timeout=30.0)
-            response.raise_for_status()
-            return response.json() if response.content else {"status": response.status_code}
-        except Exception:
-            LOGGER.error("PATCH %s failed", url, exc_info=True)
-            return None
+    try:
+        response = await _send("PATCH", url, headers=headers, params=params, json_body=json_body)
+        return response.json() if response.content else {"status": response.status_code}
+    except Exception:
+        LOGGER.error("PATCH %s failed", url, exc_info=True)
+        return None
+    finally:
+        _invalidate(url)
 
 
 async def make_st_put(url: str, json_body: Any | None = None, params: Optional[dict[str, Any]] = None) -> dict[str, Any] | None:
-    headers = build_headers(url)
+    headers = await build_headers(url)
 
-    async with httpx.AsyncClient(http2=True, follow_redirects=False) as client:
-        try:
-            response = await client.put(url, headers=headers, params=params, json=json_body, timeout=30.0)
-            response.raise_for_status()
-            return response.json() if response.content else {"status": response.status_code}
-        except Exception:
-            LOGGER.error("PUT %s failed", url, exc_info=True)
-            return None
+    try:
+        response = await _send("PUT", url, headers=headers, params=params, json_body=json_body)
+        return response.json() if response.content else {"status": response.status_code}
+    except Exception:
+        LOGGER.error("PUT %s failed", url, exc_info=True)
+        return None
+    finally:
+        _invalidate(url)
 
 
 async def make_st_delete(
@@ -155,32 +694,471 @@ async def make_st_delete(
     params: Optional[dict[str, Any]] = None,
     json_body: Any | None = None,
 ) -> dict[str, Any] | None:
-    headers = build_headers(url)
+    headers = await build_headers(url)
 
-    async with httpx.AsyncClient(http2=True, follow_redirects=False) as client:
-        try:
-            response = await client.delete(
-                url, headers=headers, params=params, json=json_body, timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json() if response.content else {"status": response.status_code}
-        except Exception:
-            LOGGER.error("DELETE %s failed", url, exc_info=True)
-            return None
+    try:
+        response = await _send("DELETE", url, headers=headers, params=params, json_body=json_body)
+        return response.json() if response.content else {"status": response.status_code}
+    except Exception:
+        LOGGER.error("DELETE %s failed", url, exc_info=True)
+        return None
+    finally:
+        _invalidate(url)
 
 
 async def make_st_get_bytes(url: str, params: Optional[dict[str, Any]] = None) -> bytes | None:
-    headers = build_headers(url)
+    headers = await build_headers(url)
     # Override Accept for binary endpoints
     headers["Accept"] = "application/octet-stream"
 
-    async with httpx.AsyncClient(http2=True, follow_redirects=False) as client:
-        try:
-            response = await client.get(url, headers=headers, params=params, timeout=60.0)
-            response.raise_for_status()
-            return response.content
-        except Exception:
-            LOGGER.error("GET(bytes) %s failed", url, exc_info=True)
-            return None
+    try:
+        response = await _send("GET", url, headers=headers, params=params, timeout=60.0)
+        return response.content
+    except Exception:
+        LOGGER.error("GET(bytes) %s failed", url, exc_info=True)
+        return None
+
+
+UPLOAD_CONCURRENCY = _env_int("SERVICETITAN_MCP_UPLOAD_CONCURRENCY", 4)
+
+
+async def make_st_upload(
+    url: str,
+    path: str | Path,
+    field: str = "file",
+    params: Optional[dict[str, Any]] = None,
+) -> dict[str, Any] | None:
+    """POST a local file as ``multipart/form-data``, streamed from disk in chunks.
+
+    The file is never read into memory as a whole; httpx rewinds it if the request
+    has to be retried.
+    """
+
+    path = Path(path)
+    headers = await build_headers(url)
+    headers.pop("Content-Type", None)  # httpx sets the multipart boundary
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
 
+    try:
+        with path.open("rb") as fh:
+            response = await _send(
+                "POST", url, headers=headers, params=params, files={field: (path.name, fh, content_type)}, timeout=120.0
+            )
+        return response.json() if response.content else {"status": response.status_code}
+    except Exception:
+        LOGGER.error("POST(upload) %s failed", url, exc_info=True)
+        return None
+    finally:
+        _invalidate(url)
+
+
+def collect_upload_paths(directory: str, pattern: str = "*") -> Optional[list[Path]]:
+    """Regular files in ``directory`` matching ``pattern`` (sorted); None if not a directory."""
+
+    root = Path(directory).expanduser()
+    if not root.is_dir():
+        return None
+    return sorted(p for p in root.glob(pattern or "*") if p.is_file())
+
+
+async def upload_files(
+    url: str,
+    paths: list[Path],
+    field: str = "file",
+    concurrency: int = UPLOAD_CONCURRENCY,
+) -> dict[str, Any]:
+    """Upload many files to one endpoint with bounded parallelism.
+
+    Returns ``{uploaded: {file name: response}, failed: [file names]}``.
+    """
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def upload(path: Path) -> Any:
+        async with semaphore:
+            return await make_st_upload(url, path, field=field)
+
+    results = await asyncio.gather(*(upload(path) for path in paths))
+    return {
+        "uploaded": {path.name: result for path, result in zip(paths, results) if result},
+        "failed": [path.name for path, result in zip(paths, results) if not result],
+    }
+
+
+# Downloads are streamed into a content-addressed spool: <state dir>/spool/<sha[:2]>/<sha256>.
+SPOOL_CHUNK_SIZE = 64 * 1024
+SPOOL_URI_PREFIX = "servicetitan://spool/"
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def get_spool_path(sha256: str) -> Optional[Path]:
+    """Path of a spooled file by hash, or None if the hash is malformed or unknown."""
+
+    if not _SHA256_RE.match(sha256 or ""):
+        return None
+    path = get_state_dir("spool", sha256[:2]) / sha256
+    return path if path.is_file() else None
+
+
+def spool_file(tmp: str | Path) -> dict[str, Any]:
+    """Move a finished temp file (created in the spool dir) to its content address."""
+
+    digest = hashlib.sha256()
+    with open(tmp, "rb") as fh:
+        for chunk in iter(lambda: fh.read(SPOOL_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    sha256 = digest.hexdigest()
+    target = get_state_dir("spool", sha256[:2]) / sha256
+    os.replace(tmp, target)
+    return {"path": str(target), "uri": SPOOL_URI_PREFIX + sha256, "sha256": sha256, "bytes": target.stat().st_size}
+
+
+async def download_to_spool(url: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any] | None:
+    """Stream a binary GET to the spool without holding the body in memory.
+
+    Returns ``{path, uri, sha256, bytes, contentType}``; identical content lands on the
+    same file. None on failure.
+    """
+
+    headers = await build_headers(url)
+    headers["Accept"] = "application/octet-stream"
+
+    try:
+        response = await _send("GET", url, headers=headers, params=params, timeout=60.0, stream=True)
+    except Exception:
+        LOGGER.error("GET(stream) %s failed", url, exc_info=True)
+        return None
+
+    spool = get_state_dir("spool")
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp = tempfile.mkstemp(dir=spool, suffix=".part")
+    complete = False
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            async for chunk in response.aiter_bytes(SPOOL_CHUNK_SIZE):
+                fh.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        complete = True
+    except Exception:
+        LOGGER.error("GET(stream) %s failed while reading the body", url, exc_info=True)
+        return None
+    finally:
+        # Also reached on cancellation, which is not an Exception.
+        if not complete:
+            Path(tmp).unlink(missing_ok=True)
+        await response.aclose()
 
+    sha256 = digest.hexdigest()
+    target = get_state_dir("spool", sha256[:2]) / sha256
+    os.replace(tmp, target)
+    metrics.increment("spool.downloads")
+    metrics.increment("spool.bytes", size)
+    return {
+        "path": str(target),
+        "uri": SPOOL_URI_PREFIX + sha256,
+        "sha256": sha256,
+        "bytes": size,
+        "contentType": response.headers.get("content-type"),
+    }
+
+
+ALL_PAGES_PAGE_SIZE = 500
+ALL_PAGES_PREFETCH = _env_int("SERVICETITAN_MCP_PAGE_PREFETCH", 4)
+
+
+async def fetch_all_pages(
+    url: str,
+    params: Optional[dict[str, Any]] = None,
+    *,
+    max_items: Optional[int] = None,
+    prefetch: int = ALL_PAGES_PREFETCH,
+) -> dict[str, Any] | None:
+    """Follow ``page``/``hasMore`` server-side and merge every page's ``data``.
+
+    At most ``prefetch`` upcoming pages are in flight at once; pages are consumed in
+    order so the merged ``data`` keeps the API ordering. Stops once ``hasMore`` is
+    false or ``max_items`` records were collected. If a later page fails, the pages
+    gathered so far are returned with ``hasMore`` and ``nextPage`` set for resuming.
+    """
+
+    if max_items is not None and max_items < 1:
+        max_items = None
+
+    base_params = dict(params or {})
+    first_page = int(base_params.pop("page", None) or 1)
+    page_size = int(base_params.pop("pageSize", None) or 0)
+    if page_size < 1:
+        page_size = min(max_items or ALL_PAGES_PAGE_SIZE, ALL_PAGES_PAGE_SIZE)
+    include_total = bool(base_params.pop("includeTotal", False))
+
+    async def fetch(page: int) -> Any:
+        page_params = {**base_params, "page": page, "pageSize": page_size}
+        if include_total and page == first_page:
+            page_params["includeTotal"] = True
+        with request_priority(BULK):
+            return await make_st_request(url, params=page_params)
+
+    first = await fetch(first_page)
+    if not first:
+        return first
+
+    items: list[Any] = list(first.get("data") or [])
+    has_more = bool(first.get("hasMore"))
+    next_page = first_page + 1
+    pages_fetched = 1
+    failed = False
+    pending: dict[int, asyncio.Task[Any]] = {}
+    window = max(prefetch, 1)
+
+    try:
+        while has_more and (max_items is None or len(items) < max_items):
+            lookahead = window
+            if max_items is not None:
+                lookahead = min(window, -(-(max_items - len(items)) // page_size))
+            for page in range(next_page, next_page + max(lookahead, 1)):
+                if page not in pending:
+                    pending[page] = asyncio.create_task(fetch(page))
+
+            data = await pending.pop(next_page)
+            if not data:
+                LOGGER.warning("Stopped paging %s at page %s", url, next_page)
+                failed = True
+                break
+            pages_fetched += 1
+            items.extend(data.get("data") or [])
+            has_more = bool(data.get("hasMore"))
+            next_page += 1
+    finally:
+        for task in pending.values():
+            task.cancel()
+
+    truncated = max_items is not None and len(items) > max_items
+    if truncated:
+        items = items[:max_items]
+
+    result: dict[str, Any] = {
+        "page": first_page,
+        "pageSize": page_size,
+        "pagesFetched": pages_fetched,
+        "hasMore": has_more or truncated,
+    }
+    if (has_more or failed) and not truncated:
+        result["nextPage"] = next_page
+    if "totalCount" in first:
+        result["totalCount"] = first["totalCount"]
+    result["data"] = items
+    return result
+
+
+# Chunking for "get many by id": ids per request (also the page size) and a cap on the
+# length of the ids query value so URLs stay well under common 2-8 KB limits.
+GET_MANY_CHUNK_SIZE = 50
+GET_MANY_MAX_IDS_CHARS = 1500
+GET_MANY_CONCURRENCY = _env_int("SERVICETITAN_MCP_GET_MANY_CONCURRENCY", 4)
+
+
+def parse_id_list(ids: Optional[str]) -> Optional[list[int]]:
+    """Parse a comma-separated id list, dropping duplicates; None if empty or invalid."""
+
+    try:
+        parsed = [int(part) for part in (ids or "").split(",") if part.strip()]
+    except ValueError:
+        return None
+    return list(dict.fromkeys(parsed)) or None
+
+
+def _chunk_ids(ids: list[int], chunk_size: int, max_chars: int) -> list[list[int]]:
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    length = 0
+    for id_ in ids:
+        width = len(str(id_)) + 1
+        if current and (len(current) >= chunk_size or length + width > max_chars):
+            chunks.append(current)
+            current, length = [], 0
+        current.append(id_)
+        length += width
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def fetch_many_by_ids(
+    url: str,
+    ids: list[int],
+    params: Optional[dict[str, Any]] = None,
+    *,
+    chunk_size: int = GET_MANY_CHUNK_SIZE,
+    concurrency: int = GET_MANY_CONCURRENCY,
+) -> dict[str, Any] | None:
+    """Fetch records by id through a list endpoint's ``ids`` filter.
+
+    Ids are split into chunks bounded by ``chunk_size`` and URL length and fetched
+    ``concurrency`` at a time. Returns ``{requested, found, data, missing, failed}``
+    where ``data`` maps id -> record in request order, ``missing`` lists ids the API
+    did not return and ``failed`` lists ids whose chunk request failed. None if
+    every chunk failed.
+    """
+
+    chunks = _chunk_ids(ids, max(chunk_size, 1), GET_MANY_MAX_IDS_CHARS)
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def fetch(chunk: list[int]) -> Any:
+        chunk_params = {**(params or {}), "ids": ",".join(map(str, chunk)), "page": 1, "pageSize": len(chunk)}
+        async with semaphore:
+            return await make_st_request(url, params=chunk_params)
+
+    results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+
+    records: dict[int, Any] = {}
+    failed: list[int] = []
+    for chunk, data in zip(chunks, results):
+        if not data:
+            failed.extend(chunk)
+            continue
+        for record in data.get("data") or []:
+            if isinstance(record, dict) and record.get("id") is not None:
+                records[int(record["id"])] = record
+    if failed and len(failed) == len(ids):
+        return None
+
+    failed_set = set(failed)
+    return {
+        "requested": len(ids),
+        "found": sum(1 for id_ in ids if id_ in records),
+        "data": {str(id_): records[id_] for id_ in ids if id_ in records},
+        "missing": [id_ for id_ in ids if id_ not in records and id_ not in failed_set],
+        "failed": failed,
+    }
+
+
+_EXPORT_TOKENS_FILE = "export_tokens.json"
+# Serializes the read-modify-write of the token file between concurrent drains.
+_EXPORT_TOKENS_LOCK = asyncio.Lock()
+
+
+def _export_token_key(url: str, params: Optional[dict[str, Any]]) -> str:
+    # Drains of one feed with different params (e.g. includeRecentChanges) keep separate tokens.
+    key = params_key({k: v for k, v in (params or {}).items() if k != "from"})
+    return f"{url} {json.dumps(key)}" if key else url
+
+
+def load_export_token(url: str, params: Optional[dict[str, Any]] = None) -> Optional[str]:
+    """Return the ``continueFrom`` token saved by the last drain of ``url`` with ``params``."""
+
+    path = get_state_dir() / _EXPORT_TOKENS_FILE
+    try:
+        tokens = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    entry = tokens.get(_export_token_key(url, params)) or {}
+    return entry.get("continueFrom")
+
+
+def save_export_token(url: str, token: Optional[str], params: Optional[dict[str, Any]] = None) -> None:
+    if not token:
+        return
+    path = get_state_dir() / _EXPORT_TOKENS_FILE
+    try:
+        tokens = json.loads(path.read_text())
+    except (OSError, ValueError):
+        tokens = {}
+    tokens[_export_token_key(url, params)] = {"continueFrom": token, "savedAt": time.time()}
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".export_tokens-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(json.dumps(tokens))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+async def iter_export_chunks(
+    url: str,
+    params: Optional[dict[str, Any]] = None,
+    *,
+    from_token: Optional[str] = None,
+    max_chunks: Optional[int] = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield export chunks, following ``continueFrom`` until ``hasMore`` is false.
+
+    The request for the next chunk is issued before the current one is yielded, so
+    the network round trip overlaps with whatever the consumer does with the chunk.
+    Iteration stops silently on a failed request; consumers can tell a complete feed
+    from a partial one by the last chunk's ``hasMore``.
+    """
+
+    base_params = {k: v for k, v in (params or {}).items() if k != "from"}
+
+    async def fetch(token: Optional[str]) -> Any:
+        chunk_params = dict(base_params)
+        if token:
+            chunk_params["from"] = token
+        with request_priority(BULK):
+            return await make_st_request(url, params=chunk_params or None)
+
+    next_chunk: asyncio.Task[Any] = asyncio.create_task(fetch(from_token))
+    chunks = 0
+    try:
+        while True:
+            data = await next_chunk
+            if not data:
+                LOGGER.warning("Export feed %s stopped after %s chunk(s)", url, chunks)
+                return
+            chunks += 1
+            has_more = bool(data.get("hasMore")) and (max_chunks is None or chunks < max_chunks)
+            if has_more:
+                next_chunk = asyncio.create_task(fetch(data.get("continueFrom")))
+            yield data
+            if not has_more:
+                return
+    finally:
+        if not next_chunk.done():
+            next_chunk.cancel()
+
+
+async def drain_export(
+    url: str,
+    params: Optional[dict[str, Any]] = None,
+    *,
+    max_items: Optional[int] = None,
+    resume: bool = False,
+) -> dict[str, Any] | None:
+    """Drain an export feed into one merged result.
+
+    Starts from ``params["from"]``, or from the saved token when ``resume`` is set,
+    and stops at the end of the feed or after the chunk that reaches ``max_items``
+    (chunks are never split, so the returned ``continueFrom`` stays exact). The last
+    token is persisted per ``url`` and ``params`` after every chunk so a later drain
+    with the same params can resume incrementally.
+    """
+
+    params = dict(params or {})
+    token = params.pop("from", None)
+    if token is None and resume:
+        token = await asyncio.to_thread(load_export_token, url, params)
+
+    items: list[Any] = []
+    last: dict[str, Any] | None = None
+    chunks = 0
+    async with aclosing(iter_export_chunks(url, params, from_token=token)) as feed:
+        async for chunk in feed:
+            last = chunk
+            chunks += 1
+            items.extend(chunk.get("data") or [])
+            async with _EXPORT_TOKENS_LOCK:
+                await asyncio.to_thread(save_export_token, url, chunk.get("continueFrom"), params)
+            if max_items is not None and len(items) >= max_items:
+                break
+
+    if last is None:
+        return None
+    return {
+        "chunksFetched": chunks,
+        "hasMore": bool(last.get("hasMore")),
+        "continueFrom": last.get("continueFrom"),
+        "data": items,
+    }